@@ -0,0 +1,216 @@
+"""Adaptive concurrency for batch processing.
+
+With ``batch_size`` set to "auto", the number of concurrent deface processes
+is chosen at runtime instead of guessed up front. It starts from the CPU
+count and free memory, then hill-climbs on aggregate throughput (frames per
+second across all running jobs): while adding a process speeds the batch up
+it keeps adding, when throughput drops it steps back, and it backs off
+whenever the system is overloaded or short on memory.
+"""
+
+import logging
+import os
+import time
+from typing import Callable, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# Value of the batch_size setting that enables adaptive concurrency
+AUTO_BATCH_SIZE = "auto"
+
+# Upper bound on concurrent jobs in auto mode
+MAX_AUTO_CONCURRENCY = 8
+
+# CPU cores assumed to be used by one deface process (ONNX inference is
+# itself multi-threaded)
+CORES_PER_JOB = 4
+
+# Memory assumed to be used by one deface process, and memory left free
+MEMORY_PER_JOB = 1536 * 1024 * 1024
+MEMORY_RESERVE = 1024 * 1024 * 1024
+
+# Seconds of throughput measured before each adjustment
+TUNE_INTERVAL = 15.0
+
+# Relative throughput change treated as a real improvement or regression
+THROUGHPUT_TOLERANCE = 0.05
+
+# 1-minute load average per core above which concurrency is reduced
+MAX_LOAD_PER_CORE = 1.5
+
+
+def is_auto_batch_size(batch_size) -> bool:
+    """Check whether a batch_size setting selects adaptive concurrency."""
+    return isinstance(batch_size, str) and batch_size.strip().lower() == AUTO_BATCH_SIZE
+
+
+def available_memory() -> Optional[int]:
+    """Get the memory available to new processes in bytes, or None if unknown."""
+    if psutil is not None:
+        return int(psutil.virtual_memory().available)
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def load_per_core() -> Optional[float]:
+    """Get the 1-minute load average per CPU core, or None if unknown."""
+    try:
+        load = os.getloadavg()[0]
+    except (AttributeError, OSError):
+        if psutil is None or not hasattr(psutil, "getloadavg"):
+            return None
+        load = psutil.getloadavg()[0]
+    return load / (os.cpu_count() or 1)
+
+
+def memory_headroom(available: Optional[int]) -> Optional[int]:
+    """Get how many more jobs fit in the available memory, or None if unknown.
+
+    Negative when less than MEMORY_RESERVE is available.
+    """
+    if available is None:
+        return None
+    return (available - MEMORY_RESERVE) // MEMORY_PER_JOB
+
+
+def memory_job_limit(available: Optional[int]) -> Optional[int]:
+    """Get how many jobs fit in the available memory, or None if unknown."""
+    headroom = memory_headroom(available)
+    return max(1, headroom) if headroom is not None else None
+
+
+def initial_concurrency(cpu_count: int, available: Optional[int], max_concurrency: int) -> int:
+    """Choose the starting concurrency from CPU count and free memory.
+
+    Args:
+        cpu_count: Number of CPU cores.
+        available: Available memory in bytes, or None if unknown.
+        max_concurrency: Upper bound on concurrent jobs.
+
+    Returns:
+        Number of jobs to start with.
+    """
+    concurrency = max(1, cpu_count // CORES_PER_JOB)
+    memory_limit = memory_job_limit(available)
+    if memory_limit is not None:
+        concurrency = min(concurrency, memory_limit)
+    return max(1, min(concurrency, max_concurrency))
+
+
+class AdaptiveConcurrency:
+    """Hill-climbing controller for the number of concurrent jobs.
+
+    Feed it the cumulative number of frames processed with observe(); every
+    TUNE_INTERVAL seconds it compares the throughput of the last window with
+    the previous one and returns a new concurrency when it decides to change.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_AUTO_CONCURRENCY,
+        interval: float = TUNE_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+        memory_probe: Callable[[], Optional[int]] = available_memory,
+        load_probe: Callable[[], Optional[float]] = load_per_core,
+    ):
+        """Initialize the controller.
+
+        Args:
+            max_concurrency: Upper bound on concurrent jobs.
+            interval: Seconds of throughput measured before each adjustment.
+            clock: Monotonic clock.
+            memory_probe: Returns available memory in bytes (or None).
+            load_probe: Returns the load average per core (or None).
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.interval = interval
+        self._clock = clock
+        self._memory_probe = memory_probe
+        self._load_probe = load_probe
+
+        self.concurrency = initial_concurrency(os.cpu_count() or 1, memory_probe(), self.max_concurrency)
+        self.throughput = 0.0  # Frames per second over the last window
+        self._direction = 1
+        self._last_throughput: Optional[float] = None
+        self._window_start: Optional[float] = None
+        self._window_frames = 0
+        logger.info(f"Adaptive concurrency starting at {self.concurrency} (max {self.max_concurrency})")
+
+    def observe(self, frames_done: int) -> Optional[int]:
+        """Record progress and adjust the concurrency at the end of each window.
+
+        Args:
+            frames_done: Cumulative number of frames processed by the batch.
+
+        Returns:
+            The new concurrency if it changed, otherwise None.
+        """
+        now = self._clock()
+        if self._window_start is None:
+            self._window_start = now
+            self._window_frames = frames_done
+            return None
+
+        elapsed = now - self._window_start
+        if elapsed < self.interval:
+            return None
+
+        self.throughput = (frames_done - self._window_frames) / elapsed
+        self._window_start = now
+        self._window_frames = frames_done
+
+        new = self._next_concurrency(self.throughput)
+        self._last_throughput = self.throughput
+        if new == self.concurrency:
+            return None
+
+        logger.info(
+            f"Adaptive concurrency {self.concurrency} -> {new} "
+            f"({self.throughput:.1f} frames/s)"
+        )
+        self.concurrency = new
+        return new
+
+    def _next_concurrency(self, throughput: float) -> int:
+        """Decide the concurrency for the next window."""
+        current = self.concurrency
+        # Available memory already excludes the running jobs, so this is how
+        # many jobs can be added
+        headroom = memory_headroom(self._memory_probe())
+        load = self._load_probe()
+
+        if (load is not None and load > MAX_LOAD_PER_CORE) or (
+            headroom is not None and headroom < 0
+        ):
+            # Overloaded: back off regardless of throughput
+            self._direction = -1
+            return max(1, current - 1)
+
+        last = self._last_throughput
+        if last is None:
+            pass  # First window: probe upwards
+        elif throughput > last * (1 + THROUGHPUT_TOLERANCE):
+            pass  # The last step helped: keep going the same way
+        elif throughput < last * (1 - THROUGHPUT_TOLERANCE):
+            self._direction = -self._direction  # The last step hurt: undo it
+        else:
+            return current  # Plateau: hold
+
+        new = current + self._direction
+        if headroom is not None:
+            new = min(new, current + headroom)
+        return max(1, min(new, self.max_concurrency))
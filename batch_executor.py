@@ -0,0 +1,177 @@
+"""Event-driven job executor for batch processing.
+
+Jobs run on a fixed pool of worker threads. Instead of a scheduler loop that
+polls for finished jobs, every job's future has a completion callback that
+immediately dispatches the next pending job, so a slot never sits idle
+between jobs and worker threads are reused across the whole batch.
+"""
+
+import functools
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Generic, Iterable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BatchExecutor(Generic[T]):
+    """Run jobs with bounded concurrency, dispatching on completion.
+
+    Callbacks are invoked on worker threads.
+    """
+
+    def __init__(
+        self,
+        run_job: Callable[[T], None],
+        concurrency: int,
+        on_job_done: Optional[Callable[[T, Optional[BaseException]], None]] = None,
+        on_finished: Optional[Callable[[], None]] = None,
+        max_concurrency: Optional[int] = None,
+        priority: Optional[Callable[[T], float]] = None,
+        thread_name_prefix: str = "batch",
+    ):
+        """Initialize the executor.
+
+        Args:
+            run_job: Function that processes one job.
+            concurrency: Maximum number of jobs running at once.
+            on_job_done: Called with the job and the exception it raised (or
+                None) when a job finishes.
+            on_finished: Called once when no jobs are running and none will be
+                dispatched (all jobs done, or stopped and drained).
+            max_concurrency: Upper bound for set_concurrency() (defaults to
+                ``concurrency``); sizes the worker pool.
+            priority: If given, each free slot takes the pending job with the
+                highest priority (evaluated at dispatch time, so priorities
+                may change while jobs wait); otherwise jobs run in order.
+            thread_name_prefix: Prefix for worker thread names.
+        """
+        self._run_job = run_job
+        self._max_concurrency = max(1, max_concurrency or concurrency)
+        self._concurrency = max(1, min(concurrency, self._max_concurrency))
+        self._on_job_done = on_job_done
+        self._on_finished = on_finished
+        self._priority = priority
+        # Threads are created lazily, so a large bound costs nothing until used
+        self._pool = ThreadPoolExecutor(max_workers=self._max_concurrency, thread_name_prefix=thread_name_prefix)
+        self._pending: Deque[T] = deque()
+        self._lock = threading.Lock()
+        self._active = 0
+        self._started = False
+        self._stopped = False
+        self._finished = threading.Event()
+
+    @property
+    def concurrency(self) -> int:
+        """Maximum number of jobs running at once."""
+        return self._concurrency
+
+    def set_concurrency(self, concurrency: int):
+        """Change the maximum number of jobs running at once.
+
+        Raising it dispatches pending jobs immediately; lowering it lets
+        running jobs finish and dispatches no new ones until below the limit.
+
+        Args:
+            concurrency: New limit, clamped to ``[1, max_concurrency]``.
+        """
+        with self._lock:
+            self._concurrency = max(1, min(concurrency, self._max_concurrency))
+        self._dispatch()
+
+    @property
+    def active(self) -> int:
+        """Number of jobs currently running."""
+        with self._lock:
+            return self._active
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting to be dispatched."""
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def finished(self) -> bool:
+        """Whether all jobs are done (or the executor was stopped and drained)."""
+        return self._finished.is_set()
+
+    def start(self, jobs: Iterable[T]):
+        """Queue jobs and dispatch up to the concurrency limit.
+
+        Args:
+            jobs: Jobs to run, in dispatch order.
+        """
+        with self._lock:
+            if self._started:
+                raise RuntimeError("BatchExecutor can only be started once")
+            self._started = True
+            self._pending.extend(jobs)
+        self._dispatch()
+
+    def stop(self):
+        """Stop dispatching new jobs; running jobs are left to finish."""
+        with self._lock:
+            self._stopped = True
+            self._pending.clear()
+        self._dispatch()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the executor has finished.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever.
+
+        Returns:
+            True if the executor finished, False on timeout.
+        """
+        return self._finished.wait(timeout)
+
+    def _dispatch(self):
+        """Submit pending jobs up to the concurrency limit, or finish."""
+        to_submit = []
+        finished = False
+        with self._lock:
+            while self._pending and not self._stopped and self._active < self._concurrency:
+                to_submit.append(self._pop_next())
+                self._active += 1
+            if self._started and self._active == 0 and not self._pending and not self._finished.is_set():
+                self._finished.set()
+                finished = True
+
+        for job in to_submit:
+            future = self._pool.submit(self._run_job, job)
+            future.add_done_callback(functools.partial(self._job_done, job))
+
+        if finished:
+            self._pool.shutdown(wait=False)
+            if self._on_finished:
+                self._on_finished()
+
+    def _pop_next(self) -> T:
+        """Remove the next job to dispatch from the pending jobs (lock held)."""
+        if self._priority is None:
+            return self._pending.popleft()
+        priority = self._priority
+        best = max(range(len(self._pending)), key=lambda i: priority(self._pending[i]))
+        job = self._pending[best]
+        del self._pending[best]
+        return job
+
+    def _job_done(self, job: T, future: Future):
+        """Completion callback: report the job and dispatch the next one."""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Batch job failed: {error}", exc_info=error)
+        with self._lock:
+            self._active -= 1
+        if self._on_job_done:
+            try:
+                self._on_job_done(job, error)
+            except Exception as e:
+                logger.error(f"Error in batch job callback: {e}", exc_info=True)
+        self._dispatch()
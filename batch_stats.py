@@ -0,0 +1,204 @@
+"""Batch-level progress statistics.
+
+Aggregates what the per-file progress rows cannot show: the combined
+throughput of all concurrent jobs, how much work the queue has completed
+and has left (in frames, from the background media probes), an ETA for the
+whole queue, and how much of the machine's CPU the worker processes use.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds of progress averaged for the batch throughput
+THROUGHPUT_WINDOW = 30.0
+
+
+@dataclass
+class JobWork:
+    """Work of one queued file, in frames."""
+
+    status: str
+    total_frames: float  # Estimated until the file is probed
+    frames_done: int
+
+
+@dataclass
+class BatchSummary:
+    """Progress of a whole batch."""
+
+    completed_files: int
+    total_files: int
+    frames_done: float
+    frames_remaining: float
+    fps: float
+    eta: Optional[float]  # Seconds, or None while the throughput is unknown
+
+
+def summarize_batch(jobs: Iterable[JobWork], fps: float) -> BatchSummary:
+    """Summarize the progress of a batch.
+
+    Successful files count as done, pending and processing files count
+    towards the remaining work, and failed files count as neither.
+
+    Args:
+        jobs: Work of every queued file.
+        fps: Observed batch throughput in frames per second.
+
+    Returns:
+        The batch summary.
+    """
+    completed = total = 0
+    done = remaining = 0.0
+    for job in jobs:
+        total += 1
+        if job.status == "success":
+            completed += 1
+            done += max(job.total_frames, job.frames_done)
+        elif job.status in ("pending", "processing"):
+            done += job.frames_done
+            remaining += max(job.total_frames - job.frames_done, 0.0)
+
+    if remaining <= 0:
+        eta: Optional[float] = 0.0
+    elif fps > 0:
+        eta = remaining / fps
+    else:
+        eta = None
+    return BatchSummary(completed, total, done, remaining, fps, eta)
+
+
+class ThroughputMeter:
+    """Frames per second over a sliding window of cumulative progress."""
+
+    def __init__(self, window: float = THROUGHPUT_WINDOW, clock: Callable[[], float] = time.monotonic):
+        """Initialize the meter.
+
+        Args:
+            window: Seconds of progress averaged.
+            clock: Monotonic clock.
+        """
+        self.window = window
+        self._clock = clock
+        self._samples: Deque[Tuple[float, int]] = deque()
+        self.fps = 0.0
+
+    def reset(self):
+        """Forget all progress."""
+        self._samples.clear()
+        self.fps = 0.0
+
+    def update(self, frames_total: int) -> float:
+        """Record the cumulative number of frames processed.
+
+        Args:
+            frames_total: Frames processed by the batch so far.
+
+        Returns:
+            Frames per second over the window.
+        """
+        now = self._clock()
+        self._samples.append((now, frames_total))
+        # Keep one sample at or before the window start as the baseline
+        while len(self._samples) > 2 and now - self._samples[1][0] >= self.window:
+            self._samples.popleft()
+
+        start_time, start_frames = self._samples[0]
+        elapsed = now - start_time
+        self.fps = (frames_total - start_frames) / elapsed if elapsed > 0 else 0.0
+        return self.fps
+
+
+def process_cpu_seconds(pid: int) -> Optional[float]:
+    """Get the CPU time used by a process and its children, in seconds.
+
+    Uses psutil when installed, otherwise /proc (Linux only; children are not
+    included).
+
+    Returns:
+        CPU seconds, or None if the process is gone or unsupported.
+    """
+    if psutil is not None:
+        try:
+            proc = psutil.Process(pid)
+            seconds = float(sum(proc.cpu_times()[:2]))
+            for child in proc.children(recursive=True):
+                try:
+                    seconds += sum(child.cpu_times()[:2])
+                except psutil.Error:
+                    pass
+            return seconds
+        except psutil.Error:
+            return None
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        # utime and stime are fields 14 and 15 (the 12th and 13th after comm)
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class CpuMonitor:
+    """CPU utilisation of a changing set of worker processes."""
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        cpu_seconds: Callable[[int], Optional[float]] = process_cpu_seconds,
+        cpu_count: Optional[int] = None,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            clock: Monotonic clock.
+            cpu_seconds: Returns the CPU seconds used by a process (or None).
+            cpu_count: Number of CPU cores (defaults to os.cpu_count()).
+        """
+        self._clock = clock
+        self._cpu_seconds = cpu_seconds
+        self._cpu_count = cpu_count or os.cpu_count() or 1
+        self._last_time: Optional[float] = None
+        self._last_seconds: Dict[int, float] = {}
+
+    def sample(self, pids: Iterable[int]) -> Optional[float]:
+        """Measure utilisation since the previous sample.
+
+        Args:
+            pids: Worker processes currently running.
+
+        Returns:
+            Percent of the machine's total CPU capacity used by the processes
+            (0-100), or None on the first sample or if it cannot be measured.
+        """
+        now = self._clock()
+        pids = list(pids)
+        seconds: Dict[int, float] = {}
+        for pid in pids:
+            value = self._cpu_seconds(pid)
+            if value is not None:
+                seconds[pid] = value
+
+        used = sum(
+            max(value - self._last_seconds[pid], 0.0)
+            for pid, value in seconds.items()
+            if pid in self._last_seconds
+        )
+        elapsed = now - self._last_time if self._last_time is not None else 0.0
+        measurable = bool(seconds) or not pids
+        self._last_time = now
+        self._last_seconds = seconds
+
+        if elapsed <= 0 or not measurable:
+            return None
+        return min(100.0, 100.0 * used / (elapsed * self._cpu_count))
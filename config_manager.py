@@ -177,7 +177,10 @@ def get_default_config() -> Dict[str, Any]:
             "replacewith": "blur",
             "keep_audio": True,
             "keep_metadata": True,
-            "batch_size": 1,
+            "batch_size": 1,  # Or "auto" to adapt to the system
+            "job_timeout": 0,  # Minutes per attempt, 0 = no limit
+            "stall_timeout": 300,  # Seconds without progress before a job is killed, 0 = never
+            "max_retries": 2,  # Retries of failures that may be transient
         },
         "hugging_face_token": "",
         "output_directory": None,  # Will default to Desktop on first run
@@ -186,6 +189,9 @@ def get_default_config() -> Dict[str, Any]:
             "blur_sigma": 25,
             "cache_size": 100,
             "playback_speed": 1.0,
+            "smart_render": True,
+            "export_workers": 0,  # 0 = one worker process per CPU core
+            "encoder_preset": "balanced",  # fast draft, balanced, archive or match source
         },
     }
 
@@ -4,15 +4,13 @@ This module provides an interactive video editing interface that allows users
 to blur faces in real-time during video playback by clicking and dragging.
 """
 
+import itertools
 import logging
 import os
 import shutil
-import subprocess
 import sys
-import tempfile
 import threading
 import time
-import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -29,26 +27,50 @@ except ImportError:
     raise ImportError("customtkinter is required for face smudge feature")
 
 from config_manager import get_default_config, load_config, save_config
+from interval_index import FrameIntervalSet, IntervalIndex
+from media_probe import find_ffprobe
+from smudge_export import (
+    DEFAULT_ENCODER_PRESET,
+    ENCODER_PRESET_NAMES,
+    ExportCancelled,
+    ExportError,
+    ExportProgress,
+    apply_smudge_to_frame,
+    format_duration,
+    parallel_export_smudged_video,
+    resolve_encoder_preset,
+    smart_export_smudged_video,
+)
+from smudge_model import OperationStore, SmudgeOperation, SmudgeTrack
+from smudge_project import (
+    ProjectError,
+    ProjectJournal,
+    fingerprint_file,
+    get_project_path,
+    load_project,
+)
 
 logger = logging.getLogger(__name__)
 
 
-# ============================================================================
-# Data Structures
-# ============================================================================
+# Maximum forward gap (in frames) bridged with grab() instead of a seek.
+# grab() demuxes and decodes without the colour conversion and copy done by
+# retrieve(), so skipping a few frames this way is much cheaper than a seek,
+# which has to restart decoding at the previous keyframe.
+MAX_GRAB_SKIP = 60
 
+# Redaction timeline strip
+TIMELINE_HEIGHT = 12
+TIMELINE_BG_RGB = (26, 37, 58)  # Border subtle (#1a253a)
+TIMELINE_FG_RGB = (0, 166, 255)  # Primary Accent (#00a6ff)
+TIMELINE_MIN_VISIBLE = 0.35  # Minimum intensity of a column with any redaction
 
-@dataclass
-class SmudgeOperation:
-    """Represents a single smudge operation on a video frame."""
+# Interval between export progress dialog updates (at most 10 per second)
+EXPORT_PROGRESS_INTERVAL_MS = 100
 
-    frame_number: int
-    x: float  # X coordinate in frame (0-1 normalized)
-    y: float  # Y coordinate in frame (0-1 normalized)
-    radius: int  # Blur radius in pixels
-    sigma: float  # Blur strength (sigma for Gaussian)
-    timestamp: float  # When operation was created
-    operation_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+# ============================================================================
+# Data Structures
+# ============================================================================
 
 
 @dataclass
@@ -93,6 +115,9 @@ class VideoProcessor:
         self.video_path = video_path
         self.capture: Optional[cv2.VideoCapture] = None
         self.metadata: Optional[VideoMetadata] = None
+        # Index of the frame the capture will return on the next read(),
+        # or None if the position is unknown (forces a seek).
+        self._next_frame: Optional[int] = None
         self._load_video()
 
     def _load_video(self):
@@ -175,14 +200,27 @@ class VideoProcessor:
                 logger.warning(f"Invalid frame number: {frame_number}")
                 return None
 
-            # Set position to desired frame
-            self.capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            # Position the capture: read sequentially when possible, skip
+            # short forward gaps with grab(), and only seek otherwise
+            gap = None if self._next_frame is None else frame_number - self._next_frame
+            if gap is None or gap < 0 or gap > MAX_GRAB_SKIP:
+                self.capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            else:
+                for _ in range(gap):
+                    if not self.capture.grab():
+                        self._next_frame = None
+                        logger.warning(f"Could not skip to frame {frame_number} (may be end of video or corrupted)")
+                        return None
+
             ret, frame = self.capture.read()
 
             if not ret or frame is None:
+                self._next_frame = None
                 logger.warning(f"Could not read frame {frame_number} (may be end of video or corrupted)")
                 return None
 
+            self._next_frame = frame_number + 1
+
             # Validate frame dimensions
             if frame.shape[0] == 0 or frame.shape[1] == 0:  # type: ignore[union-attr]
                 logger.warning(f"Frame {frame_number} has invalid dimensions")
@@ -190,6 +228,7 @@ class VideoProcessor:
 
             return frame
         except Exception as e:
+            self._next_frame = None
             logger.error(f"Error reading frame {frame_number}: {e}")
             return None
 
@@ -317,48 +356,91 @@ class FrameCache:
 # ============================================================================
 
 
+@dataclass
+class UndoGroup:
+    """One undoable unit: the tracks added and removed by a single user action."""
+
+    label: str
+    added: List[SmudgeTrack] = field(default_factory=list)
+    removed: List[SmudgeTrack] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """A group is truthy if it changed anything."""
+        return bool(self.added or self.removed)
+
+
 class UndoManager:
-    """Manages undo/redo operations for smudge operations."""
+    """Manages undo/redo of smudge edits as transactional groups.
+
+    Changes recorded between begin_group() and commit_group() (e.g. all
+    keyframes of a drag stroke) are undone and redone together. Changes
+    recorded outside a group form a group of their own.
+    """
 
     def __init__(self):
         """Initialize undo manager."""
-        self.undo_stack: List[SmudgeOperation] = []
-        self.redo_stack: List[SmudgeOperation] = []
+        self.undo_stack: List[UndoGroup] = []
+        self.redo_stack: List[UndoGroup] = []
+        self._open_group: Optional[UndoGroup] = None
 
-    def add_operation(self, operation: SmudgeOperation):
-        """Add operation and clear redo stack.
+    def begin_group(self, label: str):
+        """Start collecting changes into one undoable group.
 
         Args:
-            operation: Smudge operation to add.
+            label: Description of the action (for logging).
         """
-        self.undo_stack.append(operation)
-        self.redo_stack.clear()
+        if self._open_group is not None:
+            self.commit_group()
+        self._open_group = UndoGroup(label)
+
+    def commit_group(self):
+        """Finish the open group; empty groups are dropped."""
+        group, self._open_group = self._open_group, None
+        if group:
+            self.undo_stack.append(group)
+            self.redo_stack.clear()
+
+    def record_added(self, track: SmudgeTrack):
+        """Record that a track was added."""
+        if self._open_group is not None:
+            self._open_group.added.append(track)
+        else:
+            self.undo_stack.append(UndoGroup("Add track", added=[track]))
+            self.redo_stack.clear()
+
+    def record_removed(self, tracks: List[SmudgeTrack], label: str = "Remove tracks"):
+        """Record that tracks were removed."""
+        if self._open_group is not None:
+            self._open_group.removed.extend(tracks)
+        elif tracks:
+            self.undo_stack.append(UndoGroup(label, removed=list(tracks)))
+            self.redo_stack.clear()
 
-    def undo(self) -> Optional[SmudgeOperation]:
-        """Pop last operation for undo.
+    def undo(self) -> Optional[UndoGroup]:
+        """Pop last group for undo.
 
         Returns:
-            Operation that was undone, or None if stack is empty.
+            Group that was undone, or None if stack is empty.
         """
         if not self.undo_stack:
             return None
 
-        op = self.undo_stack.pop()
-        self.redo_stack.append(op)
-        return op
+        group = self.undo_stack.pop()
+        self.redo_stack.append(group)
+        return group
 
-    def redo(self) -> Optional[SmudgeOperation]:
-        """Restore last undone operation.
+    def redo(self) -> Optional[UndoGroup]:
+        """Restore last undone group.
 
         Returns:
-            Operation that was redone, or None if stack is empty.
+            Group that was redone, or None if stack is empty.
         """
         if not self.redo_stack:
             return None
 
-        op = self.redo_stack.pop()
-        self.undo_stack.append(op)
-        return op
+        group = self.redo_stack.pop()
+        self.undo_stack.append(group)
+        return group
 
     def can_undo(self) -> bool:
         """Check if undo is possible."""
@@ -372,84 +454,7 @@ class UndoManager:
         """Clear both undo and redo stacks."""
         self.undo_stack.clear()
         self.redo_stack.clear()
-
-
-# ============================================================================
-# Blur Functions
-# ============================================================================
-
-
-def create_circular_mask(shape: Tuple[int, int], center_x: float, center_y: float, radius: int) -> np.ndarray:
-    """Create a circular mask for blur region.
-
-    Args:
-        shape: Shape of the frame (height, width).
-        center_x: X coordinate of center (0-1 normalized).
-        center_y: Y coordinate of center (0-1 normalized).
-        radius: Radius of the circle in pixels.
-
-    Returns:
-        Boolean mask array.
-    """
-    height, width = shape[:2]
-    y, x = np.ogrid[:height, :width]
-
-    # Convert normalized coordinates to pixel coordinates
-    cx = int(center_x * width)
-    cy = int(center_y * height)
-
-    # Create circular mask
-    mask = (x - cx) ** 2 + (y - cy) ** 2 <= radius ** 2
-
-    return mask
-
-
-def apply_smudge_to_frame(frame: np.ndarray, operation: SmudgeOperation) -> np.ndarray:
-    """Apply Gaussian blur to a circular region of a frame.
-
-    Args:
-        frame: Input frame in BGR format.
-        operation: SmudgeOperation specifying blur parameters.
-
-    Returns:
-        Modified frame with blur applied.
-    """
-    # Create mask for circular blur region
-    mask = create_circular_mask((frame.shape[0], frame.shape[1]), operation.x, operation.y, operation.radius)
-
-    # Extract region to blur
-    y_indices, x_indices = np.where(mask)
-    if len(y_indices) == 0:
-        return frame
-
-    # Get bounding box for the region
-    y_min, y_max = y_indices.min(), y_indices.max() + 1
-    x_min, x_max = x_indices.min(), x_indices.max() + 1
-
-    # Clip to frame bounds
-    y_min = max(0, y_min)
-    y_max = min(frame.shape[0], y_max)
-    x_min = max(0, x_min)
-    x_max = min(frame.shape[1], x_max)
-
-    # Extract region
-    region = frame[y_min:y_max, x_min:x_max].copy()
-
-    # Apply Gaussian blur
-    # Kernel size must be odd, calculate from sigma
-    kernel_size = int(6 * operation.sigma + 1)
-    if kernel_size % 2 == 0:
-        kernel_size += 1
-
-    blurred_region = cv2.GaussianBlur(region, (kernel_size, kernel_size), operation.sigma)
-
-    # Create mask for the region
-    region_mask = mask[y_min:y_max, x_min:x_max]
-
-    # Composite blurred region back into frame
-    frame[y_min:y_max, x_min:x_max][region_mask] = blurred_region[region_mask]
-
-    return frame
+        self._open_group = None
 
 
 # ============================================================================
@@ -560,7 +565,25 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         self.video_processor: Optional[VideoProcessor] = None
         self.frame_cache: Optional[FrameCache] = None
         self.undo_manager = UndoManager()
-        self.smudge_operations: Dict[int, List[SmudgeOperation]] = {}  # frame_number -> operations
+        # Smudge tracks (one per drag) and the index used to find the tracks
+        # active on a frame for preview and export
+        self.tracks: Dict[int, SmudgeTrack] = {}  # track_id -> track
+        self.track_index = IntervalIndex()
+        self._track_ids = itertools.count(1)
+
+        # Incrementally maintained counters (see _add_track, _extend_track,
+        # _remove_track and _clear_all) so status updates never scan tracks
+        self.total_keyframes = 0
+        self.redacted_frames = FrameIntervalSet()  # Ranges of frames covered by at least one track
+
+        # Autosave journal of the project file for the loaded video
+        self.project_journal: Optional[ProjectJournal] = None
+
+        # Last values pushed to the status widgets; widgets are only
+        # reconfigured when these change
+        self._shown_progress: Optional[float] = None
+        self._shown_operations_text: Optional[str] = None
+        self._shown_status_text: Optional[str] = None
 
         # Playback state
         self.current_frame = 0
@@ -569,14 +592,17 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         # playback_speed is loaded from config above
         self.playback_thread: Optional[threading.Thread] = None
         self.stop_playback = False
+        self._playback_frame_pending = False  # A playback frame is queued for the Tk thread
+        self.playback_fps = 0.0  # Effective (displayed) playback frame rate
+        self._fps_window_start = 0.0
+        self._fps_window_frames = 0
 
         # Smudge state
         self.is_dragging = False
         self.drag_start_frame: Optional[int] = None
-        self.current_operation: Optional[SmudgeOperation] = None
+        self.current_track: Optional[SmudgeTrack] = None  # Track being recorded by the current drag
         self.last_mouse_x: Optional[float] = None  # Last known mouse position (normalized)
         self.last_mouse_y: Optional[float] = None
-        self.frames_with_drag: set[int] = set()  # Frames where mouse was held during playback
 
         # Configuration
         config = load_config()
@@ -586,6 +612,9 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         self.blur_sigma = face_smudge_config.get("blur_sigma", 25)
         self.cache_size = face_smudge_config.get("cache_size", 100)
         self.playback_speed = face_smudge_config.get("playback_speed", 1.0)
+        self.smart_render = face_smudge_config.get("smart_render", True)
+        self.export_workers = face_smudge_config.get("export_workers", 0)
+        self.encoder_preset = face_smudge_config.get("encoder_preset", DEFAULT_ENCODER_PRESET)
 
         # Video display state (will be set by _update_display)
         self.video_display_width = 0
@@ -594,8 +623,22 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         self.video_display_y = 0
 
         # UI components
-        self.video_label: Optional[ctk.CTkLabel] = None
+        # The video canvas has two layers: a single image item holding the
+        # rendered frame and vector items (cursor ring, operation outlines)
+        # drawn on top. Overlay items are moved with canvas.coords() so mouse
+        # movement never re-renders frame pixels.
+        self.video_canvas: Optional[tk.Canvas] = None
         self.current_image: Optional[ImageTk.PhotoImage] = None
+        self._frame_item: Optional[int] = None
+        self._placeholder_item: Optional[int] = None
+        self._cursor_item: Optional[int] = None
+        self._outline_items: List[int] = []
+        self.timeline_canvas: Optional[tk.Canvas] = None
+        self._timeline_image: Optional[ImageTk.PhotoImage] = None
+        self._timeline_image_item: Optional[int] = None
+        self._timeline_playhead_item: Optional[int] = None
+        self._timeline_dirty = True
+        self._timeline_width = 0
 
         # Create UI
         self._create_widgets()
@@ -612,11 +655,17 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         self.bind("<Right>", lambda e: self._step_forward())
         self.bind("<Home>", lambda e: self._jump_to_start())
         self.bind("<End>", lambda e: self._jump_to_end())
+        self.bind("<bracketleft>", lambda e: self._jump_to_previous_gap())
+        self.bind("<bracketright>", lambda e: self._jump_to_next_gap())
         self.bind("<Control-z>", lambda e: self._undo() if sys.platform != "darwin" else None)
         self.bind("<Command-z>", lambda e: self._undo() if sys.platform == "darwin" else None)
+        self.bind("<Control-y>", lambda e: self._redo() if sys.platform != "darwin" else None)
+        self.bind("<Control-Shift-Z>", lambda e: self._redo() if sys.platform != "darwin" else None)
+        self.bind("<Command-Shift-Z>", lambda e: self._redo() if sys.platform == "darwin" else None)
         self.bind("<Control-s>", lambda e: self._save_video() if sys.platform != "darwin" else None)
         self.bind("<Command-s>", lambda e: self._save_video() if sys.platform == "darwin" else None)
         self.bind("<Escape>", lambda e: self._on_cancel())
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
 
         # Load video file
         self._load_video_file()
@@ -665,22 +714,35 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         video_frame = ctk.CTkFrame(main_frame)
         video_frame.pack(fill="both", expand=True, pady=(0, 10))
 
-        self.video_label = ctk.CTkLabel(
+        self.video_canvas = tk.Canvas(
             video_frame,
+            bg="#030922",  # Dark panel background
+            highlightthickness=0,
+            cursor="crosshair",
+        )
+        self.video_canvas.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Static frame layer
+        self._frame_item = self.video_canvas.create_image(0, 0, anchor="nw")
+        self._placeholder_item = self.video_canvas.create_text(
+            400,
+            300,
             text="Click 'Load Video' to select a video file",
-            font=ctk.CTkFont(size=14),
-            fg_color="#030922",  # Dark panel background
+            fill="#8ea4c7",  # Mist Blue
+            font=("TkDefaultFont", 14),
         )
-        self.video_label.pack(fill="both", expand=True, padx=10, pady=10)
 
-        # Bind mouse events to video label
-        self.video_label.bind("<Button-1>", self._on_mouse_press)
-        self.video_label.bind("<B1-Motion>", self._on_mouse_drag)
-        self.video_label.bind("<Motion>", self._on_mouse_motion)  # Track mouse position even when not dragging
-        self.video_label.bind("<ButtonRelease-1>", self._on_mouse_release)
-        # Change cursor when over video area
-        self.video_label.bind("<Enter>", lambda e: self.video_label.configure(cursor="crosshair"))
-        self.video_label.bind("<Leave>", lambda e: self.video_label.configure(cursor=""))
+        # Vector overlay layer (always above the frame)
+        self._cursor_item = self.video_canvas.create_oval(
+            0, 0, 0, 0, outline="#00a6ff", width=2, state="hidden"  # Primary Accent
+        )
+
+        # Bind mouse events to video canvas
+        self.video_canvas.bind("<Button-1>", self._on_mouse_press)
+        self.video_canvas.bind("<B1-Motion>", self._on_mouse_drag)
+        self.video_canvas.bind("<Motion>", self._on_mouse_motion)  # Track mouse position even when not dragging
+        self.video_canvas.bind("<ButtonRelease-1>", self._on_mouse_release)
+        self.video_canvas.bind("<Leave>", lambda e: self._hide_cursor_overlay())
 
         # Playback controls
         controls_frame = ctk.CTkFrame(main_frame)
@@ -715,6 +777,16 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         )
         self.jump_end_btn.pack(side="left", padx=2)
 
+        self.prev_gap_btn = ctk.CTkButton(
+            transport_frame, text="◄ Gap", command=self._jump_to_previous_gap, width=60, height=30
+        )
+        self.prev_gap_btn.pack(side="left", padx=(10, 2))
+
+        self.next_gap_btn = ctk.CTkButton(
+            transport_frame, text="Gap ►", command=self._jump_to_next_gap, width=60, height=30
+        )
+        self.next_gap_btn.pack(side="left", padx=2)
+
         # Playback speed
         speed_frame = ctk.CTkFrame(controls_frame)
         speed_frame.pack(side="left", padx=10, pady=10)
@@ -747,7 +819,20 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         self.scrubber = ctk.CTkSlider(
             timeline_frame, from_=0, to=100, command=self._on_scrubber_changed
         )
-        self.scrubber.pack(fill="x", padx=10, pady=10)
+        self.scrubber.pack(fill="x", padx=10, pady=(10, 2))
+
+        # Redaction timeline: one pixel column per bin of frames, shaded by
+        # the fraction of frames in the bin that already have smudges
+        self.timeline_canvas = tk.Canvas(
+            timeline_frame, height=TIMELINE_HEIGHT, bg="#1a253a", highlightthickness=0, cursor="hand2"
+        )
+        self.timeline_canvas.pack(fill="x", padx=18, pady=(0, 8))
+        self._timeline_image_item = self.timeline_canvas.create_image(0, 0, anchor="nw")
+        self._timeline_playhead_item = self.timeline_canvas.create_line(
+            0, 0, 0, TIMELINE_HEIGHT, fill="white", width=1
+        )
+        self.timeline_canvas.bind("<Button-1>", self._on_timeline_click)
+        self.timeline_canvas.bind("<B1-Motion>", self._on_timeline_click)
 
         self.time_label = ctk.CTkLabel(
             timeline_frame, text="00:00 / 00:00", font=ctk.CTkFont(size=11), text_color="#8ea4c7"  # Mist Blue
@@ -774,7 +859,7 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         # Status indicator for debugging
         self.status_indicator = ctk.CTkLabel(
             status_frame,
-            text="Status: Ready | Mouse: -- | Dragging: No",
+            text="Status: Ready | Mouse: -- | Dragging: No | Playback: --",
             font=ctk.CTkFont(size=10),
             text_color="#8ea4c7",  # Mist Blue
         )
@@ -789,6 +874,11 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         )
         self.undo_btn.pack(side="left", padx=10, pady=10)
 
+        self.redo_btn = ctk.CTkButton(
+            button_frame, text="Redo", command=self._redo, width=100, height=30, state="disabled"
+        )
+        self.redo_btn.pack(side="left", padx=10, pady=10)
+
         clear_btn = ctk.CTkButton(
             button_frame, text="Clear All", command=self._clear_all, width=100, height=30
         )
@@ -843,6 +933,9 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
                 # Update scrubber
                 self.scrubber.configure(to=self.video_processor.metadata.frame_count - 1)
 
+            # Resume or start the project file for this video
+            self._open_project(filename)
+
             # Load first frame
             self.current_frame = 0
             self._update_display()
@@ -852,6 +945,53 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
             messagebox.showerror("Error", f"Could not load video file:\n{str(e)}")
             self.destroy()
 
+    def _open_project(self, video_path: str):
+        """Resume the saved project for a video or start a new one.
+
+        Work is autosaved to the project's journal from then on. Failing to
+        open the project only disables autosave.
+
+        Args:
+            video_path: Path to the loaded video.
+        """
+        try:
+            video_hash = fingerprint_file(video_path)
+            project_path = get_project_path(video_path)
+        except OSError as e:
+            logger.warning(f"Autosave disabled, could not prepare project file: {e}")
+            return
+
+        project = None
+        if project_path.exists():
+            try:
+                project = load_project(str(project_path))
+            except ProjectError as e:
+                logger.warning(f"Ignoring unreadable project {project_path}: {e}")
+
+            if project and project.video_hash != video_hash:
+                logger.warning(f"Project {project_path} was saved for different video contents, ignoring it")
+                project = None
+            if project and project.tracks and not messagebox.askyesno(
+                "Resume Session",
+                f"Resume the saved smudge session for this video ({len(project.tracks)} track(s))?\n\n"
+                "Choosing No starts a new session and discards the saved one.",
+                parent=self,
+            ):
+                project = None
+
+        try:
+            if project:
+                for track in project.tracks:
+                    self._add_track(track)
+                self._track_ids = itertools.count(project.next_track_id)
+                self.project_journal = ProjectJournal.resume(project)
+                logger.info(f"Resumed project {project_path} with {len(project.tracks)} track(s)")
+            else:
+                self.project_journal = ProjectJournal.create(project_path, video_path, video_hash)
+        except OSError as e:
+            logger.warning(f"Autosave disabled, could not write project file {project_path}: {e}")
+            self.project_journal = None
+
     def _update_display(self):
         """Update video display with current frame."""
         if not self.video_processor or not self.frame_cache:
@@ -862,18 +1002,14 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         if frame is None:
             return
 
-        # Apply saved smudges for this frame
-        if self.current_frame in self.smudge_operations:
-            num_ops = len(self.smudge_operations[self.current_frame])
-            logger.debug(f"Applying {num_ops} saved operation(s) to frame {self.current_frame}")
-            for operation in self.smudge_operations[self.current_frame]:
+        # Apply smudges of the tracks active on this frame (including the
+        # track being recorded, which is already indexed)
+        operations = self._operations_for_frame(self.current_frame)
+        if operations:
+            logger.debug(f"Applying {len(operations)} operation(s) to frame {self.current_frame}")
+            for operation in operations:
                 frame = apply_smudge_to_frame(frame, operation)
 
-        # Apply current operation for preview (if dragging)
-        if self.current_operation and self.current_operation.frame_number == self.current_frame:
-            logger.debug(f"Applying current operation preview to frame {self.current_frame}")
-            frame = apply_smudge_to_frame(frame, self.current_operation)
-
         # Convert BGR to RGB
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
@@ -882,8 +1018,8 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
 
         # Get display size
         self.update_idletasks()
-        display_width = self.video_label.winfo_width()  # type: ignore[union-attr]
-        display_height = self.video_label.winfo_height()  # type: ignore[union-attr]
+        display_width = self.video_canvas.winfo_width()  # type: ignore[union-attr]
+        display_height = self.video_canvas.winfo_height()  # type: ignore[union-attr]
 
         if display_width <= 1 or display_height <= 1:
             # Widget not yet sized, use default
@@ -911,16 +1047,22 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         # Convert to PhotoImage
         self.current_image = ImageTk.PhotoImage(pil_image)
 
-        # Update label
-        self.video_label.configure(image=self.current_image, text="")  # type: ignore[union-attr]
-
         # Store display dimensions for coordinate conversion
         self.video_display_width = new_width
         self.video_display_height = new_height
         self.video_display_x = (display_width - new_width) // 2
         self.video_display_y = (display_height - new_height) // 2
-        
-        
+
+        # Update frame layer (the canvas and its items exist once the UI is built)
+        canvas = self.video_canvas
+        assert canvas is not None and self._frame_item is not None and self._placeholder_item is not None
+        canvas.itemconfigure(self._frame_item, image=self.current_image)
+        canvas.coords(self._frame_item, self.video_display_x, self.video_display_y)
+        canvas.itemconfigure(self._placeholder_item, state="hidden")
+
+        # Update overlay layer for the new frame
+        self._update_overlay()
+
         logger.debug(
             f"Updated video display: size=({new_width}, {new_height}), "
             f"offset=({self.video_display_x}, {self.video_display_y}), "
@@ -943,35 +1085,169 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
             if max_frame > 0:
                 self.scrubber.set(self.current_frame)
 
+        # Update redaction timeline
+        self._render_timeline()
+
         # Update progress and status
         self._update_progress()
 
+    def _render_timeline(self):
+        """Render the redaction timeline heatmap and move its playhead.
+
+        The heatmap is only rebuilt when the redacted ranges or the strip
+        width change, and costs O(width * log ranges) regardless of the
+        number of frames in the video.
+        """
+        if not self.timeline_canvas or not self.video_processor or not self.video_processor.metadata:
+            return
+
+        width = self.timeline_canvas.winfo_width()
+        if width <= 1:
+            return
+        frame_count = self.video_processor.metadata.frame_count
+
+        if self._timeline_dirty or width != self._timeline_width:
+            fractions = np.asarray(self.redacted_frames.coverage_bins(frame_count, width), dtype=np.float32)
+            fractions = np.where(fractions > 0, np.maximum(fractions, TIMELINE_MIN_VISIBLE), 0.0)
+            bg = np.array(TIMELINE_BG_RGB, dtype=np.float32)
+            fg = np.array(TIMELINE_FG_RGB, dtype=np.float32)
+            row = (bg + (fg - bg) * fractions[:, None]).astype(np.uint8)
+            pixels = np.repeat(row[None, :, :], TIMELINE_HEIGHT, axis=0)
+
+            self._timeline_image = ImageTk.PhotoImage(Image.fromarray(pixels))
+            self.timeline_canvas.itemconfigure(self._timeline_image_item, image=self._timeline_image)  # type: ignore[arg-type]
+            self._timeline_dirty = False
+            self._timeline_width = width
+
+        x = self.current_frame * (width - 1) / max(1, frame_count - 1)
+        self.timeline_canvas.coords(self._timeline_playhead_item, x, 0, x, TIMELINE_HEIGHT)  # type: ignore[arg-type]
+        self.timeline_canvas.tag_raise(self._timeline_playhead_item)  # type: ignore[arg-type]
+
+    def _on_timeline_click(self, event):
+        """Seek to the frame under the mouse on the redaction timeline."""
+        if not self.timeline_canvas or not self.video_processor or not self.video_processor.metadata:
+            return
+
+        width = self.timeline_canvas.winfo_width()
+        if width <= 1:
+            return
+        frame_count = self.video_processor.metadata.frame_count
+        frame = int(max(0, min(event.x, width - 1)) * frame_count / width)
+        frame = min(frame, frame_count - 1)
+        if frame != self.current_frame:
+            self.current_frame = frame
+            self._update_display()
+
+    def _display_radius(self, radius: int) -> float:
+        """Convert a blur radius in frame pixels to display pixels."""
+        if not self.video_processor or not self.video_processor.metadata:
+            return float(radius)
+        return radius * self.video_display_width / self.video_processor.metadata.width
+
+    def _frame_to_canvas_coords(self, frame_x: float, frame_y: float) -> Tuple[float, float]:
+        """Convert normalized frame coordinates to canvas coordinates."""
+        return (
+            self.video_display_x + frame_x * self.video_display_width,
+            self.video_display_y + frame_y * self.video_display_height,
+        )
+
+    def _update_overlay(self):
+        """Redraw the vector overlay (operation outlines and cursor ring).
+
+        Only canvas items are touched; the frame image is left as is.
+        """
+        if not self.video_canvas:
+            return
+
+        operations = self._operations_for_frame(self.current_frame)
+
+        # Grow the outline item pool as needed, reuse existing items
+        while len(self._outline_items) < len(operations):
+            item = self.video_canvas.create_oval(
+                0, 0, 0, 0, outline="#8ea4c7", dash=(4, 2), state="hidden"  # Mist Blue
+            )
+            self._outline_items.append(item)
+
+        for index, item in enumerate(self._outline_items):
+            if index < len(operations):
+                operation = operations[index]
+                cx, cy = self._frame_to_canvas_coords(operation.x, operation.y)
+                r = self._display_radius(operation.radius)
+                self.video_canvas.coords(item, cx - r, cy - r, cx + r, cy + r)
+                self.video_canvas.itemconfigure(item, state="normal")
+            else:
+                self.video_canvas.itemconfigure(item, state="hidden")
+
+        self._update_cursor_overlay()
+
+    def _update_cursor_overlay(self):
+        """Move the brush cursor ring to the last known mouse position."""
+        if not self.video_canvas or self._cursor_item is None:
+            return
+        if self.last_mouse_x is None or self.last_mouse_y is None or self.video_display_width == 0:
+            self._hide_cursor_overlay()
+            return
+
+        cx, cy = self._frame_to_canvas_coords(self.last_mouse_x, self.last_mouse_y)
+        r = self._display_radius(self.blur_radius)
+        self.video_canvas.coords(self._cursor_item, cx - r, cy - r, cx + r, cy + r)
+        self.video_canvas.itemconfigure(self._cursor_item, state="normal")
+        self.video_canvas.tag_raise(self._cursor_item)
+
+    def _hide_cursor_overlay(self):
+        """Hide the brush cursor ring (e.g. when the mouse leaves the video)."""
+        if self.video_canvas and self._cursor_item is not None:
+            self.video_canvas.itemconfigure(self._cursor_item, state="hidden")
+
+    def _event_to_frame_coords(self, event) -> Optional[Tuple[float, float]]:
+        """Convert a canvas mouse event to normalized frame coordinates.
+
+        Args:
+            event: Tkinter mouse event on the video canvas.
+
+        Returns:
+            Tuple of (frame_x, frame_y) in 0-1 range, or None if the event is
+            outside the displayed video area.
+        """
+        rel_x = event.x - self.video_display_x
+        rel_y = event.y - self.video_display_y
+        if rel_x < 0 or rel_x >= self.video_display_width or rel_y < 0 or rel_y >= self.video_display_height:
+            return None
+
+        frame_x = max(0.0, min(1.0, rel_x / self.video_display_width))
+        frame_y = max(0.0, min(1.0, rel_y / self.video_display_height))
+        return (frame_x, frame_y)
 
     def _update_progress(self):
-        """Update progress bar based on processed frames."""
+        """Update progress bar and status labels from the running counters.
+
+        This is O(1) and only reconfigures widgets whose values changed.
+        """
         if not self.video_processor or not self.video_processor.metadata:
             return
 
-        # Count frames with operations
-        processed_frames = len(self.smudge_operations)
         total_frames = self.video_processor.metadata.frame_count
-
         if total_frames > 0:
-            progress = processed_frames / total_frames
-            self.progress_bar.set(progress)
+            progress = self.redacted_frames.total / total_frames
+            if progress != self._shown_progress:
+                self._shown_progress = progress
+                self.progress_bar.set(progress)
 
         # Update operations count
-        total_operations = sum(len(ops) for ops in self.smudge_operations.values())
-        self.operations_label.configure(text=f"Operations: {total_operations} smudges")
+        operations_text = f"Operations: {len(self.tracks)} tracks ({self.total_keyframes} keyframes)"
+        if operations_text != self._shown_operations_text:
+            self._shown_operations_text = operations_text
+            self.operations_label.configure(text=operations_text)
 
         # Update status indicator
-        mouse_status = "Tracked" if (self.last_mouse_x is not None and self.last_mouse_y is not None) else "None"
         drag_status = "Yes" if self.is_dragging else "No"
-        current_op = "Active" if self.current_operation else "None"
+        current_op = "Active" if self.current_track else "None"
         mouse_pos = f"({self.last_mouse_x:.2f},{self.last_mouse_y:.2f})" if self.last_mouse_x is not None else "--"
-        self.status_indicator.configure(
-            text=f"Status: {current_op} | Mouse: {mouse_pos} | Dragging: {drag_status}"
-        )
+        playback = f"{self.playback_fps:.1f} fps" if self.is_playing else "--"
+        status_text = f"Status: {current_op} | Mouse: {mouse_pos} | Dragging: {drag_status} | Playback: {playback}"
+        if status_text != self._shown_status_text:
+            self._shown_status_text = status_text
+            self.status_indicator.configure(text=status_text)
 
     def _on_mouse_press(self, event):
         """Handle mouse button press on video display."""
@@ -981,8 +1257,8 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
             return
 
         try:
-            # Event coordinates are already relative to the video display area
-            # Get current video display size for normalization
+            # Event coordinates are relative to the canvas; the video image is
+            # centered in it, so the display offset is subtracted below
             if self.video_display_width == 0 or self.video_display_height == 0:
                 logger.warning("Video display dimensions not set, forcing update")
                 self._update_display()
@@ -990,43 +1266,24 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
                     logger.error("Still no video display dimensions after update")
                     return
             
-            # event.x and event.y are already in video display coordinates
-            rel_x = event.x
-            rel_y = event.y
-            
-            logger.info(
-                f"Click: event=({event.x}, {event.y}), "
-                f"video_size=({self.video_display_width}, {self.video_display_height})"
-            )
-            
-            # Check if click is within video display area
-            if rel_x < 0 or rel_x >= self.video_display_width or rel_y < 0 or rel_y >= self.video_display_height:
+            coords = self._event_to_frame_coords(event)
+            if coords is None:
                 logger.warning(
                     f"Click outside video area: "
                     f"event=({event.x}, {event.y}), "
-                    f"video_size=({self.video_display_width}, {self.video_display_height})"
+                    f"video_size=({self.video_display_width}, {self.video_display_height}), "
+                    f"offset=({self.video_display_x}, {self.video_display_y})"
                 )
                 return
-            
-            # Convert to normalized coordinates (0-1)
-            frame_x = rel_x / self.video_display_width
-            frame_y = rel_y / self.video_display_height
-            
-            # Clamp to [0, 1]
-            frame_x = max(0.0, min(1.0, frame_x))
-            frame_y = max(0.0, min(1.0, frame_y))
+            frame_x, frame_y = coords
 
             logger.info(f"Converted coordinates: frame_x={frame_x:.3f}, frame_y={frame_y:.3f}")
 
-            # Validate coordinates
-            if frame_x < 0 or frame_x > 1 or frame_y < 0 or frame_y > 1:
-                logger.warning(f"Mouse press: Invalid coordinates: {frame_x}, {frame_y}")
-                return
-
-            # Start smudge operation
+            # Start smudge operation; everything until release is one undo step
+            self.undo_manager.begin_group("Smudge stroke")
             self.is_dragging = True
             self.drag_start_frame = self.current_frame
-            self.frames_with_drag.clear()  # Reset frame tracking
+            self.current_track = None  # Each drag records a new track
 
             # Store mouse position
             self.last_mouse_x = frame_x
@@ -1034,8 +1291,8 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
 
             logger.info(f"Starting drag: frame={self.current_frame}, pos=({frame_x:.3f}, {frame_y:.3f})")
 
-            # Create operation for current frame
-            self._create_operation_for_current_frame(frame_x, frame_y)
+            # Record the first keyframe of the new track
+            self._record_brush_position(frame_x, frame_y)
 
             # Update display to show preview
             self._update_display()
@@ -1050,38 +1307,28 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
             return
 
         try:
-            # Event coordinates are already relative to the video display area
             if self.video_display_width == 0 or self.video_display_height == 0:
                 return
             
-            # event.x and event.y are already in video display coordinates
-            rel_x = event.x
-            rel_y = event.y
-            
-            # Check if within video display area
-            if rel_x < 0 or rel_x >= self.video_display_width or rel_y < 0 or rel_y >= self.video_display_height:
+            coords = self._event_to_frame_coords(event)
+            if coords is None:
+                self._hide_cursor_overlay()
                 return  # Outside video area
-            
-            # Convert to normalized coordinates (0-1)
-            frame_x = rel_x / self.video_display_width
-            frame_y = rel_y / self.video_display_height
-            
-            # Clamp to [0, 1]
-            frame_x = max(0.0, min(1.0, frame_x))
-            frame_y = max(0.0, min(1.0, frame_y))
+            frame_x, frame_y = coords
 
             # Store last known position
             self.last_mouse_x = frame_x
             self.last_mouse_y = frame_y
 
-            # If dragging, update current operation
+            # If dragging, update current operation. The blur itself is
+            # rendered on the next frame update; here only the overlay moves.
             if self.is_dragging:
                 logger.debug(f"Mouse motion while dragging: frame={self.current_frame}, pos=({frame_x:.3f}, {frame_y:.3f})")
-                if self.current_operation:
-                    self.current_operation.x = frame_x
-                    self.current_operation.y = frame_y
-                self._update_display()
+                self._record_brush_position(frame_x, frame_y)
+                self._update_overlay()
                 self._update_progress()  # Update status indicator
+            else:
+                self._update_cursor_overlay()
         except Exception as e:
             logger.error(f"Error in mouse motion handler: {e}", exc_info=True)
 
@@ -1097,89 +1344,124 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         if not self.is_dragging:
             return
 
-        # Save current operation if it exists
-        if self.current_operation:
-            logger.info(f"Saving operation on release: frame={self.current_operation.frame_number}, pos=({self.current_operation.x:.3f}, {self.current_operation.y:.3f})")
-            self._save_operation(self.current_operation)
+        if self.current_track:
+            logger.info(
+                f"Finished track {self.current_track.track_id}: frames "
+                f"{self.current_track.start_frame}-{self.current_track.end_frame - 1}, "
+                f"{len(self.current_track.frames)} keyframe(s)"
+            )
+            if self.project_journal:
+                self.project_journal.record_add(self.current_track)
         else:
-            logger.warning("Mouse release: No current operation to save")
+            logger.warning("Mouse release: No current track to save")
 
-        # Save all operations created during playback
-        # Operations are already saved as frames advance, but ensure current one is saved
-        total_ops = sum(len(ops) for ops in self.smudge_operations.values())
-        logger.info(f"Mouse release: Total operations saved: {total_ops}, frames with operations: {len(self.smudge_operations)}")
+        logger.info(f"Mouse release: {len(self.tracks)} track(s), {self.redacted_frames.total} frame(s) with smudges")
+
+        self.undo_manager.commit_group()
+        self._update_undo_buttons()
 
         self.is_dragging = False
-        self.current_operation = None
+        self.current_track = None
         self.drag_start_frame = None
-        self.frames_with_drag.clear()
 
         # Update display
         self._update_display()
         self._update_progress()  # Update status indicator
 
-    def _create_operation_for_current_frame(self, frame_x: float, frame_y: float):
-        """Create a smudge operation for the current frame.
+    def _record_brush_position(self, frame_x: float, frame_y: float):
+        """Record the brush position on the current frame in the current track.
+
+        The first call of a drag creates the track; later calls add or update
+        a keyframe. Frames between keyframes are interpolated, so nothing is
+        stored for frames that playback skipped.
 
         Args:
             frame_x: X coordinate in frame (0-1 normalized).
             frame_y: Y coordinate in frame (0-1 normalized).
         """
-        logger.info(f"Creating operation: frame={self.current_frame}, pos=({frame_x:.3f}, {frame_y:.3f}), radius={self.blur_radius}, sigma={self.blur_sigma}")
         if not self.video_processor or not self.video_processor.metadata:
-            logger.warning("Cannot create operation: No video processor or metadata")
+            logger.warning("Cannot record brush position: No video processor or metadata")
             return
 
-        # If we already have an operation for this frame, update it
-        if self.current_operation and self.current_operation.frame_number == self.current_frame:
-            logger.debug(f"Updating existing operation for frame {self.current_frame}")
-            self.current_operation.x = frame_x
-            self.current_operation.y = frame_y
-        else:
-            # Save previous operation if it exists
-            if self.current_operation:
-                logger.debug(f"Saving previous operation for frame {self.current_operation.frame_number}")
-                self._save_operation(self.current_operation)
-
-            # Create new operation for current frame
-            self.current_operation = SmudgeOperation(
-                frame_number=self.current_frame,
-                x=frame_x,
-                y=frame_y,
+        if self.current_track is None:
+            self.current_track = SmudgeTrack(
+                track_id=next(self._track_ids),
                 radius=self.blur_radius,
                 sigma=self.blur_sigma,
                 timestamp=time.time(),
             )
+            self.current_track.add_keyframe(self.current_frame, frame_x, frame_y)
+            logger.info(f"Created new track: id={self.current_track.track_id}, frame={self.current_frame}, pos=({frame_x:.3f}, {frame_y:.3f})")
+            self._add_track(self.current_track)
+            self.undo_manager.record_added(self.current_track)
+        else:
+            self._extend_track(self.current_track, self.current_frame, frame_x, frame_y)
 
-            logger.info(f"Created new operation: id={self.current_operation.operation_id}, frame={self.current_frame}")
+    def _operations_for_frame(self, frame_number: int) -> List[SmudgeOperation]:
+        """Evaluate all tracks active on a frame.
 
-            # Mark this frame as having a drag operation
-            self.frames_with_drag.add(self.current_frame)
+        Args:
+            frame_number: Frame to evaluate.
 
-            # Save operation immediately (so it persists even if mouse is released)
-            self._save_operation(self.current_operation)
+        Returns:
+            Smudge operations for the frame, in track creation order.
+        """
+        operations = []
+        for track_id in self.track_index.at(frame_number):
+            operation = self.tracks[track_id].operation_at(frame_number)
+            if operation:
+                operations.append(operation)
+        return operations
 
-    def _save_operation(self, operation: SmudgeOperation):
-        """Save a smudge operation to the operations dictionary.
+    def _add_track(self, track: SmudgeTrack):
+        """Add a track to the session.
 
         Args:
-            operation: The smudge operation to save.
+            track: The smudge track to add.
         """
-        logger.info(f"Saving operation: frame={operation.frame_number}, id={operation.operation_id}, pos=({operation.x:.3f}, {operation.y:.3f})")
-        if operation.frame_number not in self.smudge_operations:
-            self.smudge_operations[operation.frame_number] = []
-            logger.debug(f"Created new list for frame {operation.frame_number}")
-
-        # Check if operation with same ID already exists
-        existing_ids = {op.operation_id for op in self.smudge_operations[operation.frame_number]}
-        if operation.operation_id not in existing_ids:
-            self.smudge_operations[operation.frame_number].append(operation)
-            self.undo_manager.add_operation(operation)
-            self.frame_cache.invalidate_frame(operation.frame_number)  # type: ignore[union-attr]
-            self.undo_btn.configure(state="normal")
-            logger.info(f"Operation saved successfully. Frame {operation.frame_number} now has {len(self.smudge_operations[operation.frame_number])} operation(s)")
-        else:
-            logger.debug(f"Operation {operation.operation_id} already exists for frame {operation.frame_number}, skipping")
+        self.tracks[track.track_id] = track
+        self.track_index.set(track.track_id, track.start_frame, track.end_frame)
+        self.redacted_frames.add_range(track.start_frame, track.end_frame)
+        self.total_keyframes += len(track.frames)
+        self._timeline_dirty = True
+
+    def _extend_track(self, track: SmudgeTrack, frame_number: int, x: float, y: float):
+        """Add or update a keyframe of a track already in the session.
+
+        Args:
+            track: The smudge track to extend.
+            frame_number: Frame the position was sampled on.
+            x: X coordinate in frame (0-1 normalized).
+            y: Y coordinate in frame (0-1 normalized).
+        """
+        keyframes_before = len(track.frames)
+        start, end = track.start_frame, track.end_frame
+        track.add_keyframe(frame_number, x, y)
+        self.total_keyframes += len(track.frames) - keyframes_before
+
+        if (track.start_frame, track.end_frame) != (start, end):
+            self.track_index.set(track.track_id, track.start_frame, track.end_frame)
+            self.redacted_frames.add_range(track.start_frame, track.end_frame)
+            self._timeline_dirty = True
+
+    def _remove_track(self, track: SmudgeTrack):
+        """Remove a track from the session.
+
+        Args:
+            track: The smudge track to remove.
+        """
+        if self.tracks.pop(track.track_id, None) is None:
+            return
+        start, end = track.start_frame, track.end_frame
+        self.track_index.remove(track.track_id)
+        self.total_keyframes -= len(track.frames)
+
+        # Frames of this track stay redacted where other tracks overlap it
+        self.redacted_frames.remove_range(start, end)
+        for other_id in self.track_index.overlapping(start, end):
+            other = self.tracks[other_id]
+            self.redacted_frames.add_range(max(start, other.start_frame), min(end, other.end_frame))
+        self._timeline_dirty = True
 
     def _toggle_play_pause(self):
         """Toggle play/pause state."""
@@ -1209,6 +1491,7 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         """Pause playback."""
         self.is_playing = False
         self.is_paused = True
+        self.playback_fps = 0.0
         self.play_pause_btn.configure(text="►")
 
     def _stop(self):
@@ -1221,7 +1504,15 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         self._update_display()
 
     def _playback_loop(self):
-        """Playback loop running in separate thread."""
+        """Playback loop running in separate thread.
+
+        Frames are scheduled against time.monotonic() deadlines computed from
+        the position playback started at, so a slow frame never delays the
+        ones after it. The loop ticks at most at the source frame rate; when
+        it falls behind, or plays faster than 1x, the frame due at each tick
+        is shown and the frames in between are skipped with grab() by the
+        video processor rather than decoded and displayed.
+        """
         if not self.video_processor or not self.video_processor.metadata:
             return
 
@@ -1229,45 +1520,102 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
             fps = self.video_processor.metadata.fps
             if fps <= 0:
                 fps = 30.0  # Default FPS if invalid
-            frame_delay = 1.0 / (fps * self.playback_speed)
+            frame_count = self.video_processor.metadata.frame_count
 
-            while self.is_playing and not self.stop_playback:
-                start_time = time.time()
+            speed = self.playback_speed
+            start_frame = self.current_frame
+            start_time = time.monotonic()
+            last_target = start_frame
+            tick = 0
+            self._fps_window_start = start_time
+            self._fps_window_frames = 0
 
-                # Advance frame
-                self.current_frame += 1
-                if self.current_frame >= self.video_processor.metadata.frame_count:
+            while self.is_playing and not self.stop_playback:
+                # Never tick faster than the source frame rate
+                tick_interval = 1.0 / (fps * min(speed, 1.0))
+                tick += 1
+                deadline = start_time + tick * tick_interval
+                sleep_time = deadline - time.monotonic()
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+
+                now = time.monotonic()
+                if now - deadline > tick_interval:
+                    # Fell behind: realign to the clock instead of bursting
+                    tick = int((now - start_time) / tick_interval)
+
+                # Rebase the clock on user seeks or speed changes
+                if not self._playback_frame_pending and (
+                    self.current_frame != last_target or self.playback_speed != speed
+                ):
+                    speed = self.playback_speed
+                    start_frame = last_target = self.current_frame
+                    start_time = now
+                    tick = 0
+                    continue
+
+                target = start_frame + int((now - start_time) * fps * speed)
+                if target <= last_target:
+                    continue
+
+                if target >= frame_count:
                     # End of video
+                    last_frame = frame_count - 1
+                    if last_frame > last_target:
+                        self.after(0, lambda t=last_frame: self._show_playback_frame(t))
                     self.after(0, self._pause)
-                    self.current_frame = self.video_processor.metadata.frame_count - 1
                     break
 
-                # If mouse is held down, create operation for this frame
-                if self.is_dragging and self.last_mouse_x is not None and self.last_mouse_y is not None:
-                    logger.info(f"Playback: Creating operation for frame {self.current_frame} while dragging")
-                    # Capture values in closure
-                    mouse_x = self.last_mouse_x
-                    mouse_y = self.last_mouse_y
-                    self.after(0, lambda: self._create_operation_for_current_frame(mouse_x, mouse_y))
-                else:
-                    if self.is_dragging:
-                        logger.warning(f"Playback: Dragging but no mouse position: x={self.last_mouse_x}, y={self.last_mouse_y}")
-
-                # Update display (in main thread)
-                try:
-                    self.after(0, self._update_display)
-                except Exception as e:
-                    logger.error(f"Error updating display: {e}")
-                    break
+                if self._playback_frame_pending:
+                    # The Tk thread has not shown the previous frame yet;
+                    # drop this tick; a later target covers the skipped frames
+                    continue
 
-                # Sleep to maintain frame rate
-                elapsed = time.time() - start_time
-                sleep_time = max(0, frame_delay - elapsed)
-                time.sleep(sleep_time)
+                self._playback_frame_pending = True
+                last_target = target
+                self.after(0, lambda t=target: self._show_playback_frame(t))
         except Exception as e:
             logger.error(f"Error in playback loop: {e}")
             self.after(0, lambda: self._pause())
 
+    def _show_playback_frame(self, target_frame: int):
+        """Advance playback to a frame (runs on the Tk thread).
+
+        Args:
+            target_frame: Frame the playback clock says is due now.
+        """
+        try:
+            if not self.is_playing or self.stop_playback:
+                return
+
+            self.current_frame = target_frame
+
+            # If mouse is held down, add a keyframe on the shown frame. Frames
+            # skipped since the previous keyframe are covered by interpolation.
+            if self.is_dragging and self.last_mouse_x is not None and self.last_mouse_y is not None:
+                self._record_brush_position(self.last_mouse_x, self.last_mouse_y)
+            elif self.is_dragging:
+                logger.warning(f"Playback: Dragging but no mouse position: x={self.last_mouse_x}, y={self.last_mouse_y}")
+
+            self._update_display()
+            self._record_playback_fps()
+        except Exception as e:
+            logger.error(f"Error updating display: {e}")
+            self._pause()
+        finally:
+            self._playback_frame_pending = False
+
+    def _record_playback_fps(self):
+        """Update the effective playback fps once per second."""
+        self._fps_window_frames += 1
+        now = time.monotonic()
+        elapsed = now - self._fps_window_start
+        if elapsed >= 1.0:
+            self.playback_fps = self._fps_window_frames / elapsed
+            self._fps_window_start = now
+            self._fps_window_frames = 0
+            logger.debug(f"Effective playback rate: {self.playback_fps:.1f} fps")
+
     def _step_forward(self):
         """Step forward one frame."""
         if not self.video_processor or not self.video_processor.metadata:
@@ -1294,6 +1642,26 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
             self.current_frame = self.video_processor.metadata.frame_count - 1
             self._update_display()
 
+    def _jump_to_next_gap(self):
+        """Jump to the start of the next unredacted frame range."""
+        if not self.video_processor or not self.video_processor.metadata:
+            return
+
+        frame = self.redacted_frames.next_gap(self.current_frame, self.video_processor.metadata.frame_count)
+        if frame is not None:
+            self.current_frame = frame
+            self._update_display()
+
+    def _jump_to_previous_gap(self):
+        """Jump to the start of the previous unredacted frame range."""
+        if not self.video_processor or not self.video_processor.metadata:
+            return
+
+        frame = self.redacted_frames.previous_gap(self.current_frame)
+        if frame is not None:
+            self.current_frame = frame
+            self._update_display()
+
     def _on_speed_changed(self, value: str):
         """Handle playback speed change."""
         speed_map = {"0.25x": 0.25, "0.5x": 0.5, "1x": 1.0, "2x": 2.0, "4x": 4.0}
@@ -1313,47 +1681,73 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
             self._update_display()
 
     def _undo(self):
-        """Undo last smudge operation."""
-        operation = self.undo_manager.undo()
-        if operation:
-            # Remove from operations
-            if operation.frame_number in self.smudge_operations:
-                self.smudge_operations[operation.frame_number] = [
-                    op for op in self.smudge_operations[operation.frame_number] if op.operation_id != operation.operation_id
-                ]
-                if not self.smudge_operations[operation.frame_number]:
-                    del self.smudge_operations[operation.frame_number]
-
-            # Invalidate frame cache
-            self.frame_cache.invalidate_frame(operation.frame_number)  # type: ignore[union-attr]
-
-            # Update display
-            self._update_display()
-            self._update_progress()
+        """Undo the last edit group (e.g. a whole drag stroke)."""
+        if self.is_dragging:
+            return
+        group = self.undo_manager.undo()
+        if group:
+            logger.info(f"Undo: {group.label}")
+            self._apply_edit(added=group.removed, removed=group.added)
+
+    def _redo(self):
+        """Redo the last undone edit group."""
+        if self.is_dragging:
+            return
+        group = self.undo_manager.redo()
+        if group:
+            logger.info(f"Redo: {group.label}")
+            self._apply_edit(added=group.added, removed=group.removed)
 
-            # Update undo button state
-            if not self.undo_manager.can_undo():
-                self.undo_btn.configure(state="disabled")
+    def _apply_edit(self, added: List[SmudgeTrack], removed: List[SmudgeTrack]):
+        """Apply an undo/redo step as one batch.
+
+        The session state and journal are updated for every track, then the
+        display is redrawn once.
+
+        Args:
+            added: Tracks to put back into the session.
+            removed: Tracks to take out of the session.
+        """
+        for track in removed:
+            self._remove_track(track)
+            if self.project_journal:
+                self.project_journal.record_remove(track.track_id)
+        for track in added:
+            self._add_track(track)
+            if self.project_journal:
+                self.project_journal.record_add(track)
+
+        self._update_undo_buttons()
+        self._update_display()
+
+    def _update_undo_buttons(self):
+        """Enable the undo and redo buttons according to the undo stacks."""
+        self.undo_btn.configure(state="normal" if self.undo_manager.can_undo() else "disabled")
+        self.redo_btn.configure(state="normal" if self.undo_manager.can_redo() else "disabled")
 
     def _clear_all(self):
-        """Clear all smudge operations."""
-        if not self.smudge_operations:
+        """Clear all smudge tracks (undoable)."""
+        if not self.tracks or self.is_dragging:
             return
 
         if messagebox.askyesno("Clear All", "Remove all smudge operations?"):
-            self.smudge_operations.clear()
-            self.undo_manager.clear()
-            self.frame_cache.clear()  # type: ignore[union-attr]
-            self.undo_btn.configure(state="disabled")
+            self.undo_manager.record_removed(list(self.tracks.values()), label="Clear all")
+            self.tracks.clear()
+            self.track_index.clear()
+            self.total_keyframes = 0
+            self.redacted_frames.clear()
+            self._timeline_dirty = True
+            if self.project_journal:
+                self.project_journal.record_clear()
+            self._update_undo_buttons()
             self._update_display()
-            self._update_progress()
 
     def _open_settings(self):
         """Open settings dialog."""
         # Create simple settings dialog
         settings_window = ctk.CTkToplevel(self)
         settings_window.title("Face Smudge Settings")
-        settings_window.geometry("400x500")
+        settings_window.geometry("400x680")
         settings_window.transient(self)
         settings_window.grab_set()
 
@@ -1392,6 +1786,43 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         sigma_label = ctk.CTkLabel(sigma_frame, text=str(int(self.blur_sigma)), font=ctk.CTkFont(size=11), text_color="#8ea4c7")  # Mist Blue
         sigma_label.pack(anchor="w", padx=10, pady=(0, 10))
 
+        # Export
+        smart_render_var = tk.BooleanVar(value=self.smart_render)
+        ctk.CTkCheckBox(
+            main_frame,
+            text="Smart render (re-encode only edited segments)",
+            variable=smart_render_var,
+            font=ctk.CTkFont(size=12),
+        ).pack(anchor="w", padx=10, pady=10)
+
+        preset_frame = ctk.CTkFrame(main_frame)
+        preset_frame.pack(fill="x", pady=10)
+        ctk.CTkLabel(preset_frame, text="Encoder preset:", font=ctk.CTkFont(size=12)).pack(
+            side="left", padx=10, pady=10
+        )
+        preset_var = tk.StringVar(
+            value=self.encoder_preset if self.encoder_preset in ENCODER_PRESET_NAMES else DEFAULT_ENCODER_PRESET
+        )
+        ctk.CTkOptionMenu(
+            preset_frame,
+            values=ENCODER_PRESET_NAMES,
+            variable=preset_var,
+            width=130,
+        ).pack(side="right", padx=10, pady=10)
+
+        workers_frame = ctk.CTkFrame(main_frame)
+        workers_frame.pack(fill="x", pady=10)
+        ctk.CTkLabel(workers_frame, text="Export worker processes:", font=ctk.CTkFont(size=12)).pack(
+            side="left", padx=10, pady=10
+        )
+        workers_var = tk.StringVar(value=str(self.export_workers) if self.export_workers else "Auto")
+        ctk.CTkOptionMenu(
+            workers_frame,
+            values=["Auto", "1", "2", "4", "8", "16", "32"],
+            variable=workers_var,
+            width=90,
+        ).pack(side="right", padx=10, pady=10)
+
         # Buttons
         button_frame = ctk.CTkFrame(main_frame)
         button_frame.pack(fill="x", pady=20)
@@ -1399,6 +1830,9 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         def on_ok():
             self.blur_radius = int(radius_var.get())
             self.blur_sigma = float(sigma_var.get())
+            self.smart_render = bool(smart_render_var.get())
+            self.export_workers = 0 if workers_var.get() == "Auto" else int(workers_var.get())
+            self.encoder_preset = preset_var.get()
             # Save to config
             self._save_settings()
             settings_window.destroy()
@@ -1428,11 +1862,14 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         config["face_smudge_config"]["blur_sigma"] = self.blur_sigma
         config["face_smudge_config"]["cache_size"] = self.cache_size
         config["face_smudge_config"]["playback_speed"] = self.playback_speed
+        config["face_smudge_config"]["smart_render"] = self.smart_render
+        config["face_smudge_config"]["export_workers"] = self.export_workers
+        config["face_smudge_config"]["encoder_preset"] = self.encoder_preset
         save_config(config)
 
     def _save_video(self):
         """Save video with smudge operations applied."""
-        if not self.video_processor or not self.smudge_operations:
+        if not self.video_processor or not self.tracks:
             messagebox.showinfo("No Operations", "No smudge operations to save.")
             return
 
@@ -1455,10 +1892,23 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         if not filename:
             return
 
+        # Expand tracks into columnar per-frame rows once, up front, on the
+        # Tk thread so the export never reads tracks while they change
+        operation_store = OperationStore.from_tracks(self.tracks.values())
+        logger.info(
+            f"Exporting {len(operation_store)} smudge operations "
+            f"({operation_store.nbytes / 1024:.0f} KB)"
+        )
+
+        # Smart render and splitting at keyframes need ffprobe
+        single_pass = find_ffprobe() is None
+        if single_pass:
+            logger.warning("ffprobe not found; exporting in a single pass")
+
         # Show progress dialog
         progress_window = ctk.CTkToplevel(self)
         progress_window.title("Encoding Video")
-        progress_window.geometry("400x150")
+        progress_window.geometry("400x240" if single_pass else "400x210")
         progress_window.transient(self)
         progress_window.grab_set()
 
@@ -1474,7 +1924,33 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
         status_label = ctk.CTkLabel(progress_frame, text="Starting...", font=ctk.CTkFont(size=11), text_color="#8ea4c7")  # Mist Blue
         status_label.pack(pady=5)
 
-        progress_window.update()
+        if single_pass:
+            ctk.CTkLabel(
+                progress_frame,
+                text="ffprobe not found: exporting in a single pass",
+                font=ctk.CTkFont(size=11),
+                text_color="#8ea4c7",  # Mist Blue
+            ).pack()
+
+        # The export thread only records progress and its outcome; widgets
+        # are updated from the Tk thread by poll_export() below
+        progress = ExportProgress()
+        cancel_event = threading.Event()
+        outcome: Dict[str, object] = {}
+        finished = threading.Event()
+
+        def cancel_export():
+            if finished.is_set():
+                return
+            cancel_event.set()
+            cancel_btn.configure(state="disabled")
+            status_label.configure(text="Cancelling...")
+
+        cancel_btn = ctk.CTkButton(
+            progress_frame, text="Cancel", command=cancel_export, width=100, height=30, fg_color="#1a253a"  # Border subtle
+        )
+        cancel_btn.pack(pady=(5, 0))
+        progress_window.protocol("WM_DELETE_WINDOW", cancel_export)
 
         # Encode video in thread
         def encode_video():
@@ -1482,9 +1958,10 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
                 metadata = self.video_processor.metadata  # type: ignore[union-attr]
                 if not metadata:
                     raise ValueError("No video metadata available")
+                source_path = self.video_processor.video_path  # type: ignore[union-attr]
 
-                # Check disk space (rough estimate)
-                estimated_size = metadata.width * metadata.height * metadata.frame_count * 3 / (1024 * 1024)  # MB
+                # Check disk space (rough estimate: the CRF output rarely exceeds the source)
+                estimated_size = os.path.getsize(source_path) / (1024 * 1024)  # MB
                 try:
                     usage = shutil.disk_usage(os.path.dirname(filename))
                     free_space = usage.free / (1024 * 1024)  # MB
@@ -1503,211 +1980,20 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
                 except (OSError, PermissionError) as e:
                     raise ValueError(f"Cannot write to output location: {str(e)}")
 
-                # Create temporary video file first
-                temp_video_fd, temp_video = tempfile.mkstemp(suffix=".mp4", prefix="sightline_smudge_")
-                os.close(temp_video_fd)  # Close file descriptor, we'll use the path with VideoWriter
-
-                try:
-                    # Open video writer to temporary file
-                    fourcc = cv2.VideoWriter_fourcc(*"mp4v")  # type: ignore[attr-defined]
-                    writer = cv2.VideoWriter(temp_video, fourcc, metadata.fps, (metadata.width, metadata.height))
-
-                    if not writer.isOpened():
-                        raise ValueError("Could not initialize video writer. The codec may not be supported.")
-
-                    total_frames = metadata.frame_count
-                    frames_written = 0
-                    for frame_num in range(total_frames):
-                        # Check for cancellation (if we add cancel button)
-                        # Update progress
-                        progress = (frame_num + 1) / total_frames
-                        progress_bar.set(progress)
-                        status_label.configure(text=f"Processing frame {frame_num + 1} / {total_frames}")
-                        progress_window.update()
-
-                        # Get frame
-                        frame = self.frame_cache.get_frame(frame_num)  # type: ignore[union-attr]
-                        if frame is None:
-                            # Skip if frame cannot be read, but log warning
-                            logger.warning(f"Skipping frame {frame_num} (could not be read)")
-                            continue
-
-                        # Apply smudges for this frame
-                        if frame_num in self.smudge_operations:
-                            for operation in self.smudge_operations[frame_num]:
-                                try:
-                                    frame = apply_smudge_to_frame(frame, operation)
-                                except Exception as e:
-                                    logger.warning(f"Error applying smudge to frame {frame_num}: {e}")
-                                    # Continue with unmodified frame
-
-                        # Write frame
-                        writer.write(frame)
-                        frames_written += 1
-
-                    writer.release()
-
-                    if frames_written == 0:
-                        raise ValueError("No frames were written to the output video")
-                except Exception:
-                    # Clean up temporary file on error
-                    try:
-                        if os.path.exists(temp_video):
-                            os.remove(temp_video)
-                    except OSError:
-                        pass
-                    raise
-
-                # Verify temporary video exists and has reasonable size
-                if not os.path.exists(temp_video):
-                    raise ValueError("Temporary video file was not created")
-                temp_size = os.path.getsize(temp_video)
-                if temp_size < 1024:  # Less than 1KB is suspicious
-                    raise ValueError(f"Temporary video file is suspiciously small ({temp_size} bytes)")
-
-                # Try to preserve audio using ffmpeg
-                has_audio = False
-                temp_audio = None  # Will be set if audio extraction is attempted
-                try:
-                    # Check if ffmpeg is available
-                    # On Windows, use CREATE_NO_WINDOW to prevent console windows
-                    creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
-                    result = subprocess.run(
-                        ["ffmpeg", "-version"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        timeout=5,
-                        creationflags=creationflags,
-                    )
-                    if result.returncode != 0:
-                        raise FileNotFoundError("ffmpeg command failed")
-
-                    # Check if original video has audio stream
-                    status_label.configure(text="Checking for audio track...")
-                    progress_window.update()
-
-                    check_audio_cmd = [
-                        "ffprobe",
-                        "-v", "error",
-                        "-select_streams", "a:0",
-                        "-show_entries", "stream=codec_type",
-                        "-of", "csv=p=0",
-                        self.video_processor.video_path,  # type: ignore[union-attr]
-                    ]
-
-                    result = subprocess.run(
-                        check_audio_cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        timeout=10,
-                        creationflags=creationflags,
-                    )
-
-                    if result.returncode == 0 and result.stdout.strip():
-                        has_audio = True
-                        logger.info("Audio stream detected in original video")
-
-                except (FileNotFoundError, subprocess.TimeoutExpired) as e:
-                    logger.warning(f"Could not check for audio (ffmpeg may not be installed): {e}")
-                    has_audio = False
-                except Exception as e:
-                    logger.warning(f"Error checking for audio: {e}")
-                    has_audio = False
-
-                # If audio exists, combine it with the processed video
-                if has_audio:
-                    try:
-                        status_label.configure(text="Extracting audio and combining...")
-                        progress_window.update()
-
-                        # Create temporary audio file
-                        temp_audio_fd, temp_audio = tempfile.mkstemp(suffix=".m4a", prefix="sightline_audio_")
-                        os.close(temp_audio_fd)
-
-                        # Extract audio from original video
-                        extract_audio_cmd = [
-                            "ffmpeg",
-                            "-i", self.video_processor.video_path,  # type: ignore[union-attr]
-                            "-vn",  # No video
-                            "-acodec", "copy",  # Copy audio codec
-                            "-y",  # Overwrite output file
-                            temp_audio,
-                        ]
-
-                        result = subprocess.run(
-                            extract_audio_cmd,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            timeout=60,
-                            creationflags=creationflags,
-                        )
-
-                        if result.returncode != 0:
-                            logger.warning(f"Failed to extract audio: {result.stderr.decode()}")
-                            has_audio = False
-                        elif not os.path.exists(temp_audio) or os.path.getsize(temp_audio) < 1024:
-                            logger.warning("Extracted audio file is missing or too small")
-                            has_audio = False
-                        else:
-                            # Combine video and audio
-                            status_label.configure(text="Combining video and audio...")
-                            progress_window.update()
-
-                            combine_cmd = [
-                                "ffmpeg",
-                                "-i", temp_video,
-                                "-i", temp_audio,
-                                "-c:v", "copy",  # Copy video codec
-                                "-c:a", "aac",  # Encode audio as AAC for compatibility
-                                "-shortest",  # Finish encoding when the shortest input stream ends
-                                "-y",  # Overwrite output file
-                                filename,
-                            ]
-
-                            result = subprocess.run(
-                                combine_cmd,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                timeout=300,  # 5 minutes max
-                                creationflags=creationflags,
-                            )
-
-                            if result.returncode == 0 and os.path.exists(filename):
-                                logger.info("Successfully combined video and audio")
-                                # Clean up temporary files
-                                try:
-                                    os.remove(temp_video)
-                                    os.remove(temp_audio)
-                                except OSError as e:
-                                    logger.warning(f"Could not remove temporary files: {e}")
-                            else:
-                                logger.warning(f"Failed to combine video and audio: {result.stderr.decode()}")
-                                # Fall back to video without audio
-                                has_audio = False
-                                if os.path.exists(filename):
-                                    os.remove(filename)
-
-                    except subprocess.TimeoutExpired:
-                        logger.error("Audio processing timed out")
-                        has_audio = False
-                    except Exception as e:
-                        logger.error(f"Error processing audio: {e}", exc_info=True)
-                        has_audio = False
-
-                # If no audio or audio processing failed, copy video without audio to final location
-                if not has_audio:
-                    if os.path.exists(temp_video):
-                        shutil.copy2(temp_video, filename)
-                        logger.info("Saved video without audio track")
-
-                # Clean up temporary files (only if they still exist)
-                # Note: If audio combination succeeded, temp_video and temp_audio were already removed
-                for temp_file in [temp_video, temp_audio]:
-                    if temp_file and os.path.exists(temp_file):
-                        try:
-                            os.remove(temp_file)
-                        except OSError as e:
-                            logger.warning(f"Could not remove temporary file {temp_file}: {e}")
+                encoder_settings = resolve_encoder_preset(self.encoder_preset, source_path)
+
+                # Smart render re-encodes only GOPs with smudges; a full export
+                # splits the video across worker processes at keyframes
+                export = smart_export_smudged_video if self.smart_render else parallel_export_smudged_video
+                result = export(
+                    source_path,
+                    filename,
+                    operation_store,
+                    settings=encoder_settings,
+                    workers=self.export_workers,
+                    progress_callback=progress.update,
+                    cancel_event=cancel_event,
+                )
 
                 # Verify final output file exists and has reasonable size
                 if not os.path.exists(filename):
@@ -1716,27 +2002,61 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
                 if output_size < 1024:  # Less than 1KB is suspicious
                     raise ValueError(f"Output file is suspiciously small ({output_size} bytes)")
 
-                progress_window.after(0, lambda: progress_window.destroy())
-                if has_audio:
-                    messagebox.showinfo("Success", f"Video saved successfully with audio:\n{filename}")
-                else:
-                    messagebox.showinfo("Success", f"Video saved successfully:\n{filename}\n\nNote: Audio track was not preserved (original video may not have audio, or ffmpeg is not available).")
-
-            except ValueError as e:
+                outcome["result"] = result
+            except ExportCancelled:
+                logger.info("Export cancelled")
+                outcome["cancelled"] = True
+            except (ValueError, ExportError) as e:
                 logger.error(f"Error encoding video: {e}")
-                progress_window.after(0, lambda: progress_window.destroy())
-                messagebox.showerror("Error", f"Failed to encode video:\n{str(e)}")
+                outcome["error"] = f"Failed to encode video:\n{str(e)}"
             except Exception as e:
                 logger.error(f"Unexpected error encoding video: {e}", exc_info=True)
-                progress_window.after(0, lambda: progress_window.destroy())
-                messagebox.showerror("Error", f"Unexpected error encoding video:\n{str(e)}")
+                outcome["error"] = f"Unexpected error encoding video:\n{str(e)}"
+            finally:
+                finished.set()
+
+        shown_status: List[Optional[str]] = [None]
+
+        def poll_export():
+            if not progress_window.winfo_exists():
+                return
+
+            if finished.is_set():
+                progress_window.destroy()
+                if "result" in outcome:
+                    result = outcome["result"]
+                    if result.has_audio:  # type: ignore[attr-defined]
+                        messagebox.showinfo("Success", f"Video saved successfully with audio:\n{filename}", parent=self)
+                    else:
+                        messagebox.showinfo("Success", f"Video saved successfully:\n{filename}\n\nNote: The original video has no audio track.", parent=self)
+                elif "error" in outcome:
+                    messagebox.showerror("Error", str(outcome["error"]), parent=self)
+                else:
+                    messagebox.showinfo("Export Cancelled", "The export was cancelled.", parent=self)
+                return
+
+            if not cancel_event.is_set():
+                frames_done, total_frames, fps, eta = progress.snapshot()
+                status = f"Frame {frames_done} / {total_frames}"
+                if fps > 0:
+                    status += f"  |  {fps:.1f} fps"
+                if eta is not None:
+                    status += f"  |  ETA {format_duration(eta)}"
+                if status != shown_status[0]:
+                    shown_status[0] = status
+                    progress_bar.set(frames_done / max(total_frames, 1))
+                    status_label.configure(text=status)
+
+            progress_window.after(EXPORT_PROGRESS_INTERVAL_MS, poll_export)
 
         encode_thread = threading.Thread(target=encode_video, daemon=True)
         encode_thread.start()
+        progress_window.after(EXPORT_PROGRESS_INTERVAL_MS, poll_export)
 
     def _on_cancel(self):
         """Handle cancel/close."""
-        if self.smudge_operations:
+        # With a project journal the session is autosaved and can be resumed
+        if self.tracks and not self.project_journal:
             if not messagebox.askyesno("Unsaved Changes", "You have unsaved smudge operations. Close anyway?"):
                 return
 
@@ -1747,6 +2067,11 @@ class FaceSmudgeWindow(ctk.CTkToplevel):
             # Wait a bit for thread to finish
             self.playback_thread.join(timeout=0.5)
 
+        # Write any pending autosave records
+        if self.project_journal:
+            self.project_journal.close()
+            self.project_journal = None
+
         # Clean up video processor
         if self.video_processor:
             self.video_processor.close()
@@ -0,0 +1,98 @@
+"""Registry of the files queued in a batch view.
+
+Every queued file gets a small integer id that the worker threads put in
+their queue messages, so the UI thread finds the file for each progress
+line with a dictionary lookup instead of scanning the whole queue. Files are
+also indexed by normalized path, which makes the duplicate check when
+adding files O(1) and catches the same file added through different
+spellings of its path, and by position, so the virtualised file list can
+fetch just the rows it shows.
+"""
+
+import itertools
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+FileInfo = Dict[str, Any]
+
+
+def normalize_path(path: str) -> str:
+    """Normalize a file path for duplicate detection."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+class JobRegistry:
+    """Ordered collection of queued files with lookup by id and by path.
+
+    Iterating yields the file info dictionaries in the order they were added.
+    Each added file info gets its id stored under the "id" key.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._jobs: Dict[int, FileInfo] = {}
+        self._order: List[int] = []
+        self._ids_by_path: Dict[str, int] = {}
+        self._ids = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __iter__(self) -> Iterator[FileInfo]:
+        return iter([self._jobs[job_id] for job_id in self._order])
+
+    def __contains__(self, path: str) -> bool:
+        return normalize_path(path) in self._ids_by_path
+
+    def add(self, file_info: FileInfo) -> int:
+        """Add a file to the end of the queue.
+
+        Args:
+            file_info: File information (must have a "path").
+
+        Returns:
+            The file's id.
+
+        Raises:
+            ValueError: If the file is already queued.
+        """
+        key = normalize_path(file_info["path"])
+        if key in self._ids_by_path:
+            raise ValueError(f"File already queued: {file_info['path']}")
+        job_id = next(self._ids)
+        file_info["id"] = job_id
+        self._jobs[job_id] = file_info
+        self._order.append(job_id)
+        self._ids_by_path[key] = job_id
+        return job_id
+
+    def get(self, job_id: int) -> Optional[FileInfo]:
+        """Get a file by id, or None if it is not queued."""
+        return self._jobs.get(job_id)
+
+    def slice(self, start: int, stop: int) -> List[FileInfo]:
+        """Get the files at positions ``start`` to ``stop`` (exclusive)."""
+        return [self._jobs[job_id] for job_id in self._order[start:stop]]
+
+    def find(self, path: str) -> Optional[FileInfo]:
+        """Get a file by path, or None if it is not queued."""
+        job_id = self._ids_by_path.get(normalize_path(path))
+        return self._jobs.get(job_id) if job_id is not None else None
+
+    def remove(self, job_id: int) -> Optional[FileInfo]:
+        """Remove a file from the queue.
+
+        Returns:
+            The removed file info, or None if it was not queued.
+        """
+        file_info = self._jobs.pop(job_id, None)
+        if file_info is not None:
+            self._order.remove(job_id)
+            self._ids_by_path.pop(normalize_path(file_info["path"]), None)
+        return file_info
+
+    def clear(self):
+        """Remove all files."""
+        self._jobs.clear()
+        self._order.clear()
+        self._ids_by_path.clear()
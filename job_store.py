@@ -0,0 +1,207 @@
+"""Persistent batch job queue.
+
+Batch queues are mirrored to a local SQLite database so an interrupted
+batch (crash, reboot, force quit) can be resumed without re-adding files or
+re-running files that already finished. Each job row holds the file's
+state, output path, a snapshot of the configuration it was queued with,
+timings and its error log.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config_manager import get_config_path
+
+logger = logging.getLogger(__name__)
+
+JOB_STORE_FILENAME = "batch_jobs.db"
+JOB_STORE_VERSION = 1
+
+# Job states (the same values as the batch views' file statuses)
+PENDING = "pending"
+PROCESSING = "processing"
+SUCCESS = "success"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    queue TEXT NOT NULL,
+    path TEXT NOT NULL,
+    output_path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    config TEXT NOT NULL,
+    added_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    log TEXT NOT NULL DEFAULT '',
+    UNIQUE (queue, path)
+);
+CREATE INDEX IF NOT EXISTS jobs_queue_status ON jobs (queue, status);
+"""
+
+
+def get_job_store_path() -> Path:
+    """Get the path of the job database, next to the configuration file."""
+    return get_config_path().parent / JOB_STORE_FILENAME
+
+
+@dataclass
+class JobRecord:
+    """A persisted batch job."""
+
+    id: int
+    queue: str
+    path: str
+    output_path: str
+    status: str
+    config: Dict[str, Any]
+    added_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+    attempts: int
+    log: str
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """Seconds the last attempt took, or None if it has not finished."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+class JobStore:
+    """SQLite-backed store of batch jobs.
+
+    One connection is shared by the UI thread and the batch worker threads
+    and serialized with a lock; writes are rare (a few per job) and each is
+    committed immediately so a crash loses at most the job in flight.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Open (or create) the job database.
+
+        Args:
+            path: Database file (defaults to get_job_store_path()).
+        """
+        self.path = Path(path) if path else get_job_store_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {JOB_STORE_VERSION}")
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def add(self, queue: str, path: str, output_path: str, config: Dict[str, Any]) -> int:
+        """Add a pending job, or reset an existing job for the same file.
+
+        Args:
+            queue: Name of the batch queue (one per view).
+            path: Input file.
+            output_path: Output file.
+            config: Configuration snapshot (must be JSON serializable).
+
+        Returns:
+            Id of the job.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO jobs (queue, path, output_path, status, config, added_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (queue, path) DO UPDATE SET
+                    output_path = excluded.output_path, status = excluded.status,
+                    config = excluded.config, added_at = excluded.added_at,
+                    started_at = NULL, finished_at = NULL, attempts = 0, log = ''
+                """,
+                (queue, path, output_path, PENDING, json.dumps(config), time.time()),
+            )
+            row = self._conn.execute(
+                "SELECT id FROM jobs WHERE queue = ? AND path = ?", (queue, path)
+            ).fetchone()
+        return int(row["id"])
+
+    def mark_started(self, job_id: int, config: Dict[str, Any]):
+        """Record that a job started, with the configuration it runs with."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                UPDATE jobs SET status = ?, config = ?, started_at = ?, finished_at = NULL,
+                    attempts = attempts + 1
+                WHERE id = ?
+                """,
+                (PROCESSING, json.dumps(config), time.time(), job_id),
+            )
+
+    def mark_finished(self, job_id: int, status: str, log: str = ""):
+        """Record the outcome of a job.
+
+        Args:
+            job_id: Id of the job.
+            status: Final status (SUCCESS or FAILED).
+            log: Error log of the job.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, log = ? WHERE id = ?",
+                (status, time.time(), log, job_id),
+            )
+
+    def remove(self, job_id: int):
+        """Remove a job."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def jobs(self, queue: str) -> List[JobRecord]:
+        """Get all jobs of a queue in the order they were added.
+
+        Jobs left in the processing state (the app exited mid-job) are
+        reported as pending.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE queue = ? ORDER BY id", (queue,)
+            ).fetchall()
+
+        records = []
+        for row in rows:
+            try:
+                config = json.loads(row["config"])
+            except ValueError:
+                config = {}
+            status = row["status"]
+            records.append(
+                JobRecord(
+                    id=row["id"],
+                    queue=row["queue"],
+                    path=row["path"],
+                    output_path=row["output_path"],
+                    status=PENDING if status == PROCESSING else status,
+                    config=config,
+                    added_at=row["added_at"],
+                    started_at=row["started_at"],
+                    finished_at=row["finished_at"],
+                    attempts=row["attempts"],
+                    log=row["log"],
+                )
+            )
+        return records
+
+    def clear(self, queue: str):
+        """Remove all jobs of a queue."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM jobs WHERE queue = ?", (queue,))
@@ -0,0 +1,179 @@
+"""Timeouts, failure classification and retries for batch jobs.
+
+A watchdog thread kills a job's process when it exceeds its wall-clock
+limit or stops reporting progress (deface prints a progress line for every
+frame, so no progress means it hung). Failed jobs are classified from their exit
+code and the tail of their output, and jobs that failed for a reason that
+may be transient (out of memory, killed, stalled) are retried with
+exponential backoff, so a single bad job does not hold a batch slot forever
+or need a manual re-run.
+"""
+
+import logging
+import re
+import subprocess
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Defaults of the deface_config settings
+DEFAULT_JOB_TIMEOUT = 0  # Minutes per attempt, 0 = no limit
+DEFAULT_STALL_TIMEOUT = 300  # Seconds without progress, 0 = no limit
+DEFAULT_MAX_RETRIES = 2
+
+# Delay before the first retry, doubled for each further retry
+RETRY_BACKOFF_BASE = 10.0
+RETRY_BACKOFF_MAX = 120.0
+
+# Seconds between watchdog checks
+WATCHDOG_INTERVAL = 1.0
+
+# Lines of output kept for classifying a failure
+FAILURE_TAIL_LINES = 50
+
+# Failure kinds
+DECODER_ERROR = "decoder error"
+OUT_OF_MEMORY = "out of memory"
+KILLED = "killed"
+TIMED_OUT = "timed out"
+STALLED = "stalled"
+PROCESS_ERROR = "error"
+
+# Failures that would happen again on retry
+PERMANENT_FAILURES = {DECODER_ERROR, TIMED_OUT}
+
+_OUT_OF_MEMORY_PATTERNS = re.compile(
+    r"MemoryError|out of memory|cannot allocate memory|bad_alloc|failed to allocate",
+    re.IGNORECASE,
+)
+_DECODER_ERROR_PATTERNS = re.compile(
+    r"invalid data found when processing input|moov atom not found|error while decoding"
+    r"|could not find codec|decoder .* not found|cannot identify image file|could not read frame",
+    re.IGNORECASE,
+)
+
+# Windows NTSTATUS exit codes of processes that ran out of memory
+_WINDOWS_OUT_OF_MEMORY_CODES = {0xC0000017, 0xC000012D}
+
+# Exit codes of processes killed by SIGKILL/SIGTERM, as reported by shells
+_SHELL_KILLED_CODES = {128 + 9, 128 + 15}
+
+
+def classify_failure(return_code: Optional[int], output: str) -> str:
+    """Classify why a job's process failed.
+
+    Args:
+        return_code: Exit code of the process (negative for a signal on POSIX).
+        output: Tail of the process output (stdout and stderr).
+
+    Returns:
+        One of DECODER_ERROR, OUT_OF_MEMORY, KILLED or PROCESS_ERROR.
+    """
+    if _OUT_OF_MEMORY_PATTERNS.search(output) or return_code in _WINDOWS_OUT_OF_MEMORY_CODES:
+        return OUT_OF_MEMORY
+    if _DECODER_ERROR_PATTERNS.search(output):
+        return DECODER_ERROR
+    if return_code is not None and (return_code < 0 or return_code in _SHELL_KILLED_CODES):
+        # Usually the kernel's OOM killer when nothing else explains it
+        return KILLED
+    return PROCESS_ERROR
+
+
+def is_retryable(failure: Optional[str]) -> bool:
+    """Check whether a failure may be transient and worth retrying."""
+    return failure is not None and failure not in PERMANENT_FAILURES
+
+
+def retry_delay(attempt: int) -> float:
+    """Get the backoff in seconds before a retry.
+
+    Args:
+        attempt: Number of the retry (1 for the first).
+
+    Returns:
+        Seconds to wait.
+    """
+    return float(min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** (attempt - 1)))
+
+
+class ProcessWatchdog:
+    """Kill a process that runs too long or stops reporting progress.
+
+    Call touch() whenever the process reports progress, and stop() once it has
+    exited. After the process was killed, ``expired`` holds TIMED_OUT or
+    STALLED.
+    """
+
+    def __init__(
+        self,
+        proc: subprocess.Popen,
+        timeout: Optional[float] = None,
+        stall_timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        interval: float = WATCHDOG_INTERVAL,
+    ):
+        """Initialize the watchdog.
+
+        Args:
+            proc: Process to watch.
+            timeout: Seconds the process may run, or None/0 for no limit.
+            stall_timeout: Seconds the process may go without progress, or
+                None/0 for no limit.
+            clock: Monotonic clock.
+            interval: Seconds between checks.
+        """
+        self.proc = proc
+        self.timeout = timeout or None
+        self.stall_timeout = stall_timeout or None
+        self.expired: Optional[str] = None
+        self._clock = clock
+        self._interval = interval
+        self._started_at = clock()
+        self._last_progress = self._started_at
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start watching on a background thread (no-op without limits)."""
+        if self.timeout is None and self.stall_timeout is None:
+            return
+        self._thread = threading.Thread(target=self._run, name="watchdog", daemon=True)
+        self._thread.start()
+
+    def touch(self):
+        """Record that the process reported progress."""
+        self._last_progress = self._clock()
+
+    def stop(self):
+        """Stop watching."""
+        self._stopped.set()
+
+    def check(self) -> Optional[str]:
+        """Check the limits, killing the process if one is exceeded.
+
+        Returns:
+            TIMED_OUT or STALLED if the process was killed, otherwise None.
+        """
+        now = self._clock()
+        if self.timeout is not None and now - self._started_at > self.timeout:
+            reason = TIMED_OUT
+        elif self.stall_timeout is not None and now - self._last_progress > self.stall_timeout:
+            reason = STALLED
+        else:
+            return None
+
+        logger.warning(f"Killing process {self.proc.pid}: {reason}")
+        self.expired = reason
+        try:
+            self.proc.kill()
+        except OSError as e:
+            logger.debug(f"Could not kill process {self.proc.pid}: {e}")
+        return reason
+
+    def _run(self):
+        """Check the limits until stopped or the process is killed."""
+        while not self._stopped.wait(self._interval):
+            if self.proc.poll() is not None or self.check():
+                return
@@ -70,6 +70,20 @@ if getattr(sys, "frozen", False):
     # Speechbrain is now handled by collect_submodules in the spec file
     # No patching needed if modules are properly included
 
+# Headless rendering of Face Smudge projects, and the parallel export workers
+# that the packaged app runs with its own executable (see
+# smudge_export.segment_worker_command), must not import Tk, so they are
+# dispatched before the GUI imports below.
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["render-smudge"]:
+        from smudge_render import main as render_smudge_main
+
+        sys.exit(render_smudge_main(sys.argv[2:]))
+    if sys.argv[1:2] == ["export-segment"]:
+        from smudge_worker import main as export_segment_main
+
+        sys.exit(export_segment_main(sys.argv[2:]))
+
 import argparse
 import logging
 import shutil
@@ -338,7 +352,10 @@ def _find_deface_command() -> List[str]:
 
 
 def run_deface(
-    input_path: str, output_path: str, config: Optional[Dict[str, Any]] = None
+    input_path: str,
+    output_path: str,
+    config: Optional[Dict[str, Any]] = None,
+    merge_stderr: bool = False,
 ) -> subprocess.Popen:
     """Run the deface command as a subprocess.
 
@@ -346,6 +363,8 @@ def run_deface(
         input_path: Path to the input image or video file.
         output_path: Path where the output file should be saved.
         config: Optional dictionary containing deface configuration options.
+        merge_stderr: Send stderr to the stdout pipe so a single reader
+            can consume all output.
 
     Returns:
         A subprocess.Popen object representing the running process.
@@ -367,7 +386,7 @@ def run_deface(
         proc = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
             text=True,
             creationflags=creationflags,
         )
@@ -606,7 +625,11 @@ class SightlineApp(ctk.CTk, TkinterDnD.Tk):
         return get_desktop_path()
 
     def run_deface(
-        self, input_path: str, output_path: str, config: Optional[Dict[str, Any]] = None
+        self,
+        input_path: str,
+        output_path: str,
+        config: Optional[Dict[str, Any]] = None,
+        merge_stderr: bool = False,
     ) -> subprocess.Popen:
         """Run the deface command as a subprocess.
 
@@ -614,6 +637,8 @@ class SightlineApp(ctk.CTk, TkinterDnD.Tk):
             input_path: Path to the input image or video file.
             output_path: Path where the output file should be saved.
             config: Optional dictionary containing deface configuration options.
+            merge_stderr: Send stderr to the stdout pipe so a single reader
+                can consume all output.
 
         Returns:
             A subprocess.Popen object representing the running process.
@@ -622,7 +647,18 @@ class SightlineApp(ctk.CTk, TkinterDnD.Tk):
             FileNotFoundError: If the deface command cannot be found.
             OSError: If the subprocess cannot be started.
         """
-        return run_deface(input_path, output_path, config)
+        return run_deface(input_path, output_path, config, merge_stderr)
+
+    def build_deface_args(self, config: Dict[str, Any]) -> List[str]:
+        """Build deface command-line arguments from a configuration.
+
+        Args:
+            config: Dictionary containing Sightline configuration options.
+
+        Returns:
+            List of command-line argument strings.
+        """
+        return build_deface_args(config)
 
     def _save_config(self):
         """Save current configuration to disk."""
@@ -0,0 +1,275 @@
+"""Media probing with ffprobe.
+
+Locates the ffmpeg/ffprobe executables and probes media files for their
+duration, resolution and frame count. The batch views use the probes to
+estimate how expensive each queued file is, so the longest jobs can be
+started first instead of being left to run alone at the end of a batch.
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Concurrent ffprobe processes used for background probing
+PROBE_WORKERS = 4
+
+# Seconds before an ffprobe call is abandoned
+PROBE_TIMEOUT = 30
+
+# Cost model: one second of cost is REFERENCE_FPS frames at REFERENCE_PIXELS
+REFERENCE_PIXELS = 1920 * 1080
+REFERENCE_FPS = 30.0
+
+# Cost of files that could not be probed, per byte (about 1 second per MB,
+# which matches a typical 1080p30 video)
+FALLBACK_COST_PER_BYTE = 1.0 / (1024 * 1024)
+
+
+def find_ffmpeg() -> Optional[str]:
+    """Locate an ffmpeg executable.
+
+    Prefers the ffmpeg bundled with imageio-ffmpeg (shipped with the app),
+    then falls back to ffmpeg on PATH.
+
+    Returns:
+        Path to ffmpeg, or None if it is not available.
+    """
+    try:
+        import imageio_ffmpeg
+
+        ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
+        if ffmpeg_exe and os.path.isfile(ffmpeg_exe):
+            return str(ffmpeg_exe)
+    except Exception as e:
+        logger.debug(f"Bundled ffmpeg not available: {e}")
+    return shutil.which("ffmpeg")
+
+
+def find_ffprobe() -> Optional[str]:
+    """Locate an ffprobe executable.
+
+    imageio-ffmpeg ships only ffmpeg, so the app bundles ffprobe separately
+    (see sightline.spec). Looks in the bundle first, then next to the ffmpeg
+    found by find_ffmpeg(), then on PATH.
+
+    Returns:
+        Path to ffprobe, or None if it is not available.
+    """
+    bundle_dir = getattr(sys, "_MEIPASS", None)
+    if bundle_dir:
+        name = "ffprobe.exe" if sys.platform == "win32" else "ffprobe"
+        candidate = os.path.join(bundle_dir, name)
+        if os.path.isfile(candidate):
+            return candidate
+
+    ffmpeg = find_ffmpeg()
+    if ffmpeg:
+        directory, name = os.path.split(ffmpeg)
+        candidate = os.path.join(directory, name.replace("ffmpeg", "ffprobe", 1))
+        if candidate != ffmpeg and os.path.isfile(candidate):
+            return candidate
+    return shutil.which("ffprobe")
+
+
+def run_ffprobe(ffprobe: str, args: List[str], timeout: float) -> Optional[str]:
+    """Run ffprobe and return its stdout, or None on failure."""
+    creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    try:
+        result = subprocess.run(
+            [ffprobe, "-v", "error"] + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=timeout,
+            creationflags=creationflags,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"ffprobe failed: {e}")
+        return None
+    if result.returncode != 0:
+        logger.warning(f"ffprobe failed: {result.stderr.decode(errors='replace').strip()}")
+        return None
+    return result.stdout.decode(errors="replace")
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    """Duration, resolution and frame count of a media file."""
+
+    duration: float  # Seconds (0 for still images)
+    width: int
+    height: int
+    frame_count: int
+
+    @property
+    def cost(self) -> float:
+        """Estimated processing cost in seconds at the reference throughput."""
+        scale = max(self.width * self.height, 1) / REFERENCE_PIXELS
+        return self.frame_count * scale / REFERENCE_FPS
+
+
+def parse_media_info(output: str) -> Optional[MediaInfo]:
+    """Parse ffprobe JSON output (see probe_media) into a MediaInfo."""
+    try:
+        info = json.loads(output)
+        stream = info["streams"][0]
+        container = info.get("format", {})
+
+        duration = float(container.get("duration") or stream.get("duration") or 0.0)
+        frame_count = int(stream.get("nb_frames") or 0)
+        if frame_count <= 0 and duration > 0:
+            fps = Fraction(stream.get("avg_frame_rate") or "0/1")
+            frame_count = int(round(duration * float(fps))) if fps > 0 else 0
+
+        return MediaInfo(
+            duration=duration,
+            width=int(stream["width"]),
+            height=int(stream["height"]),
+            frame_count=max(frame_count, 1),  # Still images are one frame
+        )
+    except (KeyError, IndexError, ValueError, ZeroDivisionError) as e:
+        logger.debug(f"Could not parse ffprobe output: {e}")
+        return None
+
+
+def probe_media(ffprobe: str, path: str) -> Optional[MediaInfo]:
+    """Probe the first video stream (or image) of a file.
+
+    Args:
+        ffprobe: Path to ffprobe.
+        path: File to probe.
+
+    Returns:
+        MediaInfo, or None if the file could not be probed.
+    """
+    output = run_ffprobe(
+        ffprobe,
+        [
+            "-select_streams", "v:0",
+            "-show_entries", "stream=width,height,nb_frames,avg_frame_rate,duration:format=duration",
+            "-of", "json",
+            path,
+        ],
+        timeout=PROBE_TIMEOUT,
+    )
+    if output is None:
+        return None
+    return parse_media_info(output)
+
+
+def fallback_cost(path: str) -> float:
+    """Estimate the cost of a file that has not been probed from its size."""
+    try:
+        return os.path.getsize(path) * FALLBACK_COST_PER_BYTE
+    except OSError:
+        return 0.0
+
+
+def format_cost(seconds: float) -> str:
+    """Format an estimated cost as a short duration (e.g. "45s", "2m 30s", "1h 05m")."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+
+
+class MediaProber:
+    """Probe files on a background thread pool, caching the results.
+
+    Results are cached by path, size and modification time, so re-adding a
+    file does not probe it again unless it changed. Files that cannot be
+    probed are cached as None.
+    """
+
+    def __init__(self, workers: int = PROBE_WORKERS):
+        """Initialize the prober.
+
+        Args:
+            workers: Number of concurrent ffprobe processes.
+        """
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="probe")
+        self._cache: Dict[Tuple[str, int, int], Optional[MediaInfo]] = {}
+        self._lock = threading.Lock()
+        self._ffprobe: Optional[str] = None
+        self._ffprobe_searched = False
+
+    def _cache_key(self, path: str) -> Optional[Tuple[str, int, int]]:
+        """Get the cache key of a file, or None if it cannot be read."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+    def _find_ffprobe(self) -> Optional[str]:
+        """Locate ffprobe once."""
+        with self._lock:
+            if not self._ffprobe_searched:
+                self._ffprobe = find_ffprobe()
+                self._ffprobe_searched = True
+                if not self._ffprobe:
+                    logger.warning("ffprobe not found; queued files will be ordered by size")
+            return self._ffprobe
+
+    @property
+    def available(self) -> bool:
+        """Whether files can be probed (ffprobe was found)."""
+        return self._find_ffprobe() is not None
+
+    def get(self, path: str) -> Optional[MediaInfo]:
+        """Get the cached probe of a file, or None if not (successfully) probed."""
+        key = self._cache_key(path)
+        with self._lock:
+            return self._cache.get(key) if key else None
+
+    def probe(self, path: str) -> Optional[MediaInfo]:
+        """Probe a file synchronously, using the cache.
+
+        Args:
+            path: File to probe.
+
+        Returns:
+            MediaInfo, or None if the file could not be probed.
+        """
+        key = self._cache_key(path)
+        if key is None:
+            return None
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+        ffprobe = self._find_ffprobe()
+
+        info = probe_media(ffprobe, path) if ffprobe else None
+        with self._lock:
+            self._cache[key] = info
+        return info
+
+    def probe_async(self, path: str, callback: Callable[[str, Optional[MediaInfo]], None]):
+        """Probe a file in the background.
+
+        Args:
+            path: File to probe.
+            callback: Called with (path, MediaInfo or None) on a pool thread.
+        """
+        def run():
+            try:
+                callback(path, self.probe(path))
+            except Exception as e:
+                logger.error(f"Error probing {path}: {e}", exc_info=True)
+
+        self._pool.submit(run)
+
+    def shutdown(self):
+        """Stop the pool without waiting for running probes."""
+        self._pool.shutdown(wait=False)
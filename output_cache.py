@@ -0,0 +1,190 @@
+"""Content-addressed cache of batch outputs.
+
+A manifest records every output the batch views produced, keyed by the
+input's content fingerprint (size plus sampled blocks, see
+smudge_project.fingerprint_file) and a hash of the effective processing
+arguments. Before a file is processed, the manifest is consulted: if the
+same content was already processed with the same arguments and that output
+still exists, the job is skipped (same output path) or the existing output
+is linked to the new output path (e.g. the same file queued under another
+name) instead of running deface again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from config_manager import get_config_path
+from smudge_project import fingerprint_file
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_CACHE_FILENAME = "output_manifest.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outputs (
+    fingerprint TEXT NOT NULL,
+    args_hash TEXT NOT NULL,
+    output_path TEXT NOT NULL,
+    output_size INTEGER NOT NULL,
+    output_mtime_ns INTEGER NOT NULL,
+    source_path TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (fingerprint, args_hash, output_path)
+);
+"""
+
+
+def get_output_cache_path() -> Path:
+    """Get the path of the output manifest, next to the configuration file."""
+    return get_config_path().parent / OUTPUT_CACHE_FILENAME
+
+
+def hash_args(args: List[str]) -> str:
+    """Hash the effective processing arguments of a job."""
+    return hashlib.sha256(json.dumps(args).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedOutput:
+    """A previously produced output that can be reused."""
+
+    output_path: str
+    source_path: str
+
+
+class OutputCache:
+    """Manifest of completed outputs keyed by input content and arguments."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """Open (or create) the manifest.
+
+        Args:
+            path: Database file (defaults to get_output_cache_path()).
+        """
+        self.path = Path(path) if path else get_output_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the manifest."""
+        with self._lock:
+            self._conn.close()
+
+    def lookup(self, fingerprint: str, args_hash: str, output_path: Optional[str] = None) -> Optional[CachedOutput]:
+        """Find a still-valid output for an input fingerprint and arguments.
+
+        Outputs that were deleted or modified since they were recorded are
+        dropped from the manifest.
+
+        Args:
+            fingerprint: Content fingerprint of the input.
+            args_hash: Hash of the processing arguments (see hash_args).
+            output_path: Preferred output; returned if it is valid.
+
+        Returns:
+            A reusable output, or None.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT output_path, output_size, output_mtime_ns, source_path FROM outputs "
+                "WHERE fingerprint = ? AND args_hash = ?",
+                (fingerprint, args_hash),
+            ).fetchall()
+
+        valid: List[CachedOutput] = []
+        for path, size, mtime_ns, source_path in rows:
+            try:
+                stat = os.stat(path)
+                unchanged = stat.st_size == size and stat.st_mtime_ns == mtime_ns
+            except OSError:
+                unchanged = False
+            if unchanged:
+                valid.append(CachedOutput(output_path=path, source_path=source_path))
+            else:
+                with self._lock, self._conn:
+                    self._conn.execute(
+                        "DELETE FROM outputs WHERE fingerprint = ? AND args_hash = ? AND output_path = ?",
+                        (fingerprint, args_hash, path),
+                    )
+
+        for cached in valid:
+            if output_path and os.path.abspath(cached.output_path) == os.path.abspath(output_path):
+                return cached
+        return valid[0] if valid else None
+
+    def record(self, fingerprint: str, args_hash: str, source_path: str, output_path: str):
+        """Record a completed output.
+
+        Args:
+            fingerprint: Content fingerprint of the input.
+            args_hash: Hash of the processing arguments.
+            source_path: Input file.
+            output_path: Output file (must exist).
+        """
+        stat = os.stat(output_path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO outputs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    fingerprint,
+                    args_hash,
+                    os.path.abspath(output_path),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    os.path.abspath(source_path),
+                    time.time(),
+                ),
+            )
+
+
+def fingerprint_input(path: str) -> Optional[str]:
+    """Fingerprint an input file, or None if it cannot be read."""
+    try:
+        return fingerprint_file(path)
+    except OSError as e:
+        logger.warning(f"Could not fingerprint {path}: {e}")
+        return None
+
+
+def link_output(cached_path: str, output_path: str) -> str:
+    """Make an existing output available at a new path.
+
+    Hard-links when possible (no extra disk space), otherwise copies. The
+    new file is put in place atomically.
+
+    Args:
+        cached_path: Existing output.
+        output_path: Where the output is needed.
+
+    Returns:
+        "linked" or "copied".
+    """
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        try:
+            os.link(cached_path, temp_path)
+            method = "linked"
+        except OSError:
+            shutil.copy2(cached_path, temp_path)
+            method = "copied"
+        os.replace(temp_path, output_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return method
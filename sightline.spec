@@ -7,6 +7,7 @@ This spec is responsible for bundling the GUI *and* a small, internal
 
 import sys
 import os
+import shutil
 import importlib.util
 from pathlib import Path
 from PyInstaller.utils.hooks import copy_metadata, collect_data_files, collect_submodules, get_package_paths
@@ -316,6 +317,17 @@ if flaticons_dir.exists():
     if license_file.exists():
         flaticons_files.append((str(license_file), "flaticons/license"))
 
+# Bundle ffprobe for media probing, smart render and keyframe splitting.
+# imageio-ffmpeg only ships ffmpeg, so ffprobe comes from the build
+# environment (conda-forge's ffmpeg package, see `make install-dev`).
+ffprobe_binaries = []
+ffprobe_path = shutil.which("ffprobe")
+if ffprobe_path:
+    ffprobe_binaries.append((ffprobe_path, '.'))
+    print(f"✓ Found ffprobe at: {ffprobe_path}")
+else:
+    print("✗ ffprobe not found; the app will order batches by file size and export in a single pass")
+
 # Collect customtkinter data files (themes, assets, etc.)
 # This is needed for the default "blue" theme fallback
 customtkinter_datas = collect_data_files("customtkinter")
@@ -324,7 +336,7 @@ print(f"✓ Collected {len(customtkinter_datas)} customtkinter data files")
 a = Analysis(
     [entry_script, cli_entry_script],
     pathex=[],
-    binaries=[],
+    binaries=ffprobe_binaries,
     datas=extra_datas + deface_datas + lightning_datas + lightning_metadata + lightning_fabric_datas + lightning_fabric_metadata + transformers_datas + transformers_metadata + whisperx_datas + speechbrain_datas + speechbrain_metadata + icon_files + theme_files + flaticons_files + customtkinter_datas + tcl_tk_datas,
     hiddenimports=[
         "deface",
@@ -332,6 +344,20 @@ a = Analysis(
         "views.dialogs",
         "config_manager",
         "progress_parser",
+        "batch_executor",
+        "batch_stats",
+        "adaptive_concurrency",
+        "media_probe",
+        "job_registry",
+        "job_store",
+        "job_watchdog",
+        "output_cache",
+        "interval_index",
+        "smudge_model",
+        "smudge_project",
+        "smudge_export",
+        "smudge_render",
+        "smudge_worker",
         "tkinter",
         "_tkinter",
         "lightning",
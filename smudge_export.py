@@ -0,0 +1,1491 @@
+"""Compositing and export for Face Smudge.
+
+This module renders smudge operations onto video frames and encodes the
+result. It does not import Tk, so the Face Smudge window and headless
+rendering share it.
+
+Export runs a single ffmpeg process: decoded and smudged frames are piped to
+its stdin as raw BGR, and the audio and metadata of the source file are
+stream-copied in the same invocation. The source is read once and the
+output written once. Within an export, decoding, compositing and encoding
+run as a pipeline of threads connected by bounded queues.
+
+Smart rendering goes further for lightly edited files: only the GOPs that
+contain smudged frames are decoded and re-encoded, all other GOPs are
+stream-copied, and the pieces are joined losslessly with the ffmpeg concat
+demuxer.
+
+Parallel export splits the video at keyframes into one segment per worker
+process; each worker decodes, smudges and encodes its own segment, and the
+segments are joined with the concat demuxer. The workers run smudge_worker
+in a new interpreter, so they do not import the GUI.
+"""
+
+import bisect
+import dataclasses
+import json
+import logging
+import os
+import pickle
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import IO, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+from media_probe import find_ffmpeg, find_ffprobe, run_ffprobe
+from smudge_model import OperationStore, SmudgeOperation
+
+logger = logging.getLogger(__name__)
+
+# Encoders used to re-encode GOPs of a source in the same codec when smart rendering
+SMART_RENDER_ENCODERS: Dict[str, str] = {"h264": "libx264", "hevc": "libx265"}
+
+# Above this fraction of re-encoded frames a full export is used instead
+SMART_RENDER_MAX_FRACTION = 0.5
+
+# Frames a parallel export worker encodes between progress reports
+WORKER_PROGRESS_INTERVAL = 25
+
+# Frames in flight between the decode and encode stages of an export pipeline
+PIPELINE_QUEUE_SIZE = 16
+
+# Composite worker threads per export pipeline (OpenCV releases the GIL while blurring)
+PIPELINE_COMPOSITE_WORKERS = 4
+
+# Window over which ExportProgress measures the frame rate, in seconds
+PROGRESS_RATE_WINDOW = 3.0
+
+# Seconds a parallel export worker gets to stop after it is cancelled
+WORKER_STOP_TIMEOUT = 10
+
+
+class ExportError(Exception):
+    """Raised when a smudged video cannot be exported."""
+
+
+class ExportCancelled(ExportError):
+    """Raised when an export is stopped through its cancel event."""
+
+
+@dataclass
+class EncoderSettings:
+    """Video encoder settings for export."""
+
+    codec: str = "libx264"  # libx264 or libx265
+    crf: int = 20  # Constant rate factor (lower is higher quality)
+    preset: str = "medium"  # x264/x265 speed preset
+    threads: int = 0  # 0 lets the encoder choose
+    bitrate: Optional[int] = None  # Target bits/s; overrides crf when set
+
+    def rate_control_args(self) -> List[str]:
+        """ffmpeg arguments selecting CRF or average bitrate rate control."""
+        if self.bitrate:
+            return ["-b:v", str(self.bitrate), "-maxrate", str(self.bitrate * 3 // 2), "-bufsize", str(self.bitrate * 2)]
+        return ["-crf", str(self.crf)]
+
+
+# Named encoder presets offered in Face Smudge settings. "match source" is
+# resolved per video by resolve_encoder_preset().
+MATCH_SOURCE_PRESET = "match source"
+DEFAULT_ENCODER_PRESET = "balanced"
+ENCODER_PRESETS: Dict[str, EncoderSettings] = {
+    "fast draft": EncoderSettings(codec="libx264", crf=28, preset="veryfast", threads=0),
+    "balanced": EncoderSettings(codec="libx264", crf=20, preset="medium", threads=0),
+    "archive": EncoderSettings(codec="libx265", crf=18, preset="slow", threads=0),
+}
+ENCODER_PRESET_NAMES = list(ENCODER_PRESETS) + [MATCH_SOURCE_PRESET]
+
+
+@dataclass
+class VideoProbe:
+    """Properties of a source video stream reported by ffprobe."""
+
+    codec: str
+    width: int
+    height: int
+    pix_fmt: str
+    fps: Fraction
+    start_time: float
+    frame_count: int
+    bit_rate: Optional[int] = None  # bits/s of the video stream (or container)
+    profile: Optional[str] = None
+    rotated: bool = False
+
+    def frame_time(self, frame_number: int) -> float:
+        """Presentation time in seconds of a frame (assumes constant frame rate)."""
+        return self.start_time + frame_number / float(self.fps)
+
+
+@dataclass
+class PipelineStats:
+    """Timing of the stages of an export pipeline."""
+
+    composite_workers: int
+    frames: int = 0
+    composited: int = 0  # Frames that had smudges applied
+    cancelled: bool = False
+    elapsed: float = 0.0
+    decode_busy: float = 0.0
+    composite_busy: float = 0.0  # Summed over all composite workers
+    encode_busy: float = 0.0
+
+    def utilisation(self) -> Dict[str, float]:
+        """Fraction of the elapsed time each stage spent working (0-1)."""
+        if self.elapsed <= 0:
+            return {"decode": 0.0, "composite": 0.0, "encode": 0.0}
+        return {
+            "decode": self.decode_busy / self.elapsed,
+            "composite": self.composite_busy / (self.elapsed * self.composite_workers),
+            "encode": self.encode_busy / self.elapsed,
+        }
+
+    def summary(self) -> str:
+        """One-line description of throughput and stage utilisation."""
+        fps = self.frames / self.elapsed if self.elapsed > 0 else 0.0
+        utilisation = self.utilisation()
+        return (
+            f"{self.frames} frames ({self.composited} smudged) in {self.elapsed:.1f}s ({fps:.1f} fps); "
+            f"utilisation decode {utilisation['decode']:.0%}, "
+            f"composite {utilisation['composite']:.0%} ({self.composite_workers} workers), "
+            f"encode {utilisation['encode']:.0%}"
+        )
+
+
+class ExportProgress:
+    """Thread-safe export progress with frame rate and ETA.
+
+    Pass update() as an exporter's progress_callback; it may be called from
+    any thread and at any rate. Consumers read snapshot() at their own pace
+    (e.g. ten times per second from the UI thread).
+    """
+
+    def __init__(self):
+        """Initialize progress at zero."""
+        self._lock = threading.Lock()
+        self._frames_done = 0
+        self._total_frames = 0
+        self._started = time.monotonic()
+        self._samples: Deque[Tuple[float, int]] = deque()  # (time, frames_done)
+
+    def update(self, frames_done: int, total_frames: int):
+        """Record progress.
+
+        Args:
+            frames_done: Frames exported so far.
+            total_frames: Total frames to export.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._frames_done = frames_done
+            self._total_frames = total_frames
+            # Keep at most one rate sample per 100 ms
+            if not self._samples or now - self._samples[-1][0] >= 0.1:
+                self._samples.append((now, frames_done))
+                while now - self._samples[0][0] > PROGRESS_RATE_WINDOW:
+                    self._samples.popleft()
+
+    def snapshot(self) -> Tuple[int, int, float, Optional[float]]:
+        """Get the current progress.
+
+        Returns:
+            Tuple of (frames_done, total_frames, fps, eta_seconds); the ETA is
+            None until a frame rate has been measured.
+        """
+        now = time.monotonic()
+        with self._lock:
+            frames_done, total_frames = self._frames_done, self._total_frames
+            if len(self._samples) >= 2:
+                (t0, f0), (t1, f1) = self._samples[0], self._samples[-1]
+                fps = (f1 - f0) / (t1 - t0) if t1 > t0 else 0.0
+            else:
+                elapsed = now - self._started
+                fps = frames_done / elapsed if elapsed > 0 else 0.0
+        eta = (total_frames - frames_done) / fps if fps > 0 and total_frames >= frames_done else None
+        return frames_done, total_frames, fps, eta
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration as H:MM:SS or M:SS."""
+    seconds = int(round(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+@dataclass
+class ExportResult:
+    """Outcome of an export."""
+
+    output_path: str
+    frames_written: int
+    has_audio: bool
+    stage_utilisation: Dict[str, float] = field(default_factory=dict)
+
+
+# ============================================================================
+# Blur Functions
+# ============================================================================
+
+
+def create_circular_mask(shape: Tuple[int, int], center_x: float, center_y: float, radius: int) -> np.ndarray:
+    """Create a circular mask for blur region.
+
+    Args:
+        shape: Shape of the frame (height, width).
+        center_x: X coordinate of center (0-1 normalized).
+        center_y: Y coordinate of center (0-1 normalized).
+        radius: Radius of the circle in pixels.
+
+    Returns:
+        Boolean mask array.
+    """
+    height, width = shape[:2]
+    y, x = np.ogrid[:height, :width]
+
+    # Convert normalized coordinates to pixel coordinates
+    cx = int(center_x * width)
+    cy = int(center_y * height)
+
+    # Create circular mask
+    mask = (x - cx) ** 2 + (y - cy) ** 2 <= radius ** 2
+
+    return mask
+
+
+def apply_blur_circle(frame: np.ndarray, x: float, y: float, radius: int, sigma: float) -> np.ndarray:
+    """Apply Gaussian blur to a circular region of a frame.
+
+    Args:
+        frame: Input frame in BGR format.
+        x: X coordinate of center (0-1 normalized).
+        y: Y coordinate of center (0-1 normalized).
+        radius: Radius of the circle in pixels.
+        sigma: Blur strength (sigma for Gaussian).
+
+    Returns:
+        Modified frame with blur applied.
+    """
+    # Create mask for circular blur region
+    mask = create_circular_mask((frame.shape[0], frame.shape[1]), x, y, radius)
+
+    # Extract region to blur
+    y_indices, x_indices = np.where(mask)
+    if len(y_indices) == 0:
+        return frame
+
+    # Get bounding box for the region
+    y_min, y_max = y_indices.min(), y_indices.max() + 1
+    x_min, x_max = x_indices.min(), x_indices.max() + 1
+
+    # Clip to frame bounds
+    y_min = max(0, y_min)
+    y_max = min(frame.shape[0], y_max)
+    x_min = max(0, x_min)
+    x_max = min(frame.shape[1], x_max)
+
+    # Extract region
+    region = frame[y_min:y_max, x_min:x_max].copy()
+
+    # Apply Gaussian blur
+    # Kernel size must be odd, calculate from sigma
+    kernel_size = int(6 * sigma + 1)
+    if kernel_size % 2 == 0:
+        kernel_size += 1
+
+    blurred_region = cv2.GaussianBlur(region, (kernel_size, kernel_size), sigma)
+
+    # Create mask for the region
+    region_mask = mask[y_min:y_max, x_min:x_max]
+
+    # Composite blurred region back into frame
+    frame[y_min:y_max, x_min:x_max][region_mask] = blurred_region[region_mask]
+
+    return frame
+
+
+def apply_smudge_to_frame(frame: np.ndarray, operation: SmudgeOperation) -> np.ndarray:
+    """Apply a smudge operation to a frame.
+
+    Args:
+        frame: Input frame in BGR format.
+        operation: SmudgeOperation specifying blur parameters.
+
+    Returns:
+        Modified frame with blur applied.
+    """
+    return apply_blur_circle(frame, operation.x, operation.y, operation.radius, operation.sigma)
+
+
+def apply_store_rows_to_frame(frame: np.ndarray, store: OperationStore, rows: np.ndarray) -> np.ndarray:
+    """Apply the smudge operations stored in rows of an OperationStore.
+
+    Values are read straight from the store's columns, so no per-operation
+    Python objects are created.
+
+    Args:
+        frame: Input frame in BGR format.
+        store: Store holding the operations.
+        rows: Row indices to apply, in order (see OperationStore.frame_rows).
+
+    Returns:
+        Modified frame with blur applied.
+    """
+    xs, ys, radii, sigmas = store.x, store.y, store.radius, store.sigma
+    for row in rows:
+        frame = apply_blur_circle(frame, float(xs[row]), float(ys[row]), int(radii[row]), float(sigmas[row]))
+    return frame
+
+
+# ============================================================================
+# Export Pipeline
+# ============================================================================
+
+
+def run_export_pipeline(
+    read_frame: Callable[[], Optional[np.ndarray]],
+    write_frame: Callable[[np.ndarray], None],
+    store: OperationStore,
+    first_frame: int = 0,
+    on_frame: Optional[Callable[[], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+    composite_workers: int = PIPELINE_COMPOSITE_WORKERS,
+) -> PipelineStats:
+    """Decode, composite and encode frames as overlapping pipeline stages.
+
+    A decode thread reads frames and submits those with smudge operations to
+    a pool of composite threads; frames without operations bypass the pool.
+    An encode thread writes the frames in their original order. The stages
+    are connected by a bounded queue, so a slow stage applies backpressure
+    instead of buffering the whole video.
+
+    Args:
+        read_frame: Returns the next frame, or None at the end of the input.
+        write_frame: Writes one frame to the encoder.
+        store: Smudge operations to apply, by frame.
+        first_frame: Frame number of the first frame returned by read_frame.
+        on_frame: Called from the encode thread after each frame is written.
+        cancel_event: When set, decoding stops and PipelineStats.cancelled is set.
+        composite_workers: Number of composite threads.
+
+    Returns:
+        PipelineStats with frame counts and per-stage busy times.
+
+    Raises:
+        Exception: The first exception raised by read_frame or write_frame.
+    """
+    stats = PipelineStats(composite_workers=composite_workers)
+    slots: "queue.Queue[Optional[object]]" = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    stop = threading.Event()
+    errors: List[BaseException] = []
+    composite_lock = threading.Lock()
+
+    def composite(frame_num: int, frame: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        started = time.perf_counter()
+        try:
+            return apply_store_rows_to_frame(frame, store, rows)
+        except Exception as e:
+            logger.warning(f"Error applying smudge to frame {frame_num}: {e}")
+            return frame  # Continue with unmodified frame
+        finally:
+            with composite_lock:
+                stats.composite_busy += time.perf_counter() - started
+
+    def put(item: Optional[object]) -> bool:
+        # Block while the queue is full, but give up once the pipeline stops
+        while not stop.is_set():
+            try:
+                slots.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def decode(pool: ThreadPoolExecutor):
+        frame_num = first_frame
+        try:
+            while not stop.is_set():
+                if cancel_event is not None and cancel_event.is_set():
+                    stats.cancelled = True
+                    break
+                started = time.perf_counter()
+                frame = read_frame()
+                stats.decode_busy += time.perf_counter() - started
+                if frame is None:
+                    break
+
+                rows = store.frame_rows(frame_num)
+                item: object = frame
+                if len(rows):
+                    item = pool.submit(composite, frame_num, frame, rows)
+                    stats.composited += 1
+                if not put(item):
+                    break
+                frame_num += 1
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            put(None)
+
+    def encode():
+        try:
+            while True:
+                try:
+                    item = slots.get(timeout=0.1)
+                except queue.Empty:
+                    if stop.is_set():
+                        break
+                    continue
+                if item is None:
+                    break
+                frame = item.result() if isinstance(item, Future) else item
+
+                started = time.perf_counter()
+                write_frame(frame)  # type: ignore[arg-type]
+                stats.encode_busy += time.perf_counter() - started
+                stats.frames += 1
+                if on_frame:
+                    on_frame()
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            stop.set()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=composite_workers, thread_name_prefix="smudge-composite") as pool:
+        threads = [
+            threading.Thread(target=decode, args=(pool,), name="smudge-decode", daemon=True),
+            threading.Thread(target=encode, name="smudge-encode", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    stats.elapsed = time.perf_counter() - started
+
+    if errors:
+        raise errors[0]
+    logger.info(f"Export pipeline: {stats.summary()}")
+    return stats
+
+
+def _write_raw_frame(stream, frame: np.ndarray):
+    """Write a BGR frame to a raw video pipe without an extra copy."""
+    stream.write(np.ascontiguousarray(frame).data.cast("B"))
+
+
+# ============================================================================
+# Encoding
+# ============================================================================
+
+
+def build_ffmpeg_command(
+    ffmpeg: str,
+    source_path: str,
+    output_path: str,
+    width: int,
+    height: int,
+    fps: float,
+    settings: EncoderSettings,
+) -> List[str]:
+    """Build the ffmpeg command for a single-pass piped export.
+
+    Input 0 is raw BGR video on stdin; input 1 is the source file, from
+    which all audio streams, chapters and metadata are stream-copied.
+
+    Args:
+        ffmpeg: Path to ffmpeg.
+        source_path: Original video file.
+        output_path: Output video file.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Frame rate of the piped frames.
+        settings: Video encoder settings.
+
+    Returns:
+        Command line as a list of arguments.
+    """
+    cmd = [
+        ffmpeg,
+        "-hide_banner",
+        "-loglevel", "error",
+        "-y",
+        # Smudged frames from stdin
+        "-f", "rawvideo",
+        "-pix_fmt", "bgr24",
+        "-s", f"{width}x{height}",
+        "-r", f"{fps:.6f}",
+        "-i", "-",
+        # Source file for audio and metadata
+        "-i", source_path,
+        "-map", "0:v:0",
+        "-map", "1:a?",
+        "-map_metadata", "1",
+        "-map_chapters", "1",
+        "-c:v", settings.codec,
+        "-preset", settings.preset,
+    ] + settings.rate_control_args() + [
+        "-pix_fmt", "yuv420p",
+        "-c:a", "copy",
+    ]
+    if width % 2 or height % 2:
+        # 4:2:0 chroma subsampling needs even dimensions
+        cmd += ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
+    if settings.threads:
+        cmd += ["-threads", str(settings.threads)]
+    if settings.codec == "libx265":
+        # Tag HEVC so QuickTime and Apple devices can play it
+        cmd += ["-tag:v", "hvc1"]
+    cmd.append(output_path)
+    return cmd
+
+
+def source_has_audio(ffmpeg: str, source_path: str) -> bool:
+    """Check whether a file has an audio stream.
+
+    Args:
+        ffmpeg: Path to ffmpeg.
+        source_path: File to inspect.
+
+    Returns:
+        True if ffmpeg reports an audio stream.
+    """
+    creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-hide_banner", "-i", source_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=10,
+            creationflags=creationflags,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"Could not inspect streams of {source_path}: {e}")
+        return False
+    return b"Audio:" in result.stderr
+
+
+def _create_partial_output(output_path: str) -> str:
+    """Create the temporary file an export is written to.
+
+    It is in the output's directory, so moving it into place is a rename, and
+    keeps the output's extension, from which ffmpeg picks the container. It is
+    created like any new file, so the output gets the permissions the umask
+    allows (mkstemp would leave it readable by the owner only).
+    """
+    root, ext = os.path.splitext(os.path.abspath(output_path))
+    attempt = 0
+    while True:
+        path = f"{root}.partial-{os.getpid()}-{attempt}{ext}"
+        try:
+            with open(path, "xb"):
+                return path
+        except FileExistsError:
+            attempt += 1
+
+
+def _remove_partial_output(path: str):
+    """Delete an incomplete output file, if it exists."""
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+    except OSError as e:
+        logger.warning(f"Could not remove partial output {path}: {e}")
+
+
+def export_smudged_video(
+    source_path: str,
+    output_path: str,
+    store: OperationStore,
+    settings: Optional[EncoderSettings] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> ExportResult:
+    """Render smudges onto a video and encode it in a single ffmpeg pass.
+
+    Args:
+        source_path: Original video file.
+        output_path: Output video file.
+        store: Smudge operations to apply, by frame.
+        settings: Video encoder settings (defaults to x264 CRF 20).
+        progress_callback: Called with (frames_done, total_frames) after each frame.
+        cancel_event: When set, the export stops and the partial output is removed.
+
+    Returns:
+        ExportResult describing the written file.
+
+    Raises:
+        ExportError: If ffmpeg is unavailable, the source cannot be read,
+            encoding fails, or the export was cancelled.
+    """
+    settings = settings or EncoderSettings()
+    ffmpeg = find_ffmpeg()
+    if not ffmpeg:
+        raise ExportError("ffmpeg is required to export video but was not found")
+
+    cap = cv2.VideoCapture(source_path)
+    if not cap.isOpened():
+        raise ExportError(f"Could not open video file: {source_path}")
+
+    # Written to a temporary file that replaces the output only on success, so
+    # a failed export never leaves a truncated but playable file behind
+    try:
+        partial_path = _create_partial_output(output_path)
+    except OSError as e:
+        cap.release()
+        raise ExportError(f"Could not create output file next to {output_path}: {e}") from e
+
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        has_audio = source_has_audio(ffmpeg, source_path)
+
+        cmd = build_ffmpeg_command(ffmpeg, source_path, partial_path, width, height, fps, settings)
+        logger.info(f"Exporting with: {' '.join(cmd)}")
+        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            creationflags=creationflags,
+        )
+
+        # Drain stderr in the background so a chatty ffmpeg cannot block on a full pipe
+        stderr_chunks: List[bytes] = []
+        stderr_thread = threading.Thread(
+            target=lambda: stderr_chunks.append(proc.stderr.read()),  # type: ignore[union-attr]
+            daemon=True,
+        )
+        stderr_thread.start()
+
+        def read_frame() -> Optional[np.ndarray]:
+            ret, frame = cap.read()
+            return frame if ret else None
+
+        frames_written = 0
+
+        def on_frame():
+            nonlocal frames_written
+            frames_written += 1
+            if progress_callback:
+                progress_callback(frames_written, total_frames)
+
+        cancelled = False
+        stats: Optional[PipelineStats] = None
+        try:
+            stats = run_export_pipeline(
+                read_frame,
+                lambda frame: _write_raw_frame(proc.stdin, frame),
+                store,
+                on_frame=on_frame,
+                cancel_event=cancel_event,
+            )
+            cancelled = stats.cancelled
+        except BrokenPipeError:
+            # ffmpeg exited early; its stderr explains why
+            pass
+        except BaseException:
+            # Stop ffmpeg before closing stdin makes it finalise the file
+            proc.kill()
+            raise
+        finally:
+            try:
+                proc.stdin.close()  # type: ignore[union-attr]
+            except OSError:
+                pass
+            if cancelled:
+                proc.kill()
+            returncode = proc.wait()
+            stderr_thread.join(timeout=5)
+    except BaseException:
+        _remove_partial_output(partial_path)
+        raise
+    finally:
+        cap.release()
+
+    if cancelled or returncode != 0 or frames_written == 0:
+        _remove_partial_output(partial_path)
+        if cancelled:
+            raise ExportCancelled("Export cancelled")
+        if returncode != 0:
+            stderr = b"".join(stderr_chunks).decode(errors="replace").strip()
+            raise ExportError(f"ffmpeg failed with exit code {returncode}:\n{stderr[-2000:]}")
+        raise ExportError("No frames were written to the output video")
+
+    try:
+        os.replace(partial_path, output_path)
+    except OSError as e:
+        _remove_partial_output(partial_path)
+        raise ExportError(f"Could not write {output_path}: {e}") from e
+
+    return ExportResult(
+        output_path=output_path,
+        frames_written=frames_written,
+        has_audio=has_audio,
+        stage_utilisation=stats.utilisation() if stats else {},
+    )
+
+
+# ============================================================================
+# Smart Rendering
+# ============================================================================
+
+
+def probe_video(ffprobe: str, path: str) -> Optional[VideoProbe]:
+    """Probe the first video stream of a file.
+
+    Args:
+        ffprobe: Path to ffprobe.
+        path: File to probe.
+
+    Returns:
+        VideoProbe, or None if the file could not be probed.
+    """
+    output = run_ffprobe(
+        ffprobe,
+        [
+            "-select_streams", "v:0",
+            "-show_entries",
+            "stream=codec_name,profile,width,height,pix_fmt,avg_frame_rate,r_frame_rate,"
+            "start_time,nb_frames,bit_rate:stream_tags=rotate:stream_side_data=rotation:"
+            "format=duration,bit_rate",
+            "-of", "json",
+            path,
+        ],
+        timeout=30,
+    )
+    if output is None:
+        return None
+
+    try:
+        info = json.loads(output)
+        stream = info["streams"][0]
+        container = info.get("format", {})
+
+        fps = Fraction(stream.get("avg_frame_rate") or "0/1")
+        if fps <= 0:
+            fps = Fraction(stream.get("r_frame_rate") or "0/1")
+        if fps <= 0:
+            return None
+
+        frame_count = int(stream.get("nb_frames") or 0)
+        if frame_count <= 0 and container.get("duration"):
+            frame_count = int(round(float(container["duration"]) * float(fps)))
+
+        bit_rate = stream.get("bit_rate") or container.get("bit_rate")
+        rotation = int(float(stream.get("tags", {}).get("rotate", 0) or 0))
+        for side_data in stream.get("side_data_list", []):
+            rotation = rotation or int(float(side_data.get("rotation", 0) or 0))
+
+        return VideoProbe(
+            codec=stream.get("codec_name", ""),
+            width=int(stream["width"]),
+            height=int(stream["height"]),
+            pix_fmt=stream.get("pix_fmt", "yuv420p"),
+            fps=fps,
+            start_time=float(stream.get("start_time") or 0.0),
+            frame_count=frame_count,
+            bit_rate=int(bit_rate) if bit_rate else None,
+            profile=stream.get("profile"),
+            rotated=rotation % 360 != 0,
+        )
+    except (KeyError, IndexError, ValueError, ZeroDivisionError) as e:
+        logger.warning(f"Could not parse ffprobe output for {path}: {e}")
+        return None
+
+
+def probe_keyframes(ffprobe: str, path: str, probe: VideoProbe) -> List[int]:
+    """Find the frame numbers of the keyframes of the first video stream.
+
+    Reads packet flags only, so no frames are decoded.
+
+    Args:
+        ffprobe: Path to ffprobe.
+        path: File to probe.
+        probe: Result of probe_video() for the file.
+
+    Returns:
+        Sorted keyframe frame numbers (empty on failure).
+    """
+    output = run_ffprobe(
+        ffprobe,
+        ["-select_streams", "v:0", "-show_entries", "packet=pts_time,flags", "-of", "csv=p=0", path],
+        timeout=300,
+    )
+    if output is None:
+        return []
+
+    fps = float(probe.fps)
+    keyframes = set()
+    for line in output.splitlines():
+        pts_time, _, flags = line.partition(",")
+        if "K" not in flags or pts_time in ("", "N/A"):
+            continue
+        keyframes.add(int(round((float(pts_time) - probe.start_time) * fps)))
+    return sorted(k for k in keyframes if k >= 0)
+
+
+def plan_smart_render(keyframes: List[int], frame_count: int, edited_frames: np.ndarray) -> List[Tuple[int, int, bool]]:
+    """Split a video into stream-copied and re-encoded segments.
+
+    Each GOP (from one keyframe to the next) containing an edited frame is
+    re-encoded; consecutive GOPs with the same treatment are merged.
+
+    Args:
+        keyframes: Sorted keyframe frame numbers; the first must be 0.
+        frame_count: Total number of frames.
+        edited_frames: Sorted frame numbers that have smudges.
+
+    Returns:
+        List of (start_frame, end_frame, reencode) segments covering
+        ``[0, frame_count)``, with end_frame exclusive.
+    """
+    starts = np.asarray([k for k in keyframes if k < frame_count], dtype=np.int64)
+    if len(starts) == 0 or starts[0] != 0:
+        raise ValueError("Keyframe list must start at frame 0")
+    ends = np.append(starts[1:], frame_count)
+
+    edited = np.zeros(len(starts), dtype=bool)
+    frames = np.asarray(edited_frames, dtype=np.int64)
+    frames = frames[(frames >= 0) & (frames < frame_count)]
+    edited[np.unique(np.searchsorted(starts, frames, side="right") - 1)] = True
+
+    segments: List[Tuple[int, int, bool]] = []
+    for start, end, reencode in zip(starts.tolist(), ends.tolist(), edited.tolist()):
+        if segments and segments[-1][2] == reencode:
+            segments[-1] = (segments[-1][0], end, reencode)
+        else:
+            segments.append((start, end, reencode))
+    return segments
+
+
+def _run_ffmpeg(cmd: List[str], log_path: str):
+    """Run ffmpeg to completion, raising ExportError with its log on failure."""
+    creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    with open(log_path, "wb") as log:
+        returncode = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=log, creationflags=creationflags
+        ).returncode
+    if returncode != 0:
+        with open(log_path, "rb") as log:
+            stderr = log.read().decode(errors="replace").strip()
+        raise ExportError(f"ffmpeg failed with exit code {returncode}:\n{stderr[-2000:]}")
+
+
+def _copy_segment(ffmpeg: str, source_path: str, segment_path: str, probe: VideoProbe, start: int, end: int):
+    """Stream-copy the GOPs in ``[start, end)`` to an MPEG-TS segment."""
+    # Input seeking with stream copy lands on the keyframe at or before the
+    # target, so aim half a frame past the keyframe to absorb rounding
+    cmd = [
+        ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
+        "-ss", f"{probe.frame_time(start) + 0.5 / float(probe.fps):.6f}",
+        "-i", source_path,
+        "-map", "0:v:0",
+        "-c", "copy",
+    ]
+    if end < probe.frame_count:
+        cmd += ["-frames:v", str(end - start)]
+    cmd += ["-f", "mpegts", segment_path]
+    _run_ffmpeg(cmd, segment_path + ".log")
+
+
+def _reencode_segment(
+    ffmpeg: str,
+    source_path: str,
+    segment_path: str,
+    probe: VideoProbe,
+    start: int,
+    end: int,
+    store: OperationStore,
+    settings: EncoderSettings,
+    on_frame: Callable[[], None],
+    cancel_event: Optional[threading.Event],
+    match_source: bool = True,
+) -> PipelineStats:
+    """Decode, smudge and re-encode the frames in ``[start, end)`` to an MPEG-TS segment.
+
+    With ``match_source`` the segment is encoded with the source's codec,
+    pixel format and profile so that it can be concatenated with
+    stream-copied segments; otherwise ``settings`` chooses the codec.
+
+    Returns:
+        PipelineStats of the segment's export pipeline.
+    """
+    creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    frame_size = probe.width * probe.height * 3
+
+    decode_cmd = [
+        ffmpeg, "-hide_banner", "-loglevel", "error",
+        # Accurate seek: frames before the target are decoded and dropped
+        "-ss", f"{max(0.0, probe.frame_time(start) - 0.5 / float(probe.fps)):.6f}",
+        "-i", source_path,
+        "-map", "0:v:0",
+        "-frames:v", str(end - start),
+        "-f", "rawvideo", "-pix_fmt", "bgr24",
+        "-",
+    ]
+    encode_cmd = [
+        ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
+        "-f", "rawvideo", "-pix_fmt", "bgr24",
+        "-s", f"{probe.width}x{probe.height}",
+        "-r", str(probe.fps),
+        "-i", "-",
+        "-c:v", SMART_RENDER_ENCODERS[probe.codec] if match_source else settings.codec,
+        "-preset", settings.preset,
+    ] + settings.rate_control_args()
+    if match_source:
+        encode_cmd += ["-pix_fmt", probe.pix_fmt]
+        profile = (probe.profile or "").lower().replace(" ", "")
+        if profile in ("baseline", "main", "high", "main10"):
+            encode_cmd += ["-profile:v", profile]
+    else:
+        encode_cmd += ["-pix_fmt", "yuv420p"]
+        if probe.width % 2 or probe.height % 2:
+            encode_cmd += ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
+    if settings.threads:
+        encode_cmd += ["-threads", str(settings.threads)]
+    encode_cmd += ["-f", "mpegts", segment_path]
+
+    with open(segment_path + ".decode.log", "wb") as decode_log, open(segment_path + ".log", "wb") as encode_log:
+        decoder = subprocess.Popen(
+            decode_cmd, stdout=subprocess.PIPE, stderr=decode_log, creationflags=creationflags
+        )
+        encoder = subprocess.Popen(
+            encode_cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=encode_log,
+            creationflags=creationflags,
+        )
+        def read_frame() -> Optional[np.ndarray]:
+            # Read straight into a writable buffer so compositing needs no copy
+            buffer = bytearray(frame_size)
+            if decoder.stdout.readinto(buffer) < frame_size:  # type: ignore[union-attr]
+                return None
+            return np.frombuffer(buffer, dtype=np.uint8).reshape(probe.height, probe.width, 3)
+
+        cancelled = False
+        stats = PipelineStats(composite_workers=0)
+        try:
+            stats = run_export_pipeline(
+                read_frame,
+                lambda frame: _write_raw_frame(encoder.stdin, frame),
+                store,
+                first_frame=start,
+                on_frame=on_frame,
+                cancel_event=cancel_event,
+            )
+            cancelled = stats.cancelled
+        except BrokenPipeError:
+            # The encoder exited early; its log explains why
+            pass
+        finally:
+            try:
+                encoder.stdin.close()  # type: ignore[union-attr]
+            except OSError:
+                pass
+            decoder.stdout.close()  # type: ignore[union-attr]
+            if cancelled:
+                encoder.kill()
+            decoder.kill()
+            decoder.wait()
+            encode_returncode = encoder.wait()
+
+    if cancelled:
+        raise ExportCancelled("Export cancelled")
+    if encode_returncode != 0:
+        with open(segment_path + ".log", "rb") as log:
+            stderr = log.read().decode(errors="replace").strip()
+        raise ExportError(f"ffmpeg failed with exit code {encode_returncode}:\n{stderr[-2000:]}")
+    if stats.frames < end - start:
+        raise ExportError(f"Could only decode {stats.frames} of {end - start} frames from frame {start}")
+    return stats
+
+
+def concat_segments(
+    ffmpeg: str, segment_paths: List[str], source_path: str, output_path: str, work_dir: str, codec: str
+):
+    """Join video segments with the concat demuxer, adding the source's audio and metadata.
+
+    Args:
+        ffmpeg: Path to ffmpeg.
+        segment_paths: Video-only segments in order.
+        source_path: Original video, from which audio, chapters and metadata are copied.
+        output_path: Output video file.
+        work_dir: Directory for the concat list and log.
+        codec: Video codec name of the segments (e.g. "h264").
+    """
+    list_path = os.path.join(work_dir, "segments.txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in segment_paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+
+    cmd = [
+        ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
+        "-f", "concat", "-safe", "0", "-i", list_path,
+        "-i", source_path,
+        "-map", "0:v:0",
+        "-map", "1:a?",
+        "-map_metadata", "1",
+        "-map_chapters", "1",
+        "-c", "copy",
+    ]
+    if codec == "hevc":
+        cmd += ["-tag:v", "hvc1"]
+    cmd.append(output_path)
+    _run_ffmpeg(cmd, os.path.join(work_dir, "concat.log"))
+
+
+def _concat_to_output(
+    ffmpeg: str, segment_paths: List[str], source_path: str, output_path: str, work_dir: str, codec: str
+):
+    """Join segments like concat_segments(), replacing the output only once the join succeeds.
+
+    The segments are joined into a temporary file next to the output, so a
+    failed or cancelled export neither truncates an existing output nor
+    leaves a partial one behind.
+    """
+    try:
+        partial_path = _create_partial_output(output_path)
+    except OSError as e:
+        raise ExportError(f"Could not create output file next to {output_path}: {e}") from e
+    try:
+        concat_segments(ffmpeg, segment_paths, source_path, partial_path, work_dir, codec)
+        os.replace(partial_path, output_path)
+    except OSError as e:
+        raise ExportError(f"Could not write {output_path}: {e}") from e
+    finally:
+        _remove_partial_output(partial_path)
+
+
+def smart_export_smudged_video(
+    source_path: str,
+    output_path: str,
+    store: OperationStore,
+    settings: Optional[EncoderSettings] = None,
+    workers: int = 1,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> ExportResult:
+    """Export a smudged video, re-encoding only the GOPs that contain smudges.
+
+    Falls back to a full export (parallel_export_smudged_video() when
+    ``workers`` is not 1) when smart rendering does not apply:
+    ffprobe is missing, the codec has no matching encoder, the stream is
+    rotated, or most of the video would be re-encoded anyway.
+
+    Args:
+        source_path: Original video file.
+        output_path: Output video file.
+        store: Smudge operations to apply, by frame.
+        settings: Encoder settings for re-encoded GOPs (the codec always
+            matches the source).
+        workers: Worker processes for a full export fallback (0 uses the CPU count).
+        progress_callback: Called with (frames_done, total_frames).
+        cancel_event: When set, the export stops and the partial output is removed.
+
+    Returns:
+        ExportResult describing the written file.
+
+    Raises:
+        ExportError: If the export fails or is cancelled.
+    """
+    settings = settings or EncoderSettings()
+
+    def full_export(reason: str) -> ExportResult:
+        logger.info(f"{reason}, using full export")
+        if workers != 1:
+            return parallel_export_smudged_video(
+                source_path, output_path, store, settings, workers, progress_callback, cancel_event
+            )
+        return export_smudged_video(source_path, output_path, store, settings, progress_callback, cancel_event)
+
+    ffmpeg = find_ffmpeg()
+    ffprobe = find_ffprobe()
+    if not ffmpeg or not ffprobe:
+        return full_export("Smart render needs ffmpeg and ffprobe")
+    probe = probe_video(ffprobe, source_path)
+    if probe is None or probe.codec not in SMART_RENDER_ENCODERS or probe.rotated or probe.frame_count <= 0:
+        return full_export("Smart render not applicable")
+    keyframes = probe_keyframes(ffprobe, source_path, probe)
+    if not keyframes or keyframes[0] != 0:
+        return full_export("Smart render not applicable")
+
+    plan = plan_smart_render(keyframes, probe.frame_count, store.frames())
+    reencoded = sum(end - start for start, end, reencode in plan if reencode)
+    if reencoded > probe.frame_count * SMART_RENDER_MAX_FRACTION:
+        return full_export(f"Smart render would re-encode {reencoded} of {probe.frame_count} frames")
+
+    logger.info(
+        f"Smart render: {len(plan)} segment(s), re-encoding {reencoded} of {probe.frame_count} frames"
+    )
+    total_frames = probe.frame_count
+    frames_done = 0
+
+    def on_frame():
+        nonlocal frames_done
+        frames_done += 1
+        if progress_callback:
+            progress_callback(frames_done, total_frames)
+
+    work_dir = tempfile.mkdtemp(prefix="sightline_smart_")
+    try:
+        segment_paths = []
+        for index, (start, end, reencode) in enumerate(plan):
+            if cancel_event is not None and cancel_event.is_set():
+                raise ExportCancelled("Export cancelled")
+            segment_path = os.path.join(work_dir, f"segment_{index:05d}.ts")
+            if reencode:
+                _reencode_segment(
+                    ffmpeg, source_path, segment_path, probe, start, end, store, settings, on_frame, cancel_event
+                )
+            else:
+                _copy_segment(ffmpeg, source_path, segment_path, probe, start, end)
+                frames_done += end - start
+                if progress_callback:
+                    progress_callback(frames_done, total_frames)
+            segment_paths.append(segment_path)
+
+        _concat_to_output(ffmpeg, segment_paths, source_path, output_path, work_dir, probe.codec)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    has_audio = source_has_audio(ffmpeg, source_path)
+    return ExportResult(output_path=output_path, frames_written=frames_done, has_audio=has_audio)
+
+
+# ============================================================================
+# Parallel Export
+# ============================================================================
+
+
+def split_at_keyframes(keyframes: List[int], frame_count: int, segments: int) -> List[Tuple[int, int]]:
+    """Split a frame range into roughly equal segments starting at keyframes.
+
+    Args:
+        keyframes: Sorted keyframe frame numbers.
+        frame_count: Total number of frames.
+        segments: Desired number of segments.
+
+    Returns:
+        List of (start_frame, end_frame) ranges covering ``[0, frame_count)``;
+        fewer than ``segments`` if there are not enough keyframes.
+    """
+    candidates = [k for k in keyframes if 0 < k < frame_count]
+    bounds = [0]
+    for i in range(1, segments):
+        target = i * frame_count / segments
+        index = bisect.bisect_left(candidates, target)
+        # Nearest keyframe to the ideal split point
+        nearby = candidates[max(0, index - 1):index + 1]
+        if not nearby:
+            continue
+        boundary = min(nearby, key=lambda k: abs(k - target))
+        if boundary > bounds[-1]:
+            bounds.append(boundary)
+    bounds.append(frame_count)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def export_segment(
+    source_path: str,
+    segment_path: str,
+    probe: VideoProbe,
+    start: int,
+    end: int,
+    store: OperationStore,
+    settings: EncoderSettings,
+    report_progress: Callable[[int], None],
+    cancel_event: Optional[threading.Event] = None,
+) -> PipelineStats:
+    """Export one segment of a parallel export (runs in a worker process).
+
+    Args:
+        source_path: Original video file.
+        segment_path: MPEG-TS file to write.
+        probe: Probe of the source video.
+        start: First frame of the segment.
+        end: Frame after the last frame of the segment.
+        store: Smudge operations of this segment.
+        settings: Video encoder settings.
+        report_progress: Called with the number of frames encoded since the last report.
+        cancel_event: When set, the export stops.
+
+    Returns:
+        PipelineStats of the segment.
+    """
+    ffmpeg = find_ffmpeg()
+    if not ffmpeg:
+        raise ExportError("ffmpeg is required to export video but was not found")
+
+    unreported = 0
+
+    def on_frame():
+        nonlocal unreported
+        unreported += 1
+        if unreported >= WORKER_PROGRESS_INTERVAL:
+            report_progress(unreported)
+            unreported = 0
+
+    stats = _reencode_segment(
+        ffmpeg, source_path, segment_path, probe, start, end, store, settings, on_frame, cancel_event,
+        match_source=False,
+    )
+    if unreported:
+        report_progress(unreported)
+    return stats
+
+
+def segment_worker_command(task_path: str) -> List[str]:
+    """Get the command that runs a parallel export worker on a task file.
+
+    The packaged app runs its own executable, which dispatches the
+    export-segment command to smudge_worker (see main.py).
+    """
+    if getattr(sys, "frozen", False):
+        return [sys.executable, "export-segment", task_path]
+    worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "smudge_worker.py")
+    return [sys.executable, worker_script, task_path]
+
+
+class _SegmentWorker:
+    """A worker process exporting one segment of a parallel export.
+
+    The task (the arguments of export_segment()) is pickled to a file. The
+    worker reports progress on stdout, stops when its stdin is closed and
+    pickles its result next to the task (see smudge_worker).
+    """
+
+    def __init__(self, task_path: str, progress_queue: "queue.Queue[int]"):
+        """Start the worker.
+
+        Args:
+            task_path: Pickled task file.
+            progress_queue: Queue receiving the number of frames encoded since the last report.
+        """
+        self.task_path = task_path
+        self.log_path = task_path + ".log"
+        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        with open(self.log_path, "wb") as log:
+            self.proc = subprocess.Popen(
+                segment_worker_command(task_path),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=log,
+                creationflags=creationflags,
+            )
+        assert self.proc.stdin is not None and self.proc.stdout is not None
+        self._stdin = self.proc.stdin
+        self._reader = threading.Thread(
+            target=self._read_progress, args=(self.proc.stdout, progress_queue), daemon=True
+        )
+        self._reader.start()
+
+    @staticmethod
+    def _read_progress(stdout: IO[bytes], progress_queue: "queue.Queue[int]"):
+        for line in stdout:
+            try:
+                progress_queue.put(int(line))
+            except ValueError:
+                pass
+
+    def failed(self) -> bool:
+        """Check whether the worker exited with an error."""
+        return self.proc.poll() not in (None, 0)
+
+    def cancel(self):
+        """Ask the worker to stop."""
+        try:
+            self._stdin.close()
+        except OSError:
+            pass
+
+    def stop(self):
+        """Cancel the worker and wait for it to exit, killing it if it does not stop."""
+        self.cancel()
+        try:
+            self.proc.wait(timeout=WORKER_STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Export worker {self.proc.pid} did not stop, killing it")
+            self.proc.kill()
+            self.proc.wait()
+        self._reader.join(timeout=5)
+
+    def result(self) -> PipelineStats:
+        """Get the pipeline stats of the worker's segment.
+
+        Raises:
+            ExportError: The error that stopped the worker.
+        """
+        try:
+            with open(self.task_path + ".result", "rb") as f:
+                result: Union[PipelineStats, ExportError] = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            with open(self.log_path, "rb") as log:
+                output = log.read().decode(errors="replace").strip()
+            raise ExportError(f"Export worker failed with exit code {self.proc.returncode}:\n{output[-2000:]}")
+        if isinstance(result, ExportError):
+            raise result
+        return result
+
+
+def parallel_export_smudged_video(
+    source_path: str,
+    output_path: str,
+    store: OperationStore,
+    settings: Optional[EncoderSettings] = None,
+    workers: int = 0,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> ExportResult:
+    """Export a smudged video using a pool of worker processes.
+
+    The frame range is split at keyframes into one segment per worker. Each
+    worker decodes its segment with its own ffmpeg decoder, applies that
+    segment's slice of the operations and encodes it; the segments are then
+    joined with the concat demuxer together with the source's audio and
+    metadata. Falls back to export_smudged_video() when the source cannot
+    be split.
+
+    Args:
+        source_path: Original video file.
+        output_path: Output video file.
+        store: Smudge operations to apply, by frame.
+        settings: Video encoder settings (defaults to x264 CRF 20).
+        workers: Number of worker processes (0 uses the CPU count).
+        progress_callback: Called with (frames_done, total_frames).
+        cancel_event: When set, the export stops and the partial output is removed.
+
+    Returns:
+        ExportResult describing the written file.
+
+    Raises:
+        ExportError: If the export fails or is cancelled.
+    """
+    settings = settings or EncoderSettings()
+    workers = workers or os.cpu_count() or 1
+
+    def single_process_export() -> ExportResult:
+        logger.info("Parallel export not applicable, using single-process export")
+        return export_smudged_video(source_path, output_path, store, settings, progress_callback, cancel_event)
+
+    ffmpeg = find_ffmpeg()
+    ffprobe = find_ffprobe()
+    if workers < 2 or not ffmpeg or not ffprobe:
+        return single_process_export()
+    probe = probe_video(ffprobe, source_path)
+    if probe is None or probe.rotated or probe.frame_count <= 0:
+        return single_process_export()
+    segments = split_at_keyframes(probe_keyframes(ffprobe, source_path, probe), probe.frame_count, workers)
+    if len(segments) < 2:
+        return single_process_export()
+
+    # Share the cores between the workers' encoders
+    if not settings.threads:
+        settings = dataclasses.replace(settings, threads=max(1, (os.cpu_count() or 1) // len(segments)))
+
+    logger.info(f"Parallel export: {len(segments)} segment(s) across {len(segments)} worker(s)")
+    total_frames = probe.frame_count
+    frames_done = 0
+
+    work_dir = tempfile.mkdtemp(prefix="sightline_parallel_")
+    segment_workers: List[_SegmentWorker] = []
+    try:
+        progress_queue: "queue.Queue[int]" = queue.Queue()
+        segment_paths = []
+        for index, (start, end) in enumerate(segments):
+            segment_path = os.path.join(work_dir, f"segment_{index:05d}.ts")
+            task = {
+                "source_path": source_path,
+                "segment_path": segment_path,
+                "probe": probe,
+                "start": start,
+                "end": end,
+                "store": store.slice_frames(start, end),
+                "settings": settings,
+            }
+            with open(segment_path + ".task", "wb") as f:
+                pickle.dump(task, f)
+            segment_paths.append(segment_path)
+            segment_workers.append(_SegmentWorker(segment_path + ".task", progress_queue))
+
+        failed: Optional[_SegmentWorker] = None
+        while any(worker.proc.poll() is None for worker in segment_workers):
+            time.sleep(0.1)
+            while not progress_queue.empty():
+                frames_done += progress_queue.get()
+            if progress_callback:
+                progress_callback(frames_done, total_frames)
+            # Stop the other workers as soon as one fails
+            if failed is None:
+                failed = next((worker for worker in segment_workers if worker.failed()), None)
+            if failed is not None or (cancel_event is not None and cancel_event.is_set()):
+                for worker in segment_workers:
+                    worker.cancel()
+
+        if failed is not None:
+            failed.result()  # Raises its error rather than the cancellation of the others
+        frames_done = 0
+        for index, worker in enumerate(segment_workers):
+            stats = worker.result()  # Raises the first worker error
+            logger.info(f"Segment {index}: {stats.summary()}")
+            frames_done += stats.frames
+
+        codec = "hevc" if settings.codec == "libx265" else "h264"
+        _concat_to_output(ffmpeg, segment_paths, source_path, output_path, work_dir, codec)
+    finally:
+        for worker in segment_workers:
+            worker.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    has_audio = source_has_audio(ffmpeg, source_path)
+    return ExportResult(output_path=output_path, frames_written=frames_done, has_audio=has_audio)
+
+
+def resolve_encoder_preset(name: str, source_path: Optional[str] = None) -> EncoderSettings:
+    """Get the encoder settings of a named preset.
+
+    "match source" probes the source video and encodes with the same codec
+    family (H.264 or HEVC, otherwise H.264) at the source's video bitrate.
+    Unknown names and failed probes fall back to the default preset.
+
+    Args:
+        name: Preset name (see ENCODER_PRESET_NAMES).
+        source_path: Source video, required for "match source".
+
+    Returns:
+        EncoderSettings for the preset.
+    """
+    if name == MATCH_SOURCE_PRESET:
+        ffprobe = find_ffprobe()
+        probe = probe_video(ffprobe, source_path) if ffprobe and source_path else None
+        if probe and probe.bit_rate:
+            settings = EncoderSettings(
+                codec=SMART_RENDER_ENCODERS.get(probe.codec, "libx264"),
+                preset="medium",
+                threads=0,
+                bitrate=probe.bit_rate,
+            )
+            logger.info(f"Matching source encoding: {probe.codec} at {probe.bit_rate / 1000:.0f} kb/s -> {settings.codec}")
+            return settings
+        logger.warning(f"Could not probe source for '{MATCH_SOURCE_PRESET}', using '{DEFAULT_ENCODER_PRESET}'")
+        name = DEFAULT_ENCODER_PRESET
+
+    if name not in ENCODER_PRESETS:
+        logger.warning(f"Unknown encoder preset {name!r}, using '{DEFAULT_ENCODER_PRESET}'")
+        name = DEFAULT_ENCODER_PRESET
+    return dataclasses.replace(ENCODER_PRESETS[name])
@@ -0,0 +1,429 @@
+"""Data model for Face Smudge sessions.
+
+This module holds the editing model shared by the interactive Face Smudge
+window and the export code.
+
+A session is a set of smudge tracks. Each track is one brush stroke: the
+blur parameters plus sparse keyframes recorded at the frames where the mouse
+position was actually sampled. Positions on the frames in between are
+linearly interpolated on demand, so a 30-second drag costs a handful of
+keyframes instead of one stored operation per frame.
+
+For rendering, tracks are expanded into an OperationStore: a columnar,
+NumPy-backed table with one row per (frame, track) that can be sliced per
+frame without creating Python objects.
+"""
+
+import bisect
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Initial row capacity of an OperationStore; grows by doubling
+STORE_INITIAL_CAPACITY = 1024
+
+
+@dataclass
+class SmudgeOperation:
+    """Represents a single smudge operation on a video frame."""
+
+    __slots__ = ("frame_number", "x", "y", "radius", "sigma", "timestamp", "operation_id")
+
+    frame_number: int
+    x: float  # X coordinate in frame (0-1 normalized)
+    y: float  # Y coordinate in frame (0-1 normalized)
+    radius: int  # Blur radius in pixels
+    sigma: float  # Blur strength (sigma for Gaussian)
+    timestamp: float  # When operation was created
+    operation_id: int  # Id of the track (or other source) the operation belongs to
+
+
+@dataclass
+class SmudgeTrack:
+    """A brush stroke over one or more frames, stored as sparse keyframes."""
+
+    track_id: int
+    radius: int  # Blur radius in pixels
+    sigma: float  # Blur strength (sigma for Gaussian)
+    timestamp: float  # When the track was created
+    frames: List[int] = field(default_factory=list)  # Sorted keyframe frame numbers
+    xs: List[float] = field(default_factory=list)  # Keyframe X (0-1 normalized)
+    ys: List[float] = field(default_factory=list)  # Keyframe Y (0-1 normalized)
+
+    @property
+    def start_frame(self) -> int:
+        """First frame covered by the track."""
+        return self.frames[0]
+
+    @property
+    def end_frame(self) -> int:
+        """Frame after the last frame covered by the track (exclusive)."""
+        return self.frames[-1] + 1
+
+    def add_keyframe(self, frame_number: int, x: float, y: float):
+        """Record the brush position on a frame.
+
+        Re-sampling a frame replaces its keyframe. When the brush is
+        stationary, the trailing keyframe is moved forward instead of adding
+        a new one, so holding still during playback stays O(1) in memory.
+
+        Args:
+            frame_number: Frame the position was sampled on.
+            x: X coordinate in frame (0-1 normalized).
+            y: Y coordinate in frame (0-1 normalized).
+        """
+        frames = self.frames
+        if not frames or frame_number > frames[-1]:
+            if (
+                len(frames) >= 2
+                and self.xs[-1] == self.xs[-2] == x
+                and self.ys[-1] == self.ys[-2] == y
+            ):
+                frames[-1] = frame_number
+                return
+            frames.append(frame_number)
+            self.xs.append(x)
+            self.ys.append(y)
+            return
+
+        i = bisect.bisect_left(frames, frame_number)
+        if i < len(frames) and frames[i] == frame_number:
+            self.xs[i] = x
+            self.ys[i] = y
+        else:
+            frames.insert(i, frame_number)
+            self.xs.insert(i, x)
+            self.ys.insert(i, y)
+
+    def position_at(self, frame_number: int) -> Optional[Tuple[float, float]]:
+        """Evaluate the brush position on a frame.
+
+        Args:
+            frame_number: Frame to evaluate.
+
+        Returns:
+            Tuple of (x, y) normalized coordinates, or None if the track does
+            not cover the frame.
+        """
+        frames = self.frames
+        if not frames or frame_number < frames[0] or frame_number > frames[-1]:
+            return None
+
+        i = bisect.bisect_left(frames, frame_number)
+        if frames[i] == frame_number:
+            return (self.xs[i], self.ys[i])
+
+        # Linear interpolation between the surrounding keyframes
+        f0, f1 = frames[i - 1], frames[i]
+        t = (frame_number - f0) / (f1 - f0)
+        x = self.xs[i - 1] + (self.xs[i] - self.xs[i - 1]) * t
+        y = self.ys[i - 1] + (self.ys[i] - self.ys[i - 1]) * t
+        return (x, y)
+
+    def operation_at(self, frame_number: int) -> Optional[SmudgeOperation]:
+        """Evaluate the track on a frame as a smudge operation.
+
+        Args:
+            frame_number: Frame to evaluate.
+
+        Returns:
+            SmudgeOperation for the frame, or None if the track does not cover it.
+        """
+        position = self.position_at(frame_number)
+        if position is None:
+            return None
+        return SmudgeOperation(
+            frame_number=frame_number,
+            x=position[0],
+            y=position[1],
+            radius=self.radius,
+            sigma=self.sigma,
+            timestamp=self.timestamp,
+            operation_id=self.track_id,
+        )
+
+
+class OperationStore:
+    """Columnar storage for per-frame smudge operations.
+
+    Rows are stored as parallel NumPy arrays (frame, x, y, radius, sigma,
+    id) instead of one Python object per operation, so hundreds of
+    thousands of operations take a few MB. Rows are appended in contiguous
+    runs per id, which gives O(1) lookup and removal by id. A per-frame
+    offset index (rows sorted by frame plus the frame boundaries) is built
+    lazily after modification and serves frame slices with two binary
+    searches.
+    """
+
+    __slots__ = (
+        "_frame",
+        "_x",
+        "_y",
+        "_radius",
+        "_sigma",
+        "_id",
+        "_alive",
+        "_size",
+        "_count",
+        "_spans",
+        "_order",
+        "_order_frames",
+    )
+
+    def __init__(self, capacity: int = STORE_INITIAL_CAPACITY):
+        """Initialize an empty store.
+
+        Args:
+            capacity: Initial number of rows to allocate.
+        """
+        capacity = max(1, capacity)
+        self._frame = np.empty(capacity, dtype=np.int64)
+        self._x = np.empty(capacity, dtype=np.float32)
+        self._y = np.empty(capacity, dtype=np.float32)
+        self._radius = np.empty(capacity, dtype=np.int32)
+        self._sigma = np.empty(capacity, dtype=np.float32)
+        self._id = np.empty(capacity, dtype=np.int64)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._size = 0  # Rows used, including removed ones
+        self._count = 0  # Live rows
+        self._spans: Dict[int, List[Tuple[int, int]]] = {}  # id -> [(row_start, row_end)]
+        self._order: Optional[np.ndarray] = None
+        self._order_frames: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_tracks(cls, tracks: Iterable[SmudgeTrack]) -> "OperationStore":
+        """Expand tracks into one row per covered frame.
+
+        Interpolation is vectorized per track, matching
+        SmudgeTrack.position_at.
+
+        Args:
+            tracks: Tracks to expand; rows are ordered by track id.
+
+        Returns:
+            A new OperationStore.
+        """
+        ordered = sorted(tracks, key=lambda t: t.track_id)
+        store = cls(sum(t.end_frame - t.start_frame for t in ordered if t.frames))
+        for track in ordered:
+            store.add_track(track)
+        return store
+
+    def __len__(self) -> int:
+        """Return the number of live rows."""
+        return self._count
+
+    def __contains__(self, op_id: int) -> bool:
+        """Check whether any rows exist for an id."""
+        return op_id in self._spans
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the column arrays in bytes."""
+        return sum(
+            a.nbytes for a in (self._frame, self._x, self._y, self._radius, self._sigma, self._id, self._alive)
+        )
+
+    @property
+    def frame(self) -> np.ndarray:
+        """Frame number column (including removed rows)."""
+        return self._frame[: self._size]
+
+    @property
+    def x(self) -> np.ndarray:
+        """Normalized X column (including removed rows)."""
+        return self._x[: self._size]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Normalized Y column (including removed rows)."""
+        return self._y[: self._size]
+
+    @property
+    def radius(self) -> np.ndarray:
+        """Blur radius column (including removed rows)."""
+        return self._radius[: self._size]
+
+    @property
+    def sigma(self) -> np.ndarray:
+        """Blur sigma column (including removed rows)."""
+        return self._sigma[: self._size]
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Id column (including removed rows)."""
+        return self._id[: self._size]
+
+    def _reserve(self, rows: int):
+        """Grow the column arrays to hold at least ``rows`` more rows."""
+        needed = self._size + rows
+        capacity = len(self._frame)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_frame", "_x", "_y", "_radius", "_sigma", "_id", "_alive"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype) if name == "_alive" else np.empty(capacity, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            setattr(self, name, new)
+
+    def extend(
+        self,
+        frames: np.ndarray,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        radius: Union[int, np.ndarray],
+        sigma: Union[float, np.ndarray],
+        op_id: int,
+    ):
+        """Append a contiguous run of rows sharing an id.
+
+        Args:
+            frames: Frame numbers of the new rows.
+            xs: Normalized X coordinates, one per row.
+            ys: Normalized Y coordinates, one per row.
+            radius: Blur radius in pixels, for all rows or one per row.
+            sigma: Blur sigma, for all rows or one per row.
+            op_id: Id of the operation or track the rows belong to.
+        """
+        n = len(frames)
+        if n == 0:
+            return
+        self._reserve(n)
+        start, end = self._size, self._size + n
+        self._frame[start:end] = frames
+        self._x[start:end] = xs
+        self._y[start:end] = ys
+        self._radius[start:end] = radius
+        self._sigma[start:end] = sigma
+        self._id[start:end] = op_id
+        self._alive[start:end] = True
+        self._size = end
+        self._count += n
+
+        spans = self._spans.setdefault(op_id, [])
+        if spans and spans[-1][1] == start:
+            spans[-1] = (spans[-1][0], end)
+        else:
+            spans.append((start, end))
+        self._order = None
+
+    def append(self, frame_number: int, x: float, y: float, radius: int, sigma: float, op_id: int):
+        """Append a single row."""
+        self.extend(np.array([frame_number]), np.array([x]), np.array([y]), radius, sigma, op_id)
+
+    def add_track(self, track: SmudgeTrack):
+        """Append one row per frame covered by a track."""
+        if not track.frames:
+            return
+        frames = np.arange(track.start_frame, track.end_frame, dtype=np.int64)
+        keyframes = np.asarray(track.frames, dtype=np.float64)
+        xs = np.interp(frames, keyframes, track.xs)
+        ys = np.interp(frames, keyframes, track.ys)
+        self.extend(frames, xs, ys, track.radius, track.sigma, track.track_id)
+
+    def rows_for_id(self, op_id: int) -> np.ndarray:
+        """Get the row indices belonging to an id.
+
+        Args:
+            op_id: Id to look up.
+
+        Returns:
+            Array of row indices (empty if the id is unknown).
+        """
+        spans = self._spans.get(op_id)
+        if not spans:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([np.arange(start, end) for start, end in spans])
+
+    def remove(self, op_id: int) -> int:
+        """Remove all rows belonging to an id.
+
+        Args:
+            op_id: Id to remove.
+
+        Returns:
+            Number of rows removed.
+        """
+        spans = self._spans.pop(op_id, None)
+        if not spans:
+            return 0
+        removed = 0
+        for start, end in spans:
+            self._alive[start:end] = False
+            removed += end - start
+        self._count -= removed
+        self._order = None
+        return removed
+
+    def clear(self):
+        """Remove all rows, keeping the allocated capacity."""
+        self._alive[: self._size] = False
+        self._size = 0
+        self._count = 0
+        self._spans.clear()
+        self._order = None
+
+    def _frame_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the per-frame index over live rows, building it if needed.
+
+        Returns:
+            Tuple of (rows sorted by frame, their frame numbers).
+        """
+        if self._order is None or self._order_frames is None:
+            live = np.flatnonzero(self._alive[: self._size])
+            self._order = live[np.argsort(self._frame[live], kind="stable")]
+            self._order_frames = self._frame[self._order]
+        return self._order, self._order_frames
+
+    def frame_rows(self, frame_number: int) -> np.ndarray:
+        """Get the live rows on a frame, in insertion order.
+
+        Args:
+            frame_number: Frame to slice.
+
+        Returns:
+            Array of row indices into the column arrays.
+        """
+        order, order_frames = self._frame_index()
+        lo = np.searchsorted(order_frames, frame_number, side="left")
+        hi = np.searchsorted(order_frames, frame_number, side="right")
+        return order[lo:hi]
+
+    def slice_frames(self, start: int, end: int) -> "OperationStore":
+        """Copy the live rows on frames ``[start, end)`` into a new, compact store.
+
+        Used to hand each export worker only the operations of its segment.
+
+        Args:
+            start: First frame of the range.
+            end: Frame after the last frame of the range.
+
+        Returns:
+            A new OperationStore with the selected rows, in insertion order.
+        """
+        size = self._size
+        mask = self._alive[:size] & (self._frame[:size] >= start) & (self._frame[:size] < end)
+        rows = np.flatnonzero(mask)
+        result = OperationStore(len(rows))
+        if len(rows) == 0:
+            return result
+
+        # Each run of consecutive rows with the same id is copied with one extend()
+        ids = self._id[rows]
+        breaks = np.flatnonzero(np.diff(ids)) + 1
+        for run in np.split(rows, breaks):
+            result.extend(
+                self._frame[run], self._x[run], self._y[run], self._radius[run], self._sigma[run], int(self._id[run[0]])
+            )
+        return result
+
+    def frames(self) -> np.ndarray:
+        """Get the sorted unique frame numbers that have live rows."""
+        _, order_frames = self._frame_index()
+        return np.unique(order_frames)
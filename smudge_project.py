@@ -0,0 +1,371 @@
+"""Project files for Face Smudge sessions.
+
+A project file is a versioned JSON Lines journal. The first line is a header
+identifying the format and the source video (by path and content
+fingerprint); every following line is one edit record:
+
+    {"op": "add", "id": 3, "r": 50, "s": 25.0, "t": 1700000000.0,
+     "f": [10, 42], "x": [0.5, 0.52], "y": [0.4, 0.41]}
+    {"op": "remove", "id": 3}
+    {"op": "clear"}
+
+Edits are only ever appended, so autosaving costs O(delta) regardless of the
+session size. Loading replays the records in order; when the journal holds
+many more records than live tracks it is compacted by rewriting it with one
+"add" record per live track.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config_manager import get_config_path
+from smudge_model import SmudgeTrack
+
+logger = logging.getLogger(__name__)
+
+PROJECT_FORMAT = "sightline-smudge"
+PROJECT_VERSION = 1
+PROJECT_SUFFIX = ".smudge"
+
+# Seconds between background journal flushes
+AUTOSAVE_INTERVAL = 3.0
+
+# Compact once the journal has at least this many dead records and more dead
+# records than live tracks
+COMPACT_MIN_DEAD_RECORDS = 256
+
+# Bytes hashed from each sampled block of the source video
+FINGERPRINT_BLOCK_SIZE = 1024 * 1024
+FINGERPRINT_BLOCKS = 8
+
+
+class ProjectError(Exception):
+    """Raised when a project file cannot be read."""
+
+
+def fingerprint_file(path: str) -> str:
+    """Compute a content fingerprint for a (possibly very large) file.
+
+    Hashes the file size and a fixed number of evenly spaced blocks instead
+    of the whole file, so multi-GB videos are fingerprinted in milliseconds.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Hex digest identifying the file contents.
+    """
+    size = os.path.getsize(path)
+    digest = hashlib.sha256(str(size).encode("ascii"))
+    with open(path, "rb") as f:
+        if size <= FINGERPRINT_BLOCK_SIZE * FINGERPRINT_BLOCKS:
+            digest.update(f.read())
+        else:
+            step = (size - FINGERPRINT_BLOCK_SIZE) // (FINGERPRINT_BLOCKS - 1)
+            for i in range(FINGERPRINT_BLOCKS):
+                f.seek(i * step)
+                digest.update(f.read(FINGERPRINT_BLOCK_SIZE))
+    return digest.hexdigest()
+
+
+def get_project_path(video_path: str) -> Path:
+    """Get the default project file path for a video.
+
+    The project is stored next to the video when that directory is writable,
+    otherwise in a ``smudge_projects`` directory beside the config file.
+
+    Args:
+        video_path: Path to the source video.
+
+    Returns:
+        Path of the project file.
+    """
+    video = Path(video_path)
+    candidate = video.with_name(video.name + PROJECT_SUFFIX)
+    if os.access(video.parent, os.W_OK):
+        return candidate
+
+    projects_dir = get_config_path().parent / "smudge_projects"
+    projects_dir.mkdir(parents=True, exist_ok=True)
+    return projects_dir / candidate.name
+
+
+def track_to_record(track: SmudgeTrack) -> Dict[str, Any]:
+    """Serialize a track as an "add" journal record."""
+    return {
+        "op": "add",
+        "id": track.track_id,
+        "r": track.radius,
+        "s": track.sigma,
+        "t": round(track.timestamp, 3),
+        "f": track.frames,
+        "x": [round(v, 5) for v in track.xs],
+        "y": [round(v, 5) for v in track.ys],
+    }
+
+
+def track_from_record(record: Dict[str, Any]) -> SmudgeTrack:
+    """Deserialize a track from an "add" journal record."""
+    return SmudgeTrack(
+        track_id=int(record["id"]),
+        radius=int(record["r"]),
+        sigma=float(record["s"]),
+        timestamp=float(record.get("t", 0.0)),
+        frames=[int(f) for f in record["f"]],
+        xs=[float(v) for v in record["x"]],
+        ys=[float(v) for v in record["y"]],
+    )
+
+
+def _encode(record: Dict[str, Any]) -> str:
+    """Encode a record as one compact JSON line."""
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+@dataclass
+class SmudgeProject:
+    """State of a project after replaying its journal."""
+
+    path: Path
+    header: Dict[str, Any]
+    video_path: str
+    video_hash: str
+    tracks: List[SmudgeTrack] = field(default_factory=list)  # In creation order
+    record_count: int = 0  # Edit records in the journal (excluding the header)
+
+    @property
+    def next_track_id(self) -> int:
+        """Track id to continue numbering new tracks from."""
+        return max((t.track_id for t in self.tracks), default=0) + 1
+
+
+def make_header(video_path: str, video_hash: str) -> Dict[str, Any]:
+    """Build the header record of a project file."""
+    return {
+        "format": PROJECT_FORMAT,
+        "version": PROJECT_VERSION,
+        "video": {"path": os.path.abspath(video_path), "hash": video_hash},
+        "created": round(time.time(), 3),
+    }
+
+
+def load_project(path: str) -> SmudgeProject:
+    """Load a project by replaying its journal.
+
+    A truncated last line (e.g. after a crash mid-write) is ignored. The
+    journal is compacted in place when it contains many dead records.
+
+    Args:
+        path: Path of the project file.
+
+    Returns:
+        The replayed project.
+
+    Raises:
+        ProjectError: If the file is not a supported project file.
+    """
+    project_path = Path(path)
+    try:
+        with open(project_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError as e:
+        raise ProjectError(f"Could not read project file: {e}") from e
+
+    if not lines:
+        raise ProjectError("Project file is empty")
+    try:
+        header = json.loads(lines[0])
+    except ValueError as e:
+        raise ProjectError(f"Invalid project header: {e}") from e
+    if header.get("format") != PROJECT_FORMAT:
+        raise ProjectError("Not a Face Smudge project file")
+    if header.get("version", 0) > PROJECT_VERSION:
+        raise ProjectError(f"Unsupported project version {header.get('version')}")
+
+    live: Dict[int, Dict[str, Any]] = {}  # Insertion order is creation order
+    record_count = 0
+    # A last line without a newline would swallow the next appended record
+    needs_rewrite = not lines[-1].endswith("\n")
+    for line_number, line in enumerate(lines[1:], start=2):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            if line_number == len(lines):
+                logger.warning(f"Ignoring truncated last record in {project_path}")
+                needs_rewrite = True
+                break
+            raise ProjectError(f"Invalid record on line {line_number}")
+        record_count += 1
+        op = record.get("op")
+        if op == "add":
+            live.pop(record["id"], None)  # A re-added track moves to the end
+            live[record["id"]] = record
+        elif op == "remove":
+            live.pop(record["id"], None)
+        elif op == "clear":
+            live.clear()
+        else:
+            logger.warning(f"Ignoring unknown record type {op!r} on line {line_number}")
+
+    video = header.get("video", {})
+    project = SmudgeProject(
+        path=project_path,
+        header=header,
+        video_path=video.get("path", ""),
+        video_hash=video.get("hash", ""),
+        tracks=[track_from_record(r) for r in live.values()],
+        record_count=record_count,
+    )
+
+    dead = record_count - len(live)
+    if needs_rewrite or (dead >= COMPACT_MIN_DEAD_RECORDS and dead > len(live)):
+        try:
+            _write_compacted(project_path, header, [_encode(r) for r in live.values()])
+            project.record_count = len(live)
+        except OSError as e:
+            logger.warning(f"Could not compact project file {project_path}: {e}")
+
+    logger.info(f"Loaded project {project_path}: {len(project.tracks)} track(s) from {record_count} record(s)")
+    return project
+
+
+def _write_compacted(path: Path, header: Dict[str, Any], lines: List[str]):
+    """Atomically rewrite a project with the header and the given encoded records."""
+    fd, temp_path = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(_encode(header))
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ProjectJournal:
+    """Append-only writer for a project file with background flushing.
+
+    Edits are queued from the UI thread and written by a daemon thread every
+    AUTOSAVE_INTERVAL seconds. The journal keeps the encoded "add" record of
+    each live track so it can compact the file without touching UI state.
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any], tracks: Optional[List[SmudgeTrack]] = None,
+                 record_count: Optional[int] = None):
+        """Open a journal.
+
+        If ``record_count`` is None a new project file is written containing
+        the header and ``tracks``; otherwise the existing file (holding
+        ``record_count`` edit records for ``tracks``) is appended to.
+
+        Args:
+            path: Path of the project file.
+            header: Header record (see make_header).
+            tracks: Live tracks already in the project.
+            record_count: Number of edit records already in the file.
+        """
+        self.path = path
+        self.header = header
+        self._live: Dict[int, str] = {t.track_id: _encode(track_to_record(t)) for t in tracks or []}
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+
+        if record_count is None:
+            _write_compacted(path, header, list(self._live.values()))
+            self._record_count = len(self._live)
+        else:
+            self._record_count = record_count
+
+        self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def create(cls, path: Path, video_path: str, video_hash: str) -> "ProjectJournal":
+        """Start a new, empty project file (replacing any existing one)."""
+        return cls(path, make_header(video_path, video_hash))
+
+    @classmethod
+    def resume(cls, project: SmudgeProject) -> "ProjectJournal":
+        """Continue appending to a loaded project."""
+        return cls(project.path, project.header, project.tracks, project.record_count)
+
+    def record_add(self, track: SmudgeTrack):
+        """Journal a track being added (or re-added)."""
+        line = _encode(track_to_record(track))
+        with self._lock:
+            self._live.pop(track.track_id, None)
+            self._live[track.track_id] = line
+            self._pending.append(line)
+
+    def record_remove(self, track_id: int):
+        """Journal a track being removed."""
+        with self._lock:
+            self._live.pop(track_id, None)
+            self._pending.append(_encode({"op": "remove", "id": track_id}))
+
+    def record_clear(self):
+        """Journal all tracks being removed."""
+        with self._lock:
+            self._live.clear()
+            self._pending.append(_encode({"op": "clear"}))
+
+    def _flush_loop(self):
+        """Flush pending records periodically until closed."""
+        while not self._stop.wait(AUTOSAVE_INTERVAL):
+            try:
+                self.flush()
+            except OSError as e:
+                logger.error(f"Error autosaving project {self.path}: {e}")
+
+    def flush(self):
+        """Write pending records, compacting the file if it is mostly dead records."""
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                live = list(self._live.values())
+            if not pending:
+                return
+
+            record_count = self._record_count + len(pending)
+            dead = record_count - len(live)
+            try:
+                if dead >= COMPACT_MIN_DEAD_RECORDS and dead > len(live):
+                    # The live records already reflect the pending edits
+                    _write_compacted(self.path, self.header, live)
+                    record_count = len(live)
+                    logger.debug(f"Compacted project {self.path} to {record_count} record(s)")
+                else:
+                    with open(self.path, "a", encoding="utf-8") as f:
+                        f.writelines(pending)
+                        f.flush()
+                        os.fsync(f.fileno())
+            except OSError:
+                # Keep the records so the next flush retries them
+                with self._lock:
+                    self._pending[:0] = pending
+                raise
+            self._record_count = record_count
+
+    def close(self):
+        """Stop the background thread and write any pending records."""
+        self._stop.set()
+        self._thread.join(timeout=AUTOSAVE_INTERVAL)
+        try:
+            self.flush()
+        except OSError as e:
+            logger.error(f"Error saving project {self.path}: {e}")
@@ -0,0 +1,237 @@
+"""Headless rendering of Face Smudge projects.
+
+Renders a saved project (see smudge_project) onto its source video with the
+same compositor and exporters as the Face Smudge window, without importing
+Tk, so finished projects can be rendered on a machine without a display:
+
+    python main.py render-smudge video.mp4.smudge video.mp4 -o out.mp4
+
+Encoder preset, smart render and worker count default to the Face Smudge
+settings in the saved configuration.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+from typing import Callable, List, Optional
+
+from config_manager import get_default_config, load_config
+from smudge_export import (
+    ENCODER_PRESET_NAMES,
+    ExportCancelled,
+    ExportError,
+    ExportProgress,
+    ExportResult,
+    format_duration,
+    parallel_export_smudged_video,
+    resolve_encoder_preset,
+    smart_export_smudged_video,
+)
+from smudge_model import OperationStore
+from smudge_project import ProjectError, fingerprint_file, load_project
+
+logger = logging.getLogger(__name__)
+
+# Seconds between progress lines written to stderr
+PROGRESS_REPORT_INTERVAL = 2.0
+
+# Exit codes
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_CANCELLED = 130
+
+
+def render_project(
+    project_path: str,
+    source_path: str,
+    output_path: str,
+    encoder_preset: str,
+    smart_render: bool = True,
+    workers: int = 0,
+    force: bool = False,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> ExportResult:
+    """Render the smudges of a project onto a video.
+
+    Args:
+        project_path: Face Smudge project file.
+        source_path: Source video the project was made for.
+        output_path: Output video file.
+        encoder_preset: Encoder preset name (see ENCODER_PRESET_NAMES).
+        smart_render: Re-encode only the GOPs that contain smudges when possible.
+        workers: Worker processes for a full export (0 uses the CPU count).
+        force: Render even if the video does not match the project fingerprint.
+        progress_callback: Called with (frames_done, total_frames).
+        cancel_event: When set, the export stops and the partial output is removed.
+
+    Returns:
+        ExportResult describing the written file.
+
+    Raises:
+        ProjectError: If the project cannot be read or does not match the video.
+        ExportError: If the export fails or is cancelled.
+    """
+    if not os.path.isfile(source_path):
+        raise ExportError(f"Source video does not exist: {source_path}")
+
+    project = load_project(project_path)
+    if not project.tracks:
+        raise ProjectError("Project has no smudge tracks")
+
+    if project.video_hash and project.video_hash != fingerprint_file(source_path):
+        message = f"{source_path} does not match the video the project was made for ({project.video_path})"
+        if not force:
+            raise ProjectError(message)
+        logger.warning(message)
+
+    store = OperationStore.from_tracks(project.tracks)
+    logger.info(
+        f"Rendering {len(project.tracks)} track(s), {len(store)} smudge operations "
+        f"({store.nbytes / 1024:.0f} KB) to {output_path}"
+    )
+
+    settings = resolve_encoder_preset(encoder_preset, source_path)
+    export = smart_export_smudged_video if smart_render else parallel_export_smudged_video
+    return export(
+        source_path,
+        output_path,
+        store,
+        settings=settings,
+        workers=workers,
+        progress_callback=progress_callback,
+        cancel_event=cancel_event,
+    )
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse render-smudge command-line arguments.
+
+    Args:
+        argv: Arguments following the ``render-smudge`` command.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    face_smudge_config = load_config().get(
+        "face_smudge_config", get_default_config()["face_smudge_config"]
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="main.py render-smudge",
+        description="Render a Face Smudge project onto its source video without the GUI.",
+    )
+    parser.add_argument("project", help="Face Smudge project file (.smudge)")
+    parser.add_argument("input", help="Source video the project was made for")
+    parser.add_argument("-o", "--output", required=True, help="Output video file")
+    parser.add_argument(
+        "--preset",
+        choices=ENCODER_PRESET_NAMES,
+        default=face_smudge_config.get("encoder_preset", "balanced"),
+        help="Encoder preset (default: from the Face Smudge settings)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=face_smudge_config.get("export_workers", 0),
+        help="Export worker processes, 0 for one per CPU core (default: from the Face Smudge settings)",
+    )
+    parser.add_argument(
+        "--smart-render",
+        dest="smart_render",
+        action="store_true",
+        help="Re-encode only the GOPs that contain smudges (default: from the Face Smudge settings)",
+    )
+    parser.add_argument(
+        "--no-smart-render",
+        dest="smart_render",
+        action="store_false",
+        help="Always re-encode the whole video",
+    )
+    parser.set_defaults(smart_render=face_smudge_config.get("smart_render", True))
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Render even if the input does not match the project's video fingerprint",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="INFO",
+        help="Set the logging level (default: INFO)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    """Run the render-smudge command.
+
+    Args:
+        argv: Arguments following the ``render-smudge`` command.
+
+    Returns:
+        Process exit code.
+    """
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stderr,
+    )
+
+    # The export runs in a thread so Ctrl+C can cancel it cleanly
+    progress = ExportProgress()
+    cancel_event = threading.Event()
+    outcome: dict = {}
+
+    def render():
+        try:
+            outcome["result"] = render_project(
+                args.project,
+                args.input,
+                args.output,
+                args.preset,
+                smart_render=args.smart_render,
+                workers=args.workers,
+                force=args.force,
+                progress_callback=progress.update,
+                cancel_event=cancel_event,
+            )
+        except ExportCancelled:
+            outcome["cancelled"] = True
+        except (ProjectError, ExportError) as e:
+            outcome["error"] = str(e)
+        except Exception as e:
+            logger.error(f"Unexpected error rendering project: {e}", exc_info=True)
+            outcome["error"] = str(e)
+
+    render_thread = threading.Thread(target=render, daemon=True)
+    render_thread.start()
+    try:
+        while True:
+            render_thread.join(PROGRESS_REPORT_INTERVAL)
+            if not render_thread.is_alive():
+                break
+            frames_done, total_frames, fps, eta = progress.snapshot()
+            if total_frames:
+                status = f"Frame {frames_done} / {total_frames}"
+                if fps > 0:
+                    status += f"  |  {fps:.1f} fps"
+                if eta is not None:
+                    status += f"  |  ETA {format_duration(eta)}"
+                print(status, file=sys.stderr, flush=True)
+    except KeyboardInterrupt:
+        print("Cancelling...", file=sys.stderr, flush=True)
+        cancel_event.set()
+        render_thread.join()
+
+    if "result" in outcome:
+        print(f"Rendered {outcome['result'].frames_written} frames to {args.output}", file=sys.stderr)
+        return EXIT_OK
+    if "error" in outcome:
+        print(f"Error: {outcome['error']}", file=sys.stderr)
+        return EXIT_FAILED
+    print("Render cancelled", file=sys.stderr)
+    return EXIT_CANCELLED
@@ -0,0 +1,72 @@
+"""Parallel export worker process.
+
+smudge_export.parallel_export_smudged_video() starts one worker per
+segment with this script (see smudge_export.segment_worker_command). It
+runs in a new interpreter rather than a multiprocessing child, which would
+re-import the parent's main module: for the GUI that is main.py with Tk,
+customtkinter and the views.
+
+The only argument is a pickled task holding the arguments of
+smudge_export.export_segment(). The worker writes the number of frames
+encoded since its previous report to stdout, one per line, stops when its
+stdin is closed, and pickles its result (the PipelineStats of the segment, or
+the ExportError that stopped it) to the task path plus ".result".
+"""
+
+import logging
+import os
+import pickle
+import sys
+import threading
+from typing import List, Union
+
+from smudge_export import ExportError, PipelineStats, export_segment
+
+
+def main(argv: List[str]) -> int:
+    """Export the segment described by a task file.
+
+    Args:
+        argv: Path of the task file.
+
+    Returns:
+        Exit code: 0 on success, 1 if the export failed.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s")
+    task_path = argv[0]
+    with open(task_path, "rb") as task_file:
+        task = pickle.load(task_file)
+
+    # The parent cancels by closing stdin, which also happens when it exits
+    cancel_event = threading.Event()
+
+    def wait_for_cancel():
+        # Unbuffered, so the blocked read does not hold a lock at interpreter exit
+        while os.read(sys.stdin.fileno(), 1024):
+            pass
+        cancel_event.set()
+
+    threading.Thread(target=wait_for_cancel, daemon=True).start()
+
+    def report_progress(frames: int):
+        print(frames, flush=True)
+
+    result: Union[PipelineStats, ExportError]
+    try:
+        result = export_segment(**task, report_progress=report_progress, cancel_event=cancel_event)
+        exit_code = 0
+    except ExportError as e:
+        result = e
+        exit_code = 1
+    except Exception as e:
+        logging.exception("Export worker failed")
+        result = ExportError(f"Export worker failed: {e}")
+        exit_code = 1
+
+    with open(task_path + ".result", "wb") as result_file:
+        pickle.dump(result, result_file)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
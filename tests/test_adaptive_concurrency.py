@@ -0,0 +1,81 @@
+"""Unit tests for adaptive_concurrency.py."""
+
+from adaptive_concurrency import (
+    MEMORY_PER_JOB,
+    MEMORY_RESERVE,
+    AdaptiveConcurrency,
+    initial_concurrency,
+    is_auto_batch_size,
+)
+
+GB = 1024 * 1024 * 1024
+
+
+def _controller(throughputs, load=0.5, memory=64 * GB, max_concurrency=8):
+    """Build a controller driven by a fake clock and a fixed throughput script.
+
+    ``memory`` is the available memory, or a function of the number of
+    running jobs that returns it.
+    """
+    clock = [0.0]
+    running = [0]
+
+    def memory_probe():
+        return memory(running[0]) if callable(memory) else memory
+
+    controller = AdaptiveConcurrency(
+        max_concurrency=max_concurrency,
+        interval=10.0,
+        clock=lambda: clock[0],
+        memory_probe=memory_probe,
+        load_probe=lambda: load,
+    )
+    controller.concurrency = running[0] = 2
+    frames = [0]
+
+    def step(fps):
+        clock[0] += 10.0
+        frames[0] += int(fps * 10)
+        controller.observe(frames[0])
+        running[0] = controller.concurrency
+        return controller.concurrency
+
+    controller.observe(0)
+    return [step(fps) for fps in throughputs]
+
+
+def test_initial_concurrency():
+    """Test that the starting point is bounded by CPUs and memory."""
+    assert initial_concurrency(16, None, 8) == 4
+    assert initial_concurrency(16, MEMORY_RESERVE + MEMORY_PER_JOB * 2, 8) == 2
+    assert initial_concurrency(2, 64 * GB, 8) == 1
+    assert is_auto_batch_size(" Auto ")
+    assert not is_auto_batch_size(4)
+
+
+class TestAdaptiveConcurrency:
+    """Tests for the hill-climbing controller."""
+
+    def test_climbs_while_throughput_improves(self):
+        """Test that concurrency grows while throughput grows, then steps back."""
+        history = _controller([100, 150, 200, 180, 180])
+
+        assert history == [3, 4, 5, 4, 4]
+
+    def test_backs_off_when_overloaded(self):
+        """Test that high load reduces concurrency regardless of throughput."""
+        assert _controller([100, 200], load=3.0) == [1, 1]
+
+    def test_respects_memory(self):
+        """Test that concurrency climbs to, but not past, what fits in memory."""
+
+        def memory(running):
+            return MEMORY_RESERVE + MEMORY_PER_JOB * (5 - running)
+
+        history = _controller([100, 200, 300, 400, 500], memory=memory)
+
+        assert history == [3, 4, 5, 5, 5]
+
+    def test_backs_off_when_short_on_memory(self):
+        """Test that concurrency drops when free memory falls below the reserve."""
+        assert _controller([100, 200], memory=MEMORY_RESERVE - 1) == [1, 1]
@@ -0,0 +1,108 @@
+"""Unit tests for batch_executor.py."""
+
+import threading
+
+from batch_executor import BatchExecutor
+
+
+class TestBatchExecutor:
+    """Tests for the BatchExecutor class."""
+
+    def test_runs_all_jobs_within_concurrency(self):
+        """Test that every job runs and concurrency never exceeds the limit."""
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+        done = []
+
+        def run_job(job):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            threading.Event().wait(0.01)
+            with lock:
+                running[0] -= 1
+                done.append(job)
+
+        finished = threading.Event()
+        executor = BatchExecutor(run_job, 3, on_finished=finished.set)
+        executor.start(range(20))
+
+        assert executor.wait(5)
+        assert finished.is_set()
+        assert sorted(done) == list(range(20))
+        assert peak[0] <= 3
+
+    def test_next_job_dispatched_on_completion(self):
+        """Test that a finished job immediately frees its slot for the next one."""
+        order = []
+        release_first = threading.Event()
+
+        def run_job(job):
+            if job == "slow":
+                release_first.wait(5)
+            order.append(job)
+            if job == "fast-2":
+                release_first.set()
+
+        executor = BatchExecutor(run_job, 2)
+        executor.start(["slow", "fast-1", "fast-2"])
+
+        assert executor.wait(5)
+        assert order == ["fast-1", "fast-2", "slow"]
+
+    def test_failures_reported_and_stop_drains(self):
+        """Test that job errors are reported and stop() skips pending jobs."""
+        results = []
+        gate = threading.Event()
+
+        def run_job(job):
+            gate.wait(5)
+            if job == 0:
+                raise RuntimeError("boom")
+
+        executor = BatchExecutor(
+            run_job, 1, on_job_done=lambda job, error: results.append((job, error))
+        )
+        executor.start(range(5))
+        executor.stop()
+        gate.set()
+
+        assert executor.wait(5)
+        assert len(results) == 1
+        assert isinstance(results[0][1], RuntimeError)
+        assert executor.pending == 0
+
+    def test_set_concurrency_dispatches_more_jobs(self):
+        """Test that raising the concurrency starts pending jobs immediately."""
+        gate = threading.Event()
+        started = []
+
+        def run_job(job):
+            started.append(job)
+            gate.wait(5)
+
+        executor = BatchExecutor(run_job, 1, max_concurrency=4)
+        executor.start(range(6))
+        executor.set_concurrency(3)
+
+        assert executor.active == 3
+        assert executor.pending == 3
+        gate.set()
+        assert executor.wait(5)
+        assert sorted(started) == list(range(6))
+
+    def test_priority_dispatch(self):
+        """Test that free slots take the highest-priority pending job."""
+        order = []
+        executor = BatchExecutor(order.append, 1, priority=lambda job: job["cost"])
+        executor.start(
+            [
+                {"name": "short", "cost": 1},
+                {"name": "long", "cost": 100},
+                {"name": "medium", "cost": 10},
+            ]
+        )
+
+        assert executor.wait(5)
+        assert [job["name"] for job in order] == ["long", "medium", "short"]
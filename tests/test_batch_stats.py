@@ -0,0 +1,89 @@
+"""Unit tests for batch_stats.py."""
+
+import os
+
+import pytest
+
+from batch_stats import (
+    CpuMonitor,
+    JobWork,
+    ThroughputMeter,
+    process_cpu_seconds,
+    summarize_batch,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSummarizeBatch:
+    """Tests for the batch summary."""
+
+    def test_summary(self):
+        """Test completed and remaining work and the queue ETA."""
+        jobs = [
+            JobWork("success", 1000, 1000),
+            JobWork("processing", 600, 200),
+            JobWork("pending", 300, 0),
+            JobWork("failed", 500, 100),
+        ]
+
+        summary = summarize_batch(jobs, fps=50.0)
+
+        assert (summary.completed_files, summary.total_files) == (1, 4)
+        assert summary.frames_done == 1200
+        assert summary.frames_remaining == 700
+        assert summary.eta == pytest.approx(14.0)
+
+    def test_eta_unknown_without_throughput(self):
+        """Test that the ETA is unknown until throughput was observed."""
+        assert summarize_batch([JobWork("pending", 300, 0)], fps=0.0).eta is None
+        assert summarize_batch([JobWork("success", 300, 300)], fps=0.0).eta == 0.0
+
+
+class TestThroughputMeter:
+    """Tests for the sliding-window throughput."""
+
+    def test_sliding_window(self):
+        """Test that throughput reflects only the recent window."""
+        clock = FakeClock()
+        meter = ThroughputMeter(window=10.0, clock=clock)
+        assert meter.update(0) == 0.0
+
+        for second in range(1, 21):
+            clock.now = second
+            # 100 frames/s for 10 seconds, then 20 frames/s
+            frames = second * 100 if second <= 10 else 1000 + (second - 10) * 20
+            meter.update(frames)
+
+        assert meter.fps == pytest.approx(20.0)
+
+
+class TestCpuMonitor:
+    """Tests for worker process CPU utilisation."""
+
+    def test_utilisation(self):
+        """Test that CPU time deltas are averaged over the machine's cores."""
+        clock = FakeClock()
+        times = {1: 10.0, 2: 5.0}
+        monitor = CpuMonitor(clock=clock, cpu_seconds=times.get, cpu_count=4)
+        assert monitor.sample([1, 2]) is None
+
+        clock.now = 2.0
+        times[1] += 2.0  # One core busy
+        times[2] += 1.0  # Half a core busy
+        assert monitor.sample([1, 2]) == pytest.approx(37.5)
+
+    def test_own_process(self):
+        """Test that the CPU time of a running process can be read."""
+        seconds = process_cpu_seconds(os.getpid())
+        if seconds is None:
+            pytest.skip("Process CPU times are not available on this platform")
+        assert seconds >= 0
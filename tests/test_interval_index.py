@@ -0,0 +1,106 @@
+"""Unit tests for interval_index.py."""
+
+from interval_index import FrameIntervalSet, IntervalIndex
+
+
+class TestFrameIntervalSet:
+    """Tests for the FrameIntervalSet class."""
+
+    def test_adjacent_frames_merge(self):
+        """Test that adjacent frames are stored as a single range."""
+        intervals = FrameIntervalSet()
+        for frame in range(10, 20):
+            intervals.add(frame)
+
+        assert list(intervals) == [(10, 20)]
+        assert intervals.total == 10
+        assert 10 in intervals
+        assert 19 in intervals
+        assert 20 not in intervals
+
+    def test_add_range_bridges_ranges(self):
+        """Test that adding a range merges all overlapping ranges."""
+        intervals = FrameIntervalSet()
+        intervals.add_range(0, 5)
+        intervals.add_range(10, 15)
+        intervals.add_range(20, 25)
+        intervals.add_range(4, 21)
+
+        assert list(intervals) == [(0, 25)]
+        assert intervals.total == 25
+
+    def test_remove_splits_range(self):
+        """Test that removing a frame in the middle splits a range."""
+        intervals = FrameIntervalSet()
+        intervals.add_range(0, 10)
+        intervals.remove(5)
+
+        assert list(intervals) == [(0, 5), (6, 10)]
+        assert intervals.total == 9
+
+        intervals.remove_range(0, 100)
+        assert len(intervals) == 0
+        assert intervals.total == 0
+
+    def test_coverage(self):
+        """Test covered frame counts over arbitrary ranges."""
+        intervals = FrameIntervalSet()
+        intervals.add_range(10, 20)
+        intervals.add_range(30, 40)
+
+        assert intervals.coverage(0, 10) == 0
+        assert intervals.coverage(0, 15) == 5
+        assert intervals.coverage(15, 35) == 10
+        assert intervals.coverage(0, 100) == 20
+
+    def test_coverage_bins(self):
+        """Test per-bin coverage fractions used for timeline rendering."""
+        intervals = FrameIntervalSet()
+        intervals.add_range(0, 50)
+
+        assert intervals.coverage_bins(100, 4) == [1.0, 1.0, 0.0, 0.0]
+        assert 0.0 < intervals.coverage_bins(2_000_000, 10)[0] < 0.001
+
+    def test_gap_navigation(self):
+        """Test jumping between gaps in the covered ranges."""
+        intervals = FrameIntervalSet()
+        intervals.add_range(0, 10)
+        intervals.add_range(20, 30)
+
+        assert intervals.next_gap(0, 100) == 10
+        assert intervals.next_gap(10, 100) == 30
+        assert intervals.next_gap(30, 100) is None
+        assert intervals.previous_gap(25) == 10
+        assert intervals.next_gap(25, 30) is None
+
+
+class TestIntervalIndex:
+    """Tests for the IntervalIndex class."""
+
+    def test_stabbing_query(self):
+        """Test finding keys active on a frame."""
+        index = IntervalIndex(bucket_size=4)
+        index.set(1, 0, 10)
+        index.set(2, 5, 6)
+        index.set(3, 20, 30)
+
+        assert index.at(0) == [1]
+        assert index.at(5) == [1, 2]
+        assert index.at(10) == []
+        assert index.at(29) == [3]
+
+    def test_growing_range(self):
+        """Test that moving a range updates the buckets it enters and leaves."""
+        index = IntervalIndex(bucket_size=4)
+        index.set(1, 0, 1)
+        for end in range(2, 50):
+            index.set(1, 0, end)
+        assert index.at(48) == [1]
+
+        index.set(1, 40, 50)
+        assert index.at(0) == []
+        assert index.overlapping(0, 41) == [1]
+
+        index.remove(1)
+        assert len(index) == 0
+        assert index.at(45) == []
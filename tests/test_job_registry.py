@@ -0,0 +1,54 @@
+"""Unit tests for job_registry.py."""
+
+import os
+
+import pytest
+
+from job_registry import JobRegistry
+
+
+class TestJobRegistry:
+    """Tests for the registry of queued files."""
+
+    def test_lookup_by_id_and_path(self):
+        """Test that files are found by id and by path, in insertion order."""
+        registry = JobRegistry()
+        first = {"path": "/in/a.mp4"}
+        second = {"path": "/in/b.mp4"}
+        first_id = registry.add(first)
+        second_id = registry.add(second)
+
+        assert first["id"] == first_id != second_id
+        assert registry.get(second_id) is second
+        assert registry.find("/in/a.mp4") is first
+        assert [f["path"] for f in registry] == ["/in/a.mp4", "/in/b.mp4"]
+        assert len(registry) == 2
+
+    def test_duplicates_by_normalized_path(self):
+        """Test that the same file is detected through another spelling of its path."""
+        registry = JobRegistry()
+        registry.add({"path": os.path.join(os.getcwd(), "a.mp4")})
+
+        assert os.path.join(".", "a.mp4") in registry
+        with pytest.raises(ValueError):
+            registry.add({"path": "a.mp4"})
+
+    def test_remove(self):
+        """Test that removed files can be added again with a new id."""
+        registry = JobRegistry()
+        job_id = registry.add({"path": "/in/a.mp4"})
+
+        assert registry.remove(job_id)["path"] == "/in/a.mp4"
+        assert registry.get(job_id) is None
+        assert "/in/a.mp4" not in registry
+        assert registry.add({"path": "/in/a.mp4"}) != job_id
+
+    def test_slice(self):
+        """Test fetching a window of files by position."""
+        registry = JobRegistry()
+        ids = [registry.add({"path": f"/in/{i}.jpg"}) for i in range(10)]
+        registry.remove(ids[3])
+
+        paths = [f["path"] for f in registry.slice(2, 5)]
+        assert paths == ["/in/2.jpg", "/in/4.jpg", "/in/5.jpg"]
+        assert [f["path"] for f in registry.slice(8, 20)] == ["/in/9.jpg"]
@@ -0,0 +1,52 @@
+"""Unit tests for job_store.py."""
+
+from job_store import FAILED, PENDING, SUCCESS, JobStore
+
+
+class TestJobStore:
+    """Tests for the persisted batch job queue."""
+
+    def test_jobs_survive_reopen(self, tmp_path):
+        """Test that job state, config and logs are persisted across sessions."""
+        path = tmp_path / "jobs.db"
+        store = JobStore(path)
+        first = store.add("Blur Faces", "/in/a.mp4", "/out/a.mp4", {"thresh": 0.2})
+        second = store.add("Blur Faces", "/in/b.mp4", "/out/b.mp4", {"thresh": 0.2})
+        store.add("Transcribe Audio", "/in/c.mp3", "/out/c.txt", {})
+        store.mark_started(first, {"thresh": 0.3})
+        store.mark_finished(first, SUCCESS)
+        store.mark_started(second, {"thresh": 0.3})
+        store.mark_finished(second, FAILED, "Error: decoder failed\n")
+        store.close()
+
+        jobs = JobStore(path).jobs("Blur Faces")
+
+        statuses = [(j.path, j.status) for j in jobs]
+        assert statuses == [("/in/a.mp4", SUCCESS), ("/in/b.mp4", FAILED)]
+        assert jobs[0].config == {"thresh": 0.3}
+        assert jobs[0].attempts == 1
+        assert jobs[0].elapsed is not None
+        assert jobs[1].log == "Error: decoder failed\n"
+
+    def test_interrupted_job_is_pending(self, tmp_path):
+        """Test that a job left processing by a crash is resumed as pending."""
+        store = JobStore(tmp_path / "jobs.db")
+        job_id = store.add("Blur Faces", "/in/a.mp4", "/out/a.mp4", {})
+        store.mark_started(job_id, {})
+
+        assert store.jobs("Blur Faces")[0].status == PENDING
+
+    def test_re_adding_resets_job(self, tmp_path):
+        """Test that re-adding a file keeps its id and resets its state."""
+        store = JobStore(tmp_path / "jobs.db")
+        job_id = store.add("Blur Faces", "/in/a.mp4", "/out/a.mp4", {})
+        store.mark_started(job_id, {})
+        store.mark_finished(job_id, FAILED, "boom")
+
+        assert store.add("Blur Faces", "/in/a.mp4", "/out/a2.mp4", {}) == job_id
+        job = store.jobs("Blur Faces")[0]
+        state = (job.status, job.output_path, job.log, job.attempts)
+        assert state == (PENDING, "/out/a2.mp4", "", 0)
+
+        store.clear("Blur Faces")
+        assert store.jobs("Blur Faces") == []
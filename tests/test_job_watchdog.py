@@ -0,0 +1,80 @@
+"""Unit tests for job_watchdog.py."""
+
+import subprocess
+import sys
+
+from job_watchdog import (
+    DECODER_ERROR,
+    KILLED,
+    OUT_OF_MEMORY,
+    PROCESS_ERROR,
+    STALLED,
+    TIMED_OUT,
+    ProcessWatchdog,
+    classify_failure,
+    is_retryable,
+    retry_delay,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestClassifyFailure:
+    """Tests for failure classification."""
+
+    def test_classification(self):
+        """Test that failures are classified from the exit code and output."""
+        assert classify_failure(1, "Traceback...\nMemoryError\n") == OUT_OF_MEMORY
+        assert classify_failure(1, "[mov] moov atom not found\n") == DECODER_ERROR
+        assert classify_failure(-9, "") == KILLED
+        assert classify_failure(137, "") == KILLED
+        assert classify_failure(1, "ValueError: bad\n") == PROCESS_ERROR
+
+    def test_retry_policy(self):
+        """Test that only transient failures are retried, with growing backoff."""
+        assert is_retryable(OUT_OF_MEMORY)
+        assert is_retryable(STALLED)
+        assert not is_retryable(DECODER_ERROR)
+        assert not is_retryable(TIMED_OUT)
+        assert not is_retryable(None)
+        assert retry_delay(1) < retry_delay(2) < retry_delay(3)
+        assert retry_delay(100) == retry_delay(101)
+
+
+class TestProcessWatchdog:
+    """Tests for killing hung processes."""
+
+    def test_stalled_process_is_killed(self):
+        """Test that a process without progress is killed after the stall timeout."""
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        clock = FakeClock()
+        watchdog = ProcessWatchdog(proc, timeout=100, stall_timeout=10, clock=clock)
+
+        clock.now = 8
+        watchdog.touch()
+        clock.now = 15
+        assert watchdog.check() is None
+
+        clock.now = 19
+        assert watchdog.check() == STALLED
+        assert proc.wait(timeout=10) != 0
+        assert watchdog.expired == STALLED
+
+    def test_wall_clock_timeout(self):
+        """Test that a process reporting progress is still killed after the timeout."""
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        clock = FakeClock()
+        watchdog = ProcessWatchdog(proc, timeout=100, stall_timeout=10, clock=clock)
+
+        clock.now = 101
+        watchdog.touch()
+        assert watchdog.check() == TIMED_OUT
+        proc.wait(timeout=10)
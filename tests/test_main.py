@@ -1,6 +1,7 @@
 """Unit tests for main.py."""
 
 import os
+import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -51,6 +52,14 @@ class TestRunDeface:
         assert "--output" in call_args
         assert output_path in call_args
 
+    def test_run_deface_merge_stderr(self, mock_subprocess):
+        """Test that stderr can be merged into the stdout pipe."""
+        mock_popen, _ = mock_subprocess
+
+        main.run_deface("/path/to/input.mp4", "/path/to/output.mp4", merge_stderr=True)
+
+        assert mock_popen.call_args[1]["stderr"] == subprocess.STDOUT
+
 
 class TestGUILogic:
     """Tests for GUI logic and event handling."""
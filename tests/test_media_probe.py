@@ -0,0 +1,76 @@
+"""Unit tests for media_probe.py."""
+
+import json
+import sys
+
+import media_probe
+from media_probe import MediaInfo, MediaProber, format_cost, parse_media_info
+
+
+def _ffprobe_output(stream, duration=None):
+    output = {"streams": [stream]}
+    if duration is not None:
+        output["format"] = {"duration": str(duration)}
+    return json.dumps(output)
+
+
+class TestParseMediaInfo:
+    """Tests for parsing ffprobe output."""
+
+    def test_video_without_frame_count(self):
+        """Test that the frame count is derived from duration and frame rate."""
+        stream = {"width": 1920, "height": 1080, "avg_frame_rate": "30000/1001"}
+        info = parse_media_info(_ffprobe_output(stream, duration=60.06))
+
+        expected = MediaInfo(duration=60.06, width=1920, height=1080, frame_count=1800)
+        assert info == expected
+        assert info.cost == 60.0
+
+    def test_image(self):
+        """Test that still images count as a single frame."""
+        stream = {"width": 4000, "height": 3000, "avg_frame_rate": "0/0"}
+        info = parse_media_info(_ffprobe_output(stream))
+
+        assert info.frame_count == 1
+        assert info.duration == 0.0
+
+    def test_invalid(self):
+        """Test that unparseable output yields None."""
+        assert parse_media_info(_ffprobe_output({})) is None
+        assert parse_media_info("not json") is None
+
+
+def test_format_cost():
+    """Test short cost formatting."""
+    assert format_cost(45.4) == "45s"
+    assert format_cost(150) == "2m 30s"
+    assert format_cost(3900) == "1h 05m"
+
+
+def test_prober_caches_results(tmp_path, monkeypatch):
+    """Test that unchanged files are only probed once."""
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(b"video")
+    calls = []
+
+    def fake_probe(ffprobe, probed_path):
+        calls.append(probed_path)
+        return MediaInfo(duration=1.0, width=640, height=480, frame_count=30)
+
+    monkeypatch.setattr(media_probe, "find_ffprobe", lambda: "ffprobe")
+    monkeypatch.setattr(media_probe, "probe_media", fake_probe)
+    prober = MediaProber()
+
+    assert prober.probe(str(path)).frame_count == 30
+    assert prober.probe(str(path)).frame_count == 30
+    assert prober.get(str(path)) is not None
+    assert len(calls) == 1
+
+
+def test_find_ffprobe_prefers_bundled(tmp_path, monkeypatch):
+    """Test that the ffprobe bundled with the packaged app is found first."""
+    bundled = tmp_path / ("ffprobe.exe" if sys.platform == "win32" else "ffprobe")
+    bundled.write_bytes(b"")
+    monkeypatch.setattr(sys, "_MEIPASS", str(tmp_path), raising=False)
+
+    assert media_probe.find_ffprobe() == str(bundled)
@@ -0,0 +1,63 @@
+"""Unit tests for output_cache.py."""
+
+import os
+
+from output_cache import OutputCache, fingerprint_input, hash_args, link_output
+
+
+class TestOutputCache:
+    """Tests for the manifest of completed outputs."""
+
+    def test_same_content_under_another_name(self, tmp_path):
+        """Test that a renamed copy of a processed file finds its output."""
+        source = tmp_path / "a.mp4"
+        source.write_bytes(b"video data")
+        renamed = tmp_path / "renamed.mp4"
+        renamed.write_bytes(b"video data")
+        output = tmp_path / "a_anonymized.mp4"
+        output.write_bytes(b"blurred")
+        args = hash_args(["--thresh", "0.2"])
+
+        cache = OutputCache(tmp_path / "manifest.db")
+        cache.record(fingerprint_input(str(source)), args, str(source), str(output))
+        cache.close()
+
+        cache = OutputCache(tmp_path / "manifest.db")
+        cached = cache.lookup(fingerprint_input(str(renamed)), args)
+        assert cached is not None
+        assert cached.output_path == str(output)
+
+        target = tmp_path / "renamed_anonymized.mp4"
+        assert link_output(cached.output_path, str(target)) in ("linked", "copied")
+        assert target.read_bytes() == b"blurred"
+
+    def test_different_settings_or_content_miss(self, tmp_path):
+        """Test that outputs are only reused for identical content and arguments."""
+        source = tmp_path / "a.mp4"
+        source.write_bytes(b"video data")
+        output = tmp_path / "out.mp4"
+        output.write_bytes(b"blurred")
+        fingerprint = fingerprint_input(str(source))
+        args = hash_args(["--thresh", "0.2"])
+        cache = OutputCache(tmp_path / "manifest.db")
+        cache.record(fingerprint, args, str(source), str(output))
+
+        source.write_bytes(b"other video")
+
+        assert cache.lookup(fingerprint, hash_args(["--thresh", "0.3"])) is None
+        assert cache.lookup(fingerprint_input(str(source)), args) is None
+
+    def test_modified_output_is_forgotten(self, tmp_path):
+        """Test that deleted or modified outputs are not reused."""
+        output = tmp_path / "out.mp4"
+        output.write_bytes(b"blurred")
+        args = hash_args([])
+        cache = OutputCache(tmp_path / "manifest.db")
+        cache.record("abc", args, "/in/a.mp4", str(output))
+
+        output.write_bytes(b"edited by hand")
+        assert cache.lookup("abc", args) is None
+
+        cache.record("abc", args, "/in/a.mp4", str(output))
+        os.remove(output)
+        assert cache.lookup("abc", args) is None
@@ -0,0 +1,451 @@
+"""Unit tests for smudge_export.py."""
+
+import os
+import pickle
+import subprocess
+import sys
+import threading
+from fractions import Fraction
+
+import cv2
+import numpy as np
+import pytest
+
+import smudge_export
+from smudge_export import (
+    EncoderSettings,
+    ExportCancelled,
+    ExportError,
+    ExportProgress,
+    VideoProbe,
+    build_ffmpeg_command,
+    export_smudged_video,
+    find_ffmpeg,
+    format_duration,
+    parallel_export_smudged_video,
+    plan_smart_render,
+    resolve_encoder_preset,
+    run_export_pipeline,
+    segment_worker_command,
+    smart_export_smudged_video,
+    split_at_keyframes,
+)
+from smudge_model import OperationStore, SmudgeTrack
+
+PROBE = VideoProbe(
+    codec="h264",
+    width=64,
+    height=48,
+    pix_fmt="yuv420p",
+    fps=Fraction(10),
+    start_time=0.0,
+    frame_count=40,
+)
+
+
+class TestBuildFfmpegCommand:
+    """Tests for the single-pass export command line."""
+
+    def test_pipes_frames_and_copies_source_streams(self):
+        """Test that frames come from stdin and audio/metadata from the source."""
+        cmd = build_ffmpeg_command(
+            "ffmpeg", "in.mp4", "out.mp4", 1920, 1080, 30.0, EncoderSettings()
+        )
+
+        assert cmd[cmd.index("-f") + 1] == "rawvideo"
+        assert cmd[cmd.index("-pix_fmt") + 1] == "bgr24"
+        assert cmd[cmd.index("-s") + 1] == "1920x1080"
+        assert ["-i", "-", "-i", "in.mp4"] == cmd[cmd.index("-i") : cmd.index("-i") + 4]
+        assert "1:a?" in cmd
+        assert cmd[cmd.index("-map_metadata") + 1] == "1"
+        assert cmd[cmd.index("-c:a") + 1] == "copy"
+        assert cmd[cmd.index("-c:v") + 1] == "libx264"
+        assert cmd[cmd.index("-crf") + 1] == "20"
+        assert "-vf" not in cmd
+        assert cmd[-1] == "out.mp4"
+
+    def test_odd_dimensions_are_padded(self):
+        """Test that odd frame sizes are padded for 4:2:0 encoding."""
+        settings = EncoderSettings(codec="libx265", crf=28, threads=4)
+        cmd = build_ffmpeg_command(
+            "ffmpeg", "in.mov", "out.mov", 641, 480, 29.97, settings
+        )
+
+        assert "-vf" in cmd
+        assert cmd[cmd.index("-threads") + 1] == "4"
+        assert cmd[cmd.index("-tag:v") + 1] == "hvc1"
+
+
+class TestPlanSmartRender:
+    """Tests for splitting a video into copied and re-encoded GOPs."""
+
+    def test_only_edited_gops_are_reencoded(self):
+        """Test that GOPs without smudges are stream-copied and runs are merged."""
+        keyframes = [0, 30, 60, 90, 120]
+        edited = np.array([35, 36, 70, 125])
+
+        segments = plan_smart_render(keyframes, 150, edited)
+
+        expected = [(0, 30, False), (30, 90, True), (90, 120, False), (120, 150, True)]
+        assert segments == expected
+
+    def test_no_edits_copies_everything(self):
+        """Test that an unedited video is a single copied segment."""
+        edited = np.array([], dtype=np.int64)
+        assert plan_smart_render([0, 50], 100, edited) == [(0, 100, False)]
+
+
+class TestSplitAtKeyframes:
+    """Tests for splitting a video into parallel export segments."""
+
+    def test_splits_near_even_points(self):
+        """Test that boundaries are the keyframes closest to even splits."""
+        keyframes = list(range(0, 1000, 48))
+
+        segments = split_at_keyframes(keyframes, 1000, 4)
+
+        assert segments == [(0, 240), (240, 480), (480, 768), (768, 1000)]
+
+    def test_too_few_keyframes(self):
+        """Test that sparse keyframes yield fewer segments."""
+        assert split_at_keyframes([0, 500], 1000, 8) == [(0, 500), (500, 1000)]
+        assert split_at_keyframes([0], 1000, 8) == [(0, 1000)]
+
+
+class TestExportPipeline:
+    """Tests for the threaded decode/composite/encode pipeline."""
+
+    def test_frames_are_written_in_order(self):
+        """Test that composited and passthrough frames keep their order."""
+        frames = []
+        for i in range(100):
+            frame = np.zeros((32, 32, 3), dtype=np.uint8)
+            frame[0, 0, 0] = i
+            frames.append(frame)
+        source = iter(frames)
+
+        store = OperationStore()
+        for frame_num in range(0, 100, 7):
+            store.append(frame_num, 0.8, 0.8, 4, 2.0, frame_num + 1)
+
+        written = []
+        stats = run_export_pipeline(
+            lambda: next(source, None),
+            lambda frame: written.append(int(frame[0, 0, 0])),
+            store,
+            composite_workers=3,
+        )
+
+        assert written == list(range(100))
+        assert stats.frames == 100
+        assert stats.composited == 15
+        assert not stats.cancelled
+        assert set(stats.utilisation()) == {"decode", "composite", "encode"}
+
+    def test_write_errors_propagate(self):
+        """Test that an encoder failure stops the pipeline and is re-raised."""
+
+        def write_frame(frame):
+            raise BrokenPipeError()
+
+        source = iter([np.zeros((8, 8, 3), dtype=np.uint8)] * 1000)
+        with pytest.raises(BrokenPipeError):
+            run_export_pipeline(
+                lambda: next(source, None), write_frame, OperationStore()
+            )
+
+
+class FakeCapture:
+    """cv2.VideoCapture stand-in that yields a few small frames."""
+
+    def __init__(self, path, frames=3):
+        self.frames = frames
+        self.frame_count = frames
+
+    def isOpened(self):
+        return True
+
+    def get(self, prop):
+        return {
+            smudge_export.cv2.CAP_PROP_FPS: 25.0,
+            smudge_export.cv2.CAP_PROP_FRAME_WIDTH: 8,
+            smudge_export.cv2.CAP_PROP_FRAME_HEIGHT: 8,
+            smudge_export.cv2.CAP_PROP_FRAME_COUNT: self.frame_count,
+        }.get(prop, 0)
+
+    def read(self):
+        if self.frames == 0:
+            return False, None
+        self.frames -= 1
+        return True, np.zeros((8, 8, 3), dtype=np.uint8)
+
+    def release(self):
+        pass
+
+
+class TestExportSmudgedVideo:
+    """Tests for the output file of a single-pass export."""
+
+    @pytest.fixture
+    def fake_ffmpeg(self, monkeypatch):
+        """Replace ffmpeg with a process that copies its stdin to the output."""
+        code = "import sys; open(sys.argv[1], 'wb').write(sys.stdin.buffer.read())"
+
+        def build_command(ffmpeg, source_path, output_path, *args):
+            return [sys.executable, "-c", code, output_path]
+
+        monkeypatch.setattr(smudge_export, "find_ffmpeg", lambda: "ffmpeg")
+        monkeypatch.setattr(smudge_export, "source_has_audio", lambda *args: False)
+        monkeypatch.setattr(smudge_export, "build_ffmpeg_command", build_command)
+        monkeypatch.setattr(smudge_export.cv2, "VideoCapture", FakeCapture)
+
+    def test_output_replaced_on_success(self, tmp_path, fake_ffmpeg):
+        """Test that the finished export ends up at the output path."""
+        output = tmp_path / "out.mp4"
+
+        result = export_smudged_video("in.mp4", str(output), OperationStore())
+
+        assert result.frames_written == 3
+        assert output.stat().st_size == 3 * 8 * 8 * 3
+        assert [p.name for p in tmp_path.iterdir()] == ["out.mp4"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_output_permissions_follow_umask(self, tmp_path, fake_ffmpeg):
+        """Test that the output is created with the mode the umask allows."""
+        output = tmp_path / "out.mp4"
+        umask = os.umask(0o022)
+        try:
+            export_smudged_video("in.mp4", str(output), OperationStore())
+        finally:
+            os.umask(umask)
+
+        assert output.stat().st_mode & 0o777 == 0o644
+
+    def test_no_output_left_on_failure(self, tmp_path, fake_ffmpeg, monkeypatch):
+        """Test that an export that fails part-way leaves no file behind."""
+
+        def fail_pipeline(read_frame, write_frame, store, **kwargs):
+            write_frame(read_frame())
+            raise RuntimeError("composite failed")
+
+        monkeypatch.setattr(smudge_export, "run_export_pipeline", fail_pipeline)
+
+        with pytest.raises(RuntimeError):
+            export_smudged_video("in.mp4", str(tmp_path / "out.mp4"), OperationStore())
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_no_output_left_without_frames(self, tmp_path, fake_ffmpeg, monkeypatch):
+        """Test that an export of an unreadable video leaves no file behind."""
+        monkeypatch.setattr(
+            smudge_export.cv2, "VideoCapture", lambda path: FakeCapture(path, 0)
+        )
+
+        with pytest.raises(ExportError):
+            export_smudged_video("in.mp4", str(tmp_path / "out.mp4"), OperationStore())
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestSmartExport:
+    """Tests for the output file of a smart-render export."""
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        """Fake the probes and segment exports; return a store smudging the first GOP."""
+        monkeypatch.setattr(smudge_export, "find_ffmpeg", lambda: "ffmpeg")
+        monkeypatch.setattr(smudge_export, "find_ffprobe", lambda: "ffprobe")
+        monkeypatch.setattr(smudge_export, "probe_video", lambda *args: PROBE)
+        monkeypatch.setattr(
+            smudge_export, "probe_keyframes", lambda *args: [0, 10, 20, 30]
+        )
+        monkeypatch.setattr(smudge_export, "source_has_audio", lambda *args: False)
+        monkeypatch.setattr(smudge_export, "_copy_segment", lambda *args: None)
+        monkeypatch.setattr(smudge_export, "_reencode_segment", lambda *args: None)
+        track = SmudgeTrack(track_id=1, radius=10, sigma=5.0, timestamp=0.0)
+        track.add_keyframe(5, 0.5, 0.5)
+        return OperationStore.from_tracks([track])
+
+    def test_output_replaced_on_success(self, tmp_path, store, monkeypatch):
+        """Test that the joined segments replace an existing output."""
+
+        def concat(ffmpeg, segment_paths, source_path, output_path, *args):
+            with open(output_path, "wb") as f:
+                f.write(b"joined")
+
+        monkeypatch.setattr(smudge_export, "concat_segments", concat)
+        output = tmp_path / "out.mp4"
+        output.write_bytes(b"old")
+
+        result = smart_export_smudged_video("in.mp4", str(output), store)
+
+        assert result.frames_written == 30
+        assert output.read_bytes() == b"joined"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.mp4"]
+
+    def test_existing_output_kept_when_cancelled(self, tmp_path, store):
+        """Test that cancelling an export leaves an existing output untouched."""
+        output = tmp_path / "out.mp4"
+        output.write_bytes(b"old")
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        with pytest.raises(ExportCancelled):
+            smart_export_smudged_video(
+                "in.mp4", str(output), store, cancel_event=cancel_event
+            )
+
+        assert output.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.mp4"]
+
+    def test_no_partial_output_left_on_failure(self, tmp_path, store, monkeypatch):
+        """Test that a join that fails part-way leaves no file behind."""
+
+        def concat(ffmpeg, segment_paths, source_path, output_path, *args):
+            with open(output_path, "wb") as f:
+                f.write(b"jo")
+            raise RuntimeError("concat failed")
+
+        monkeypatch.setattr(smudge_export, "concat_segments", concat)
+
+        with pytest.raises(RuntimeError):
+            smart_export_smudged_video("in.mp4", str(tmp_path / "out.mp4"), store)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestExportProgress:
+    """Tests for export progress tracking."""
+
+    def test_snapshot_reports_rate_and_eta(self, monkeypatch):
+        """Test that fps and ETA are derived from recent updates."""
+        clock = [100.0]
+        monkeypatch.setattr("smudge_export.time.monotonic", lambda: clock[0])
+        progress = ExportProgress()
+
+        progress.update(0, 1000)
+        clock[0] = 102.0
+        progress.update(100, 1000)
+
+        frames_done, total_frames, fps, eta = progress.snapshot()
+        assert (frames_done, total_frames) == (100, 1000)
+        assert fps == 50.0
+        assert eta == 18.0
+
+    def test_format_duration(self):
+        """Test ETA formatting."""
+        assert format_duration(59.6) == "1:00"
+        assert format_duration(3725) == "1:02:05"
+
+
+class TestEncoderPresets:
+    """Tests for named encoder presets."""
+
+    def test_named_presets(self):
+        """Test that presets map to codec and rate control settings."""
+        draft = resolve_encoder_preset("fast draft")
+        archive = resolve_encoder_preset("archive")
+
+        assert (draft.codec, draft.preset, draft.crf) == ("libx264", "veryfast", 28)
+        assert archive.codec == "libx265"
+        assert archive.rate_control_args() == ["-crf", "18"]
+        assert resolve_encoder_preset("bogus") == resolve_encoder_preset("balanced")
+
+    def test_bitrate_overrides_crf(self):
+        """Test that a target bitrate switches to bitrate rate control."""
+        settings = EncoderSettings(bitrate=4_000_000)
+        cmd = build_ffmpeg_command(
+            "ffmpeg", "in.mp4", "out.mp4", 1280, 720, 25.0, settings
+        )
+
+        assert "-crf" not in cmd
+        assert cmd[cmd.index("-b:v") + 1] == "4000000"
+        assert cmd[cmd.index("-maxrate") + 1] == "6000000"
+
+
+class TestParallelExport:
+    """Tests for exporting segments in worker processes."""
+
+    def test_worker_reports_errors(self, tmp_path):
+        """Test that a worker pickles the error that stopped it for the parent."""
+        task = {
+            "source_path": str(tmp_path / "missing.mp4"),
+            "segment_path": str(tmp_path / "segment.ts"),
+            "probe": PROBE,
+            "start": 0,
+            "end": 10,
+            "store": OperationStore(),
+            "settings": EncoderSettings(),
+        }
+        task_path = tmp_path / "segment.task"
+        task_path.write_bytes(pickle.dumps(task))
+
+        proc = subprocess.Popen(
+            segment_worker_command(str(task_path)),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        returncode = proc.wait(timeout=60)
+        proc.stdin.close()
+
+        assert returncode == 1
+        result = pickle.loads((tmp_path / "segment.task.result").read_bytes())
+        assert isinstance(result, ExportError)
+
+    def test_existing_output_kept_on_failure(self, tmp_path, monkeypatch):
+        """Test that a failed export leaves an existing output untouched."""
+        monkeypatch.setattr(smudge_export, "find_ffmpeg", lambda: "ffmpeg")
+        monkeypatch.setattr(smudge_export, "find_ffprobe", lambda: "ffprobe")
+        monkeypatch.setattr(smudge_export, "probe_video", lambda *args: PROBE)
+        monkeypatch.setattr(
+            smudge_export, "probe_keyframes", lambda *args: [0, 10, 20, 30]
+        )
+        output = tmp_path / "out.mp4"
+        output.write_bytes(b"old")
+
+        # The workers fail because the source does not exist
+        with pytest.raises(ExportError):
+            parallel_export_smudged_video(
+                str(tmp_path / "missing.mp4"), str(output), OperationStore(), workers=2
+            )
+
+        assert output.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.mp4"]
+
+    @pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg not available")
+    def test_segments_are_joined(self, tmp_path, monkeypatch):
+        """Test that the segments exported by the workers are joined in order."""
+        source = str(tmp_path / "source.mp4")
+        testsrc = ["-f", "lavfi", "-i", "testsrc=size=64x48:rate=10", "-frames:v", "40"]
+        encode = ["-g", "10", "-c:v", "libx264", "-pix_fmt", "yuv420p"]
+        subprocess.run(
+            [find_ffmpeg(), "-v", "error", *testsrc, *encode, source], check=True
+        )
+        monkeypatch.setattr(smudge_export, "find_ffprobe", lambda: "ffprobe")
+        monkeypatch.setattr(smudge_export, "probe_video", lambda *args: PROBE)
+        monkeypatch.setattr(
+            smudge_export, "probe_keyframes", lambda *args: [0, 10, 20, 30]
+        )
+        track = SmudgeTrack(track_id=1, radius=10, sigma=5.0, timestamp=0.0)
+        track.add_keyframe(5, 0.5, 0.5)
+        track.add_keyframe(25, 0.5, 0.5)
+        store = OperationStore.from_tracks([track])
+        joined = []
+
+        def count_frames(ffmpeg, segment_paths, *args):
+            for path in segment_paths:
+                cap = cv2.VideoCapture(path)
+                frames = 0
+                while cap.read()[0]:
+                    frames += 1
+                cap.release()
+                joined.append(frames)
+
+        monkeypatch.setattr(smudge_export, "concat_segments", count_frames)
+
+        output = str(tmp_path / "out.mp4")
+        result = parallel_export_smudged_video(source, output, store, workers=2)
+
+        assert result.frames_written == 40
+        assert joined == [20, 20]
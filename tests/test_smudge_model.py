@@ -0,0 +1,106 @@
+"""Unit tests for smudge_model.py."""
+
+from smudge_model import OperationStore, SmudgeTrack
+
+
+def _make_track() -> SmudgeTrack:
+    return SmudgeTrack(track_id=1, radius=50, sigma=25.0, timestamp=0.0)
+
+
+class TestSmudgeTrack:
+    """Tests for the SmudgeTrack class."""
+
+    def test_interpolates_between_keyframes(self):
+        """Test that skipped frames are interpolated linearly."""
+        track = _make_track()
+        track.add_keyframe(10, 0.0, 0.0)
+        track.add_keyframe(20, 1.0, 0.5)
+
+        assert track.position_at(10) == (0.0, 0.0)
+        assert track.position_at(15) == (0.5, 0.25)
+        assert track.position_at(20) == (1.0, 0.5)
+        assert track.position_at(9) is None
+        assert track.position_at(21) is None
+        assert (track.start_frame, track.end_frame) == (10, 21)
+
+    def test_stationary_brush_stays_sparse(self):
+        """Test that holding still moves the last keyframe instead of adding."""
+        track = _make_track()
+        for frame in range(100, 1900):
+            track.add_keyframe(frame, 0.5, 0.5)
+
+        assert track.frames == [100, 1899]
+        assert track.position_at(1000) == (0.5, 0.5)
+
+    def test_resampling_frame_replaces_keyframe(self):
+        """Test that sampling the same frame again updates its keyframe."""
+        track = _make_track()
+        track.add_keyframe(5, 0.1, 0.1)
+        track.add_keyframe(5, 0.2, 0.3)
+        track.add_keyframe(3, 0.0, 0.0)
+
+        assert track.frames == [3, 5]
+        assert track.position_at(5) == (0.2, 0.3)
+
+    def test_operation_at(self):
+        """Test evaluating a track as a smudge operation."""
+        track = _make_track()
+        track.add_keyframe(0, 0.25, 0.75)
+
+        operation = track.operation_at(0)
+        assert operation is not None
+        assert (operation.x, operation.y, operation.radius) == (0.25, 0.75, 50)
+        assert track.operation_at(1) is None
+
+
+class TestOperationStore:
+    """Tests for the OperationStore class."""
+
+    def test_from_tracks_slices_frames(self):
+        """Test that tracks expand to one row per covered frame."""
+        first = _make_track()
+        first.add_keyframe(10, 0.0, 0.0)
+        first.add_keyframe(20, 1.0, 0.5)
+        second = SmudgeTrack(track_id=2, radius=30, sigma=10.0, timestamp=0.0)
+        second.add_keyframe(15, 0.25, 0.25)
+
+        store = OperationStore.from_tracks([second, first])
+
+        assert len(store) == 12
+        rows = store.frame_rows(15)
+        assert list(store.ids[rows]) == [1, 2]
+        assert store.x[rows[0]] == 0.5
+        assert store.radius[rows[1]] == 30
+        assert len(store.frame_rows(21)) == 0
+        assert list(store.frames()) == list(range(10, 21))
+
+    def test_remove_by_id(self):
+        """Test that removing an id drops its rows from frame slices."""
+        store = OperationStore(capacity=2)
+        store.append(5, 0.1, 0.1, 10, 5.0, 7)
+        store.append(5, 0.2, 0.2, 10, 5.0, 8)
+        store.append(6, 0.3, 0.3, 10, 5.0, 7)
+
+        assert list(store.rows_for_id(7)) == [0, 2]
+        assert store.remove(7) == 2
+        assert 7 not in store
+        assert len(store) == 1
+        assert list(store.ids[store.frame_rows(5)]) == [8]
+        assert len(store.frame_rows(6)) == 0
+
+    def test_slice_frames(self):
+        """Test copying the rows of a frame range into a new store."""
+        store = OperationStore()
+        track = _make_track()
+        track.add_keyframe(0, 0.0, 0.0)
+        track.add_keyframe(99, 1.0, 1.0)
+        store.add_track(track)
+        store.append(50, 0.5, 0.5, 20, 8.0, 2)
+
+        segment = store.slice_frames(40, 60)
+
+        assert len(segment) == 21
+        rows = segment.frame_rows(50)
+        assert list(segment.ids[rows]) == [1, 2]
+        assert list(segment.radius[rows]) == [50, 20]
+        assert len(segment.frame_rows(60)) == 0
@@ -0,0 +1,95 @@
+"""Unit tests for smudge_project.py."""
+
+import json
+
+import smudge_project
+from smudge_model import SmudgeTrack
+from smudge_project import ProjectJournal, fingerprint_file, load_project
+
+
+def _make_track(track_id: int) -> SmudgeTrack:
+    track = SmudgeTrack(track_id=track_id, radius=50, sigma=25.0, timestamp=0.0)
+    track.add_keyframe(track_id * 10, 0.25, 0.5)
+    track.add_keyframe(track_id * 10 + 5, 0.75, 0.5)
+    return track
+
+
+class TestProjectJournal:
+    """Tests for writing and replaying project journals."""
+
+    def test_replays_adds_and_removes(self, tmp_path):
+        """Test that a journal replays to the live tracks."""
+        path = tmp_path / "video.mp4.smudge"
+        journal = ProjectJournal.create(path, str(tmp_path / "video.mp4"), "abc")
+        journal.record_add(_make_track(1))
+        journal.record_add(_make_track(2))
+        journal.record_add(_make_track(3))
+        journal.record_remove(2)
+        journal.close()
+
+        project = load_project(str(path))
+
+        assert project.video_hash == "abc"
+        assert [t.track_id for t in project.tracks] == [1, 3]
+        assert project.tracks[1].frames == [30, 35]
+        assert project.tracks[1].position_at(35) == (0.75, 0.5)
+        assert project.next_track_id == 4
+
+    def test_resume_appends(self, tmp_path):
+        """Test that a resumed journal only appends new records."""
+        path = tmp_path / "video.mp4.smudge"
+        journal = ProjectJournal.create(path, "video.mp4", "abc")
+        journal.record_add(_make_track(1))
+        journal.close()
+        size = path.stat().st_size
+
+        journal = ProjectJournal.resume(load_project(str(path)))
+        journal.record_clear()
+        journal.record_add(_make_track(2))
+        journal.close()
+
+        assert path.read_text().count("\n") == 4
+        assert path.stat().st_size > size
+        assert [t.track_id for t in load_project(str(path)).tracks] == [2]
+
+    def test_truncated_record_is_ignored(self, tmp_path):
+        """Test that a partially written last record does not break loading."""
+        path = tmp_path / "video.mp4.smudge"
+        journal = ProjectJournal.create(path, "video.mp4", "abc")
+        journal.record_add(_make_track(1))
+        journal.close()
+        with open(path, "a") as f:
+            f.write('{"op": "add", "id": 2, "r"')
+
+        project = load_project(str(path))
+
+        assert [t.track_id for t in project.tracks] == [1]
+        assert path.read_text().endswith("\n")
+
+    def test_compaction(self, tmp_path, monkeypatch):
+        """Test that mostly-dead journals are rewritten with live tracks only."""
+        monkeypatch.setattr(smudge_project, "COMPACT_MIN_DEAD_RECORDS", 4)
+        path = tmp_path / "video.mp4.smudge"
+        journal = ProjectJournal.create(path, "video.mp4", "abc")
+        for track_id in range(1, 6):
+            journal.record_add(_make_track(track_id))
+            journal.record_remove(track_id)
+        journal.record_add(_make_track(9))
+        journal.close()
+
+        lines = path.read_text().splitlines()
+        assert json.loads(lines[0])["format"] == smudge_project.PROJECT_FORMAT
+        assert len(lines) == 2
+        assert [t.track_id for t in load_project(str(path)).tracks] == [9]
+
+
+def test_fingerprint_detects_changes(tmp_path, monkeypatch):
+    """Test that the sampled fingerprint changes with file contents."""
+    monkeypatch.setattr(smudge_project, "FINGERPRINT_BLOCK_SIZE", 4)
+    path = tmp_path / "video.mp4"
+    path.write_bytes(bytes(range(200)))
+    original = fingerprint_file(str(path))
+
+    path.write_bytes(bytes(range(199)) + b"\x00")
+
+    assert fingerprint_file(str(path)) != original
@@ -0,0 +1,119 @@
+"""Unit tests for smudge_render.py."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import smudge_render
+from media_probe import find_ffmpeg, find_ffprobe
+from smudge_model import SmudgeTrack
+from smudge_project import ProjectError, ProjectJournal, fingerprint_file
+
+
+def _write_project(tmp_path, video_hash=None):
+    video = tmp_path / "video.mp4"
+    if not video.exists():
+        video.write_bytes(b"not really a video")
+    project_path = tmp_path / "video.mp4.smudge"
+    video_hash = video_hash or fingerprint_file(str(video))
+    journal = ProjectJournal.create(project_path, str(video), video_hash)
+    track = SmudgeTrack(track_id=1, radius=50, sigma=25.0, timestamp=0.0)
+    track.add_keyframe(0, 0.5, 0.5)
+    track.add_keyframe(10, 0.5, 0.5)
+    journal.record_add(track)
+    journal.close()
+    return str(project_path), str(video), track
+
+
+class TestRenderProject:
+    """Tests for rendering projects without the GUI."""
+
+    def test_renders_with_project_tracks(self, tmp_path, monkeypatch):
+        """Test that the project's tracks and preset reach the exporter."""
+        project_path, video, track = _write_project(tmp_path)
+        calls = []
+
+        def fake_export(source, output, store, **kwargs):
+            calls.append((source, output, len(store), kwargs))
+
+        monkeypatch.setattr(smudge_render, "smart_export_smudged_video", fake_export)
+
+        smudge_render.render_project(project_path, video, "out.mp4", "fast draft")
+
+        source, output, rows, kwargs = calls[0]
+        expected_rows = track.end_frame - track.start_frame
+        assert (source, output, rows) == (video, "out.mp4", expected_rows)
+        assert kwargs["settings"].preset == "veryfast"
+
+    def test_rejects_other_video(self, tmp_path, monkeypatch):
+        """Test that a project is not rendered onto a different video unless forced."""
+        project_path, video, _ = _write_project(tmp_path, video_hash="other")
+        monkeypatch.setattr(
+            smudge_render,
+            "parallel_export_smudged_video",
+            lambda *args, **kwargs: "result",
+        )
+
+        with pytest.raises(ProjectError):
+            smudge_render.render_project(
+                project_path, video, "out.mp4", "balanced", smart_render=False
+            )
+
+        result = smudge_render.render_project(
+            project_path, video, "out.mp4", "balanced", smart_render=False, force=True
+        )
+        assert result == "result"
+
+
+def test_parse_args_defaults_from_config(monkeypatch):
+    """Test that unspecified options come from the Face Smudge settings."""
+    config = {
+        "face_smudge_config": {
+            "encoder_preset": "archive",
+            "export_workers": 4,
+            "smart_render": False,
+        }
+    }
+    monkeypatch.setattr(smudge_render, "load_config", lambda: config)
+
+    args = smudge_render.parse_args(["p.smudge", "in.mp4", "-o", "out.mp4"])
+    assert (args.preset, args.workers, args.smart_render) == ("archive", 4, False)
+
+    args = smudge_render.parse_args(
+        ["p.smudge", "in.mp4", "-o", "out.mp4", "--smart-render", "--workers", "2"]
+    )
+    assert (args.workers, args.smart_render) == (2, True)
+
+
+def test_render_command_without_gui_dependencies(tmp_path):
+    """Test that render-smudge and its export workers run without customtkinter."""
+    ffmpeg = find_ffmpeg()
+    if ffmpeg is None or find_ffprobe() is None:
+        pytest.skip("ffmpeg and ffprobe are required")
+    source = ["-f", "lavfi", "-i", "testsrc=size=64x48:rate=10", "-t", "4"]
+    encode = ["-g", "10", "-c:v", "libx264", "-pix_fmt", "yuv420p"]
+    video_path = str(tmp_path / "video.mp4")
+    subprocess.run([ffmpeg, "-v", "error", *source, *encode, video_path], check=True)
+    project_path, video, _ = _write_project(tmp_path)
+
+    # Modules that fail to import shadow the GUI packages, in the workers too
+    blocked = tmp_path / "blocked"
+    blocked.mkdir()
+    for name in ("customtkinter", "tkinterdnd2"):
+        (blocked / f"{name}.py").write_text("raise ImportError('blocked')\n")
+    env = dict(os.environ, PYTHONPATH=str(blocked))
+
+    main_script = Path(__file__).resolve().parent.parent / "main.py"
+    output = tmp_path / "out.mp4"
+    command = [sys.executable, str(main_script), "render-smudge", project_path, video]
+    command += ["-o", str(output), "--workers", "2", "--no-smart-render"]
+    result = subprocess.run(
+        command, env=env, capture_output=True, text=True, timeout=300
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "Parallel export: 2 segment(s)" in result.stderr
+    assert output.stat().st_size > 0
@@ -5,13 +5,16 @@ import logging
 import sys
 import tkinter as tk
 from tkinter import messagebox
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 try:
     import customtkinter as ctk
 except ImportError:
     raise ImportError("customtkinter is required for dialog windows")
 
+from adaptive_concurrency import AUTO_BATCH_SIZE, is_auto_batch_size
+from job_watchdog import DEFAULT_JOB_TIMEOUT, DEFAULT_MAX_RETRIES, DEFAULT_STALL_TIMEOUT
+
 logger = logging.getLogger(__name__)
 
 
@@ -126,6 +129,9 @@ class ConfigDialog(ctk.CTkToplevel):
         # Batch size
         self._create_batch_size_section(scrollable_frame)
 
+        # Timeouts and retries
+        self._create_job_limits_section(scrollable_frame)
+
         # Buttons
         self._create_button_section(main_frame)
 
@@ -296,7 +302,7 @@ class ConfigDialog(ctk.CTkToplevel):
 
         ctk.CTkLabel(
             frame,
-            text=f"Number of files to process concurrently (1-{self.MAX_BATCH_SIZE})",
+            text=f"Number of files to process concurrently (1-{self.MAX_BATCH_SIZE}, or \"auto\" to adapt to the system)",
             font=ctk.CTkFont(size=10),
             text_color="#8ea4c7",  # Mist Blue
         ).pack(anchor="w", padx=10, pady=(0, 5))
@@ -305,6 +311,48 @@ class ConfigDialog(ctk.CTkToplevel):
         self.batch_size_entry.insert(0, str(self.config.get("batch_size", 1)))
         self.batch_size_entry.pack(anchor="w", padx=10, pady=(0, 10))
 
+    def _create_job_limits_section(self, parent):
+        """Create job timeout and retry configuration section."""
+        frame = ctk.CTkFrame(parent)
+        frame.pack(fill="x", pady=5, padx=10)
+
+        ctk.CTkLabel(
+            frame, text="Timeouts and Retries:", font=ctk.CTkFont(size=12)
+        ).pack(anchor="w", padx=10, pady=(10, 5))
+
+        ctk.CTkLabel(
+            frame,
+            text="Jobs that run too long or stop reporting progress are killed (0 = no limit). "
+                 "Failures that may be transient are retried.",
+            font=ctk.CTkFont(size=10),
+            text_color="#8ea4c7",  # Mist Blue
+            wraplength=480,
+            justify="left",
+        ).pack(anchor="w", padx=10, pady=(0, 5))
+
+        fields = ctk.CTkFrame(frame, fg_color="transparent")
+        fields.pack(anchor="w", padx=10, pady=(0, 10))
+
+        self.job_timeout_entry = self._create_labeled_entry(
+            fields, 0, "Job timeout (minutes):", self.config.get("job_timeout", DEFAULT_JOB_TIMEOUT)
+        )
+        self.stall_timeout_entry = self._create_labeled_entry(
+            fields, 1, "No progress timeout (seconds):", self.config.get("stall_timeout", DEFAULT_STALL_TIMEOUT)
+        )
+        self.max_retries_entry = self._create_labeled_entry(
+            fields, 2, "Retries:", self.config.get("max_retries", DEFAULT_MAX_RETRIES)
+        )
+
+    def _create_labeled_entry(self, parent, row: int, text: str, value: Any) -> ctk.CTkEntry:
+        """Create a label and entry in a grid row."""
+        ctk.CTkLabel(parent, text=text, font=ctk.CTkFont(size=11)).grid(
+            row=row, column=0, sticky="w", padx=(0, 10), pady=2
+        )
+        entry = ctk.CTkEntry(parent, width=80)
+        entry.insert(0, str(value))
+        entry.grid(row=row, column=1, sticky="w", pady=2)
+        return entry
+
     def _create_hugging_face_token_section(self, parent):
         """Create Hugging Face token configuration section."""
         frame = ctk.CTkFrame(parent)
@@ -414,12 +462,14 @@ class ConfigDialog(ctk.CTkToplevel):
             )
             return None
 
-    def _validate_batch_size(self) -> Optional[int]:
+    def _validate_batch_size(self) -> Optional[Union[int, str]]:
         """Validate batch size input.
 
         Returns:
-            Batch size value if valid, None otherwise.
+            Batch size value (an integer or "auto") if valid, None otherwise.
         """
+        if is_auto_batch_size(self.batch_size_entry.get()):
+            return AUTO_BATCH_SIZE
         try:
             batch_size_val = int(self.batch_size_entry.get().strip())
             if batch_size_val < 1 or batch_size_val > self.MAX_BATCH_SIZE:
@@ -430,10 +480,30 @@ class ConfigDialog(ctk.CTkToplevel):
             return batch_size_val
         except ValueError:
             messagebox.showerror(
-                "Error", "Batch size must be a valid integer."
+                "Error", 'Batch size must be a valid integer or "auto".'
             )
             return None
 
+    def _validate_non_negative_int(self, entry: ctk.CTkEntry, name: str) -> Optional[int]:
+        """Validate a non-negative integer input.
+
+        Args:
+            entry: Entry holding the value.
+            name: Name of the setting, for error messages.
+
+        Returns:
+            The value if valid, None otherwise.
+        """
+        try:
+            value = int(entry.get().strip())
+        except ValueError:
+            messagebox.showerror("Error", f"{name} must be a valid integer.")
+            return None
+        if value < 0:
+            messagebox.showerror("Error", f"{name} must be 0 or greater.")
+            return None
+        return value
+
     def _on_ok(self):
         """Handle OK button click."""
         try:
@@ -467,6 +537,16 @@ class ConfigDialog(ctk.CTkToplevel):
                 return
             config["batch_size"] = batch_size
 
+            for key, entry, name in (
+                ("job_timeout", self.job_timeout_entry, "Job timeout"),
+                ("stall_timeout", self.stall_timeout_entry, "No progress timeout"),
+                ("max_retries", self.max_retries_entry, "Retries"),
+            ):
+                value = self._validate_non_negative_int(entry, name)
+                if value is None:
+                    return
+                config[key] = value
+
             # Store Hugging Face token separately (it's not part of sightline_config)
             # TODO: it IS part of sightline_config. Figure out whats happening here and fix/remove this.
             self.hugging_face_token = self.hf_token_entry.get().strip()
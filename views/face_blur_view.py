@@ -6,16 +6,25 @@ This module contains the UI and logic for batch processing files with face blurr
 import logging
 import os
 import subprocess
-import threading
+from collections import deque
 from pathlib import Path
 from tkinter import filedialog
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 try:
     import customtkinter as ctk
 except ImportError:
     raise ImportError("customtkinter is required for views")
 
+from job_watchdog import (
+    DEFAULT_JOB_TIMEOUT,
+    DEFAULT_STALL_TIMEOUT,
+    FAILURE_TAIL_LINES,
+    STALLED,
+    TIMED_OUT,
+    ProcessWatchdog,
+    classify_failure,
+)
 from views.generic_batch_view import GenericBatchView
 
 logger = logging.getLogger(__name__)
@@ -53,6 +62,7 @@ class FaceBlurView(GenericBatchView):
             page_title="B L U R   F A C E S",
             supported_extensions=SUPPORTED_EXTENSIONS,
             generate_output_filename=self._generate_output_filename,
+            queue_name="Blur Faces",
         )
 
     def _generate_output_filename(self, input_path: str) -> str:
@@ -68,6 +78,29 @@ class FaceBlurView(GenericBatchView):
         name, ext = os.path.splitext(input_filename)
         return f"{name}_anonymized{ext}"
 
+    def _output_cache_args(self) -> Optional[List[str]]:
+        """Get the deface arguments that determine a file's output.
+
+        Returns:
+            The deface arguments built from the current configuration.
+        """
+        return list(self.app.build_deface_args(self.app.config))
+
+    def _config_number(self, key: str, default: float) -> float:
+        """Get a non-negative number from the configuration.
+
+        Args:
+            key: Configuration key.
+            default: Value used when the setting is missing or invalid.
+
+        Returns:
+            The configured number.
+        """
+        try:
+            return max(0.0, float(self.app.config.get(key, default)))
+        except (TypeError, ValueError):
+            return default
+
     def _process_file(self, file_info: Dict[str, Any]):
         """Process a single file with face blurring.
 
@@ -84,34 +117,36 @@ class FaceBlurView(GenericBatchView):
         file_info["progress"] = 0.0
         file_info["error_log"] = ""
         file_info["parser"] = self._create_progress_parser()  # Reset progress parser for this file
-        self.output_queue.put(("file_update", file_path))
+        self._post(("file_update", file_info["id"]))
 
         try:
-            # Start the subprocess with current configuration
-            proc = self.app.run_deface(file_path, output_path, self.app.config)
+            # Start the subprocess with current configuration. stderr (where
+            # the tqdm progress goes) is merged into stdout so this worker
+            # thread can read all output itself instead of starting readers
+            proc = self.app.run_deface(file_path, output_path, self.app.config, merge_stderr=True)
             self.active_processes[file_path] = proc
 
-            # Start threads to read stdout and stderr concurrently
-            stdout_thread = threading.Thread(
-                target=self._read_stream,
-                args=(proc.stdout, "stdout", file_path),
-                daemon=True,
-            )
-            stderr_thread = threading.Thread(
-                target=self._read_stream,
-                args=(proc.stderr, "stderr", file_path),
-                daemon=True,
-            )
-
-            stdout_thread.start()
-            stderr_thread.start()
-
-            # Wait for process to complete
-            return_code = proc.wait()
-
-            # Wait for both reading threads to finish
-            stdout_thread.join(timeout=1)
-            stderr_thread.join(timeout=1)
+            # Kill the process if it runs too long or stops reporting progress
+            timeout = self._config_number("job_timeout", DEFAULT_JOB_TIMEOUT) * 60
+            stall_timeout = self._config_number("stall_timeout", DEFAULT_STALL_TIMEOUT)
+            watchdog = ProcessWatchdog(proc, timeout=timeout, stall_timeout=stall_timeout)
+            tail: deque = deque(maxlen=FAILURE_TAIL_LINES)
+            # A separate parser, as the file's own one is used on the UI thread
+            progress = self._create_progress_parser()
+
+            def on_line(line: str):
+                # Only progress counts, so a job repeating a warning still stalls
+                if progress.parse(line):
+                    watchdog.touch()
+                tail.append(line)
+
+            # Read output until the process closes its pipe, then reap it
+            watchdog.start()
+            try:
+                self._read_stream(proc.stdout, "stdout", file_info["id"], on_line)
+                return_code = proc.wait()
+            finally:
+                watchdog.stop()
 
             # Update file status based on return code
             if return_code == 0:
@@ -119,21 +154,28 @@ class FaceBlurView(GenericBatchView):
                 file_info["progress"] = 1.0
                 logger.info(f"Successfully processed: {file_path}")
             else:
+                failure = watchdog.expired or classify_failure(return_code, "".join(tail))
                 file_info["status"] = "failed"
                 file_info["progress"] = 0.0
-                file_info["error_log"] += f"\nProcess exited with code {return_code}"
+                file_info["failure"] = failure
+                if failure == TIMED_OUT:
+                    file_info["error_log"] += f"\nProcess killed after {timeout / 60:g} minutes"
+                elif failure == STALLED:
+                    file_info["error_log"] += f"\nProcess killed after {stall_timeout:g}s without progress"
+                else:
+                    file_info["error_log"] += f"\nProcess exited with code {return_code} ({failure})"
                 logger.error(
-                    f"Failed to process {file_path} (exit code: {return_code})"
+                    f"Failed to process {file_path} (exit code: {return_code}, {failure})"
                 )
 
-            self.output_queue.put(("file_update", file_path))
+            self._post(("file_update", file_info["id"]))
 
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {e}")
             file_info["status"] = "failed"
             file_info["progress"] = 0.0
             file_info["error_log"] += f"\nException: {str(e)}"
-            self.output_queue.put(("file_update", file_path))
+            self._post(("file_update", file_info["id"]))
             if file_path in self.currently_processing:
                 self.currently_processing.remove(file_path)
         finally:
@@ -7,6 +7,7 @@ configurable processing logic, file types, and UI elements.
 import logging
 import os
 import queue
+import sqlite3
 import subprocess
 import sys
 import threading
@@ -19,6 +20,14 @@ from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import customtkinter as ctk
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
+from adaptive_concurrency import AdaptiveConcurrency, is_auto_batch_size
+from batch_executor import BatchExecutor
+from batch_stats import CpuMonitor, JobWork, ThroughputMeter, summarize_batch
+from job_registry import JobRegistry
+from job_store import SUCCESS, JobRecord, JobStore
+from job_watchdog import DEFAULT_MAX_RETRIES, is_retryable, retry_delay
+from media_probe import REFERENCE_FPS, MediaInfo, MediaProber, fallback_cost, format_cost
+from output_cache import OutputCache, fingerprint_input, hash_args, link_output
 from views.dialogs import LogDialog
 from progress_parser import ProgressParser
 from views.base_view import BaseView
@@ -28,7 +37,10 @@ logger = logging.getLogger(__name__)
 # View constants
 FILE_LIST_HEIGHT = 300
 MAX_FILENAME_DISPLAY_LENGTH = 35
-PROGRESS_CHECK_INTERVAL_MS = 50
+FILE_ROW_HEIGHT = 100  # Height of a row in the file list, including spacing
+UI_UPDATE_INTERVAL_MS = 100  # At most 10 redraws per second
+OUTPUT_EVENT = "<<BatchOutput>>"  # Wakes the message pump
+SUMMARY_UPDATE_INTERVAL = 1.0  # Seconds between batch summary updates
 
 # Status colors for file processing - Sightline brand colors
 STATUS_COLORS = {
@@ -41,6 +53,10 @@ STATUS_COLORS = {
 # Keywords for error detection in logs
 ERROR_KEYWORDS = ["error", "warning", "exception", "failed", "traceback"]
 
+# Delay before offering to resume an interrupted batch, so the main window
+# is shown first
+RESUME_PROMPT_DELAY_MS = 500
+
 class GenericBatchView(BaseView, ABC):
     """Generic base view for batch processing files.
 
@@ -55,6 +71,7 @@ class GenericBatchView(BaseView, ABC):
         page_title: str,
         supported_extensions: Set[str],
         generate_output_filename: Optional[Callable[[str], str]] = None,
+        queue_name: Optional[str] = None,
     ):
         """Initialize the generic batch processing view.
 
@@ -65,6 +82,8 @@ class GenericBatchView(BaseView, ABC):
             supported_extensions: Set of valid file extensions (e.g., {".mp4", ".mp3"}).
             generate_output_filename: Optional function to generate output filename from input path.
                                      If None, uses default pattern: {name}_processed{ext}
+            queue_name: Name of this view's persisted batch queue, shown when
+                        offering to resume it. Defaults to the class name.
         """
         super().__init__(parent, app)
 
@@ -72,17 +91,55 @@ class GenericBatchView(BaseView, ABC):
         self.page_title = page_title
         self.supported_extensions = supported_extensions
         self.generate_output_filename = generate_output_filename or self._default_output_filename
+        self.queue_name = queue_name or type(self).__name__
 
-        # File queue for batch processing
-        self.file_queue: List[Dict[str, Any]] = []
+        # File queue for batch processing, indexed by job id and path
+        self.file_queue = JobRegistry()
         self.currently_processing: set[str] = set()
         self.is_processing: bool = False
         self.stop_requested: bool = False
-        self.file_widgets: Dict[str, Dict[str, Any]] = {}
+        self.file_widgets: Dict[int, Dict[str, Any]] = {}  # Visible rows by job id
+        self._row_pool: List[Dict[str, Any]] = []
+        self._first_row = 0  # Position of the topmost visible file
         self.active_processes: Dict[str, subprocess.Popen] = {}
+        self.executor: Optional[BatchExecutor] = None
+        self.concurrency_tuner: Optional[AdaptiveConcurrency] = None
+        self.frames_processed = 0  # Frames processed by the current batch
+        self.throughput_meter = ThroughputMeter()
+        self.cpu_monitor = CpuMonitor()
+        self._last_summary_update = 0.0
+        self._summary_stale = False  # Probes finished since the last update
+
+        # Duration, resolution and frame count of queued files, probed in the
+        # background to estimate the cost of each job
+        self.media_prober = MediaProber()
+
+        # The queue is persisted so an interrupted batch can be resumed
+        self.job_store: Optional[JobStore] = None
+        try:
+            self.job_store = JobStore()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Batch queue will not be persisted: {e}")
+
+        # Manifest of completed outputs, so files already processed with the
+        # same settings are skipped (see _output_cache_args)
+        self.output_cache: Optional[OutputCache] = None
+        try:
+            self.output_cache = OutputCache()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Processed files will not be remembered: {e}")
 
-        # Process tracking
+        # Process tracking. Worker threads post messages with _post(), which
+        # wakes the UI thread's message pump with a virtual event; the pump
+        # only runs while there are messages to handle or jobs to watch
         self.output_queue: queue.Queue = queue.Queue()
+        self._wake_requested = threading.Event()
+        self._can_wake = self._tcl_is_threaded()
+        self._pump_id: Optional[str] = None
+        self._last_pump = 0.0
+        self._summary_timer_id: Optional[str] = None
+        self._dirty_rows: Set[int] = set()  # Rows to redraw on the next pump
+        self._visible = False
 
         # Create widgets
         self.create_widgets()
@@ -91,8 +148,11 @@ class GenericBatchView(BaseView, ABC):
         self._drop_handler: Optional[Callable[[Any], str]] = None
         self._drag_drop_setup = False
 
-        # Start checking for process output
-        self._check_process_output()
+        # Handle posted messages when a worker thread wakes the pump
+        self.bind(OUTPUT_EVENT, lambda event: self._schedule_pump())
+
+        if self.job_store:
+            self.after(RESUME_PROMPT_DELAY_MS, self._offer_resume)
 
     def _default_output_filename(self, input_path: str) -> str:
         """Generate default output filename from input path.
@@ -191,16 +251,24 @@ class GenericBatchView(BaseView, ABC):
         # Custom widgets hook - subclasses can add widgets here
         self._create_custom_widgets(left_frame)
 
+        self._create_batch_summary(left_frame)
+
         # --- Right Column: File List ---
         self.right_frame = ctk.CTkFrame(content_frame, fg_color="transparent", border_width=0)
         self.right_frame.grid(row=0, column=1, sticky="nsew")
 
-        # Scrollable list
-        self.files_list_frame = ctk.CTkScrollableFrame(
-            self.right_frame,
-            fg_color="transparent"
-        )
-        self.files_list_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        # Virtualised list: only the visible rows exist, and they are reused
+        # for other files as the list scrolls
+        list_container = ctk.CTkFrame(self.right_frame, fg_color="transparent")
+        list_container.pack(fill="both", expand=True, padx=5, pady=5)
+
+        self.files_scrollbar = ctk.CTkScrollbar(list_container, command=self._on_list_scroll)
+        self.files_scrollbar.pack(side="right", fill="y")
+
+        self.files_list_frame = ctk.CTkFrame(list_container, fg_color="transparent")
+        self.files_list_frame.pack(side="left", fill="both", expand=True)
+        self.files_list_frame.bind("<Configure>", lambda event: self._render_visible_rows())
+        self._bind_mousewheel(self.files_list_frame)
 
         # Placeholder
         self.no_files_label = ctk.CTkLabel(
@@ -215,6 +283,15 @@ class GenericBatchView(BaseView, ABC):
         button_frame = ctk.CTkFrame(self, fg_color="transparent")
         button_frame.grid(row=2, column=0, sticky="e", padx=20, pady=20)
 
+        # Number of files processed at once (changes over time in auto mode)
+        self.concurrency_label = ctk.CTkLabel(
+            button_frame,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color="#8ea4c7",  # Mist Blue
+        )
+        self.concurrency_label.pack(side="left", padx=(0, 15))
+
         select_files_btn = ctk.CTkButton(
             button_frame,
             text="Select Files",
@@ -249,21 +326,103 @@ class GenericBatchView(BaseView, ABC):
         """
         pass
 
-    def _create_file_row(self, file_info: Dict[str, Any]) -> ctk.CTkFrame:
-        """Create a UI row for a file in the queue.
+    def _create_batch_summary(self, parent: ctk.CTkFrame) -> None:
+        """Create the batch summary panel in the left panel.
+
+        Args:
+            parent: The parent frame (left panel).
+        """
+        ctk.CTkLabel(
+            parent,
+            text="Batch Summary",
+            font=ctk.CTkFont(size=14, weight="bold")
+        ).pack(anchor="w", pady=(20, 5))
+
+        self.summary_labels: Dict[str, ctk.CTkLabel] = {}
+        for key in ("files", "throughput", "work", "eta", "cpu", "probe"):
+            label = ctk.CTkLabel(
+                parent,
+                text="",
+                font=ctk.CTkFont(size=12),
+                text_color="#8ea4c7",  # Mist Blue
+                anchor="w",
+                justify="left",
+            )
+            label.pack(anchor="w")
+            self.summary_labels[key] = label
+
+    def _job_work(self, file_info: Dict[str, Any]) -> JobWork:
+        """Get the work of a queued file in frames.
+
+        Uses the probed frame count, then the frame count reported by the
+        progress output, then an estimate from the file size.
 
         Args:
             file_info: Dictionary containing file information.
 
         Returns:
-            Frame containing the file row widgets.
+            The file's work.
         """
-        file_path = file_info["path"]
-        filename = os.path.basename(file_path)
+        media = file_info.get("media")
+        parser = file_info.get("parser")
+        if media:
+            total_frames = float(media.frame_count)
+        elif parser is not None and parser.total:
+            total_frames = float(parser.total)
+        else:
+            total_frames = file_info["cost"] * REFERENCE_FPS
+        return JobWork(file_info["status"], total_frames, file_info.get("frames_done", 0))
+
+    def _update_batch_summary(self):
+        """Update the batch summary panel."""
+        self._last_summary_update = time.monotonic()
+        self._summary_stale = False
+        if not self.file_queue:
+            for label in self.summary_labels.values():
+                label.configure(text="")
+            return
 
+        fps = self.throughput_meter.update(self.frames_processed) if self.is_processing else 0.0
+        summary = summarize_batch((self._job_work(f) for f in self.file_queue), fps)
+        total_frames = summary.frames_done + summary.frames_remaining
+
+        self.summary_labels["files"].configure(
+            text=f"Files: {summary.completed_files} of {summary.total_files} done"
+        )
+        self.summary_labels["work"].configure(
+            text=f"Frames: {summary.frames_done:,.0f} of ~{total_frames:,.0f}"
+        )
+        # Without ffprobe, costs (and so the order of the queue) are estimated
+        # from file sizes
+        self.summary_labels["probe"].configure(
+            text="" if self.media_prober.available else "ffprobe not found:\nfiles are ordered by size"
+        )
+        if not self.is_processing:
+            self.summary_labels["throughput"].configure(text="Throughput: --")
+            self.summary_labels["eta"].configure(text="Queue ETA: --")
+            self.summary_labels["cpu"].configure(text="CPU: --")
+            return
+
+        self.summary_labels["throughput"].configure(text=f"Throughput: {summary.fps:.1f} frames/s")
+        eta = format_cost(summary.eta) if summary.eta is not None else "--"
+        self.summary_labels["eta"].configure(text=f"Queue ETA: {eta}")
+
+        pids = [proc.pid for proc in list(self.active_processes.values()) if proc]
+        cpu = self.cpu_monitor.sample(pids)
+        cpu_text = f"{cpu:.0f}% of {os.cpu_count() or 1} cores" if cpu is not None else "--"
+        self.summary_labels["cpu"].configure(text=f"CPU: {cpu_text}")
+
+    def _create_row_widgets(self) -> Dict[str, Any]:
+        """Create an empty file row for the row pool.
+
+        Returns:
+            Dictionary of the row's widgets (see _bind_row).
+        """
         # Card Frame with border and rounded corners
-        row_frame = ctk.CTkFrame(self.files_list_frame, border_width=2, corner_radius=15)
-        row_frame.pack(fill="x", pady=5, padx=5)
+        row_frame = ctk.CTkFrame(
+            self.files_list_frame, height=FILE_ROW_HEIGHT - 10, border_width=2, corner_radius=15
+        )
+        row_frame.pack_propagate(False)
 
         # Inner padding frame
         inner = ctk.CTkFrame(row_frame, fg_color="transparent")
@@ -274,88 +433,173 @@ class GenericBatchView(BaseView, ABC):
         top_row.pack(fill="x", pady=(0, 5))
 
         # Icon (Placeholder - simple text or emoji)
-        icon_char = self._get_file_icon(file_path)
-        icon_label = ctk.CTkLabel(top_row, text=icon_char, width=30, font=ctk.CTkFont(size=20))
+        icon_label = ctk.CTkLabel(top_row, text="", width=30, font=ctk.CTkFont(size=20))
         icon_label.pack(side="left")
 
         # Filename
-        display_name = filename
-        if len(filename) > MAX_FILENAME_DISPLAY_LENGTH:
-            display_name = filename[: MAX_FILENAME_DISPLAY_LENGTH - 3] + "..."
-
         name_label = ctk.CTkLabel(
             top_row,
-            text=display_name,
+            text="",
             font=ctk.CTkFont(size=14, weight="bold"),
             anchor="w"
         )
         name_label.pack(side="left", padx=5, fill="x", expand=True)
 
         # Status (Clickable)
-        status = file_info.get("status", "pending")
-        color, text = STATUS_COLORS.get(status, ("gray", "Pending"))
-        if text == "Success":
-            text = "complete"
-
         status_label = ctk.CTkLabel(
             top_row,
-            text=text,
+            text="",
             font=ctk.CTkFont(size=12),
             text_color=("black", "white"),
             cursor="hand2"
         )
         status_label.pack(side="right")
 
-        # Bind click to show logs
-        status_label.bind("<Button-1>", lambda e: self._show_file_logs(file_path))
-
         # Progress Bar
         progress_bar = ctk.CTkProgressBar(inner)
         progress_bar.pack(fill="x", pady=(0, 5))
-        progress_bar.set(file_info.get("progress", 0.0))
 
         # Bottom Row: Details
         details_row = ctk.CTkFrame(inner, fg_color="transparent")
         details_row.pack(fill="x")
 
         # Duration / Remaining
-        eta_text = "--:--"
-        if file_info.get("status") == "success":
-            eta_text = f"duration: {file_info.get('elapsed', '00:00')}"
-        elif file_info.get("status") == "processing":
-            eta_text = f"Remaining: {file_info.get('eta', '--:--')}"
+        eta_label = ctk.CTkLabel(details_row, text="", font=ctk.CTkFont(size=11))
+        eta_label.pack(side="left")
 
-        eta_label = ctk.CTkLabel(
+        # Estimated cost
+        cost_label = ctk.CTkLabel(
             details_row,
-            text=eta_text,
+            text="",
             font=ctk.CTkFont(size=11),
+            text_color="#8ea4c7",  # Mist Blue
         )
-        eta_label.pack(side="left")
+        cost_label.pack(side="left", padx=(15, 0))
 
         # Speed
-        speed = file_info.get("speed", "--")
-        if speed == "--":
-            speed_text = f"Speed {speed} it/s"
-        else:
-            speed_text = f"Speed {speed}"
-
-        speed_label = ctk.CTkLabel(
-            details_row,
-            text=speed_text,
-            font=ctk.CTkFont(size=11),
-        )
+        speed_label = ctk.CTkLabel(details_row, text="", font=ctk.CTkFont(size=11))
         speed_label.pack(side="right")
 
-        # Store widget references
-        self.file_widgets[file_path] = {
+        widgets: Dict[str, Any] = {
+            "job_id": None,  # File currently shown in the row
             "row_frame": row_frame,
+            "icon_label": icon_label,
+            "name_label": name_label,
             "status_label": status_label,
             "progress_bar": progress_bar,
             "eta_label": eta_label,
+            "cost_label": cost_label,
             "speed_label": speed_label,
         }
 
-        return row_frame
+        # Bind click to show logs of whichever file the row shows
+        status_label.bind("<Button-1>", lambda e: self._show_file_logs(widgets["job_id"]))
+
+        for widget in (row_frame, inner, top_row, details_row, icon_label, name_label,
+                       status_label, progress_bar, eta_label, cost_label, speed_label):
+            self._bind_mousewheel(widget)
+
+        return widgets
+
+    def _bind_row(self, widgets: Dict[str, Any], file_info: Dict[str, Any]):
+        """Show a file in a pooled row.
+
+        Args:
+            widgets: Row widgets (see _create_row_widgets).
+            file_info: Dictionary containing file information.
+        """
+        job_id = file_info["id"]
+        self.file_widgets[job_id] = widgets
+        if widgets["job_id"] != job_id:
+            widgets["job_id"] = job_id
+            file_path = file_info["path"]
+            filename = os.path.basename(file_path)
+            display_name = filename
+            if len(filename) > MAX_FILENAME_DISPLAY_LENGTH:
+                display_name = filename[: MAX_FILENAME_DISPLAY_LENGTH - 3] + "..."
+            widgets["icon_label"].configure(text=self._get_file_icon(file_path))
+            widgets["name_label"].configure(text=display_name)
+        self._update_file_row(job_id)
+
+    def _visible_row_count(self) -> int:
+        """Get how many rows fit in the file list (including a partial one)."""
+        return max(1, int(self.files_list_frame.winfo_height()) // FILE_ROW_HEIGHT + 1)
+
+    def _render_visible_rows(self):
+        """Show the files in the visible part of the list.
+
+        Only as many row widgets as fit on screen exist. They are rebound to
+        other files as the list scrolls or the queue changes, so the cost
+        does not depend on the queue length.
+        """
+        total = len(self.file_queue)
+        count = self._visible_row_count()
+        self._first_row = max(0, min(self._first_row, total - count + 1))
+        visible = self.file_queue.slice(self._first_row, self._first_row + count)
+
+        while len(self._row_pool) < len(visible):
+            self._row_pool.append(self._create_row_widgets())
+
+        self.file_widgets = {}
+        for index, widgets in enumerate(self._row_pool):
+            if index < len(visible):
+                widgets["row_frame"].place(x=0, y=index * FILE_ROW_HEIGHT + 5, relwidth=1.0)
+                self._bind_row(widgets, visible[index])
+            elif widgets["job_id"] is not None:
+                widgets["row_frame"].place_forget()
+                widgets["job_id"] = None
+
+        if total:
+            self.files_scrollbar.set(self._first_row / total, min(1.0, (self._first_row + count - 1) / total))
+        else:
+            self.files_scrollbar.set(0.0, 1.0)
+
+    def _scroll_to_row(self, first_row: int):
+        """Scroll the file list so that a position is the topmost row."""
+        if first_row != self._first_row:
+            self._first_row = first_row
+            self._render_visible_rows()
+
+    def _on_list_scroll(self, *args):
+        """Handle the file list scrollbar ("moveto" or "scroll" commands)."""
+        if args[0] == "moveto":
+            self._scroll_to_row(max(0, int(float(args[1]) * len(self.file_queue))))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= max(1, self._visible_row_count() - 1)
+            self._scroll_to_row(max(0, self._first_row + amount))
+
+    def _bind_mousewheel(self, widget: Any):
+        """Scroll the file list with the mouse wheel over a widget."""
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_list_mousewheel, add="+")
+
+    def _on_list_mousewheel(self, event: Any):
+        """Scroll the file list by one row per wheel step."""
+        if getattr(event, "num", None) == 4:
+            rows = -1
+        elif getattr(event, "num", None) == 5:
+            rows = 1
+        else:
+            # Windows reports multiples of 120 per notch, macOS small deltas
+            rows = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self._scroll_to_row(max(0, self._first_row + rows))
+
+    def _format_cost_text(self, file_info: Dict[str, Any]) -> str:
+        """Format the estimated cost of a file for its row.
+
+        Args:
+            file_info: Dictionary containing file information.
+
+        Returns:
+            Cost text; estimates from the file size (not yet probed, or not
+            probeable) are marked with "~".
+        """
+        media: Optional[MediaInfo] = file_info.get("media")
+        if media is None:
+            return f"Est. ~{format_cost(file_info['cost'])}"
+        return f"Est. {format_cost(media.cost)} · {media.width}x{media.height}"
 
     def _get_file_icon(self, file_path: str) -> str:
         """Get an icon character for a file based on its extension.
@@ -376,26 +620,17 @@ class GenericBatchView(BaseView, ABC):
         else:
             return "📄"
 
-    def _update_file_row(self, file_path: str):
+    def _update_file_row(self, job_id: int):
         """Update the UI for a specific file row based on its current state.
 
         Args:
-            file_path: Path to the file whose row should be updated.
+            job_id: Id of the file whose row should be updated.
         """
-        if file_path not in self.file_widgets:
+        widgets = self.file_widgets.get(job_id)
+        file_info = self.file_queue.get(job_id)
+        if not widgets or not file_info:
             return
 
-        # Find file info
-        file_info = None
-        for f in self.file_queue:
-            if f["path"] == file_path:
-                file_info = f
-                break
-
-        if not file_info:
-            return
-
-        widgets = self.file_widgets[file_path]
         status = file_info["status"]
         progress = file_info["progress"]
 
@@ -429,18 +664,15 @@ class GenericBatchView(BaseView, ABC):
         else:
             widgets["eta_label"].configure(text="--:--")
 
+        widgets["cost_label"].configure(text=self._format_cost_text(file_info))
+
         if speed == "--":
             widgets["speed_label"].configure(text=f"Speed {speed} it/s")
         else:
             widgets["speed_label"].configure(text=f"Speed {speed}")
 
     def _refresh_file_list_display(self):
-        """Refresh the entire file list display."""
-        # Clear existing widgets
-        for widgets in self.file_widgets.values():
-            widgets["row_frame"].destroy()
-        self.file_widgets.clear()
-
+        """Refresh the file list after files were added or removed."""
         # Show/hide placeholder
         if not self.file_queue:
             self.no_files_label.pack(pady=100)
@@ -450,10 +682,8 @@ class GenericBatchView(BaseView, ABC):
             if not self.is_processing:
                 self.start_stop_btn.configure(state="normal", text="Start", command=self._start_processing)
 
-            # Create rows for all files
-            for file_info in self.file_queue:
-                self._create_file_row(file_info)
-                self._update_file_row(file_info["path"])
+        self._render_visible_rows()
+        self._update_batch_summary()
 
     def _add_files_to_queue(self, file_paths: Tuple[str, ...]):
         """Add multiple files to the processing queue.
@@ -465,7 +695,7 @@ class GenericBatchView(BaseView, ABC):
 
         for file_path in file_paths:
             # Skip if already in queue
-            if any(f["path"] == file_path for f in self.file_queue):
+            if file_path in self.file_queue:
                 logger.info(f"File already in queue: {file_path}")
                 continue
 
@@ -479,23 +709,139 @@ class GenericBatchView(BaseView, ABC):
             output_path = os.path.join(output_dir, output_filename)
 
             # Add to queue
-            file_info = {
-                "path": file_path,
-                "status": "pending",
-                "progress": 0.0,
-                "output_path": output_path,
-                "error_log": "",
-                "parser": self._create_progress_parser(),  # Each file has its own progress parser
-                "eta": "--:--",
-                "elapsed": "00:00",
-                "speed": "--",
-            }
-            self.file_queue.append(file_info)
+            file_info = self._create_file_info(file_path, output_path)
+            if self.job_store:
+                try:
+                    file_info["store_id"] = self.job_store.add(
+                        self.queue_name, file_path, output_path, self._config_snapshot()
+                    )
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not persist queued file {file_path}: {e}")
+            self.file_queue.add(file_info)
             logger.info(f"Added file to queue: {file_path}")
 
         # Refresh display
         self._refresh_file_list_display()
 
+    def _create_file_info(self, file_path: str, output_path: str) -> Dict[str, Any]:
+        """Create the queue entry for a file and start probing it.
+
+        Args:
+            file_path: Path to the input file.
+            output_path: Path where the output file should be saved.
+
+        Returns:
+            Dictionary containing file information (its "id" is assigned when
+            it is added to the file queue).
+        """
+        file_info = {
+            "path": file_path,
+            "status": "pending",
+            "progress": 0.0,
+            "output_path": output_path,
+            "error_log": "",
+            "parser": self._create_progress_parser(),  # Each file has its own progress parser
+            "eta": "--:--",
+            "elapsed": "00:00",
+            "speed": "--",
+            "media": None,
+            "cost": fallback_cost(file_path),  # Until the probe finishes
+            "store_id": None,  # Row in the persisted job queue
+        }
+        self.media_prober.probe_async(file_path, self._on_media_probed)
+        return file_info
+
+    def _config_snapshot(self) -> Dict[str, Any]:
+        """Get the configuration recorded with each persisted job.
+
+        Returns:
+            A copy of the processing configuration.
+        """
+        return dict(self.app.config)
+
+    def _offer_resume(self):
+        """Offer to resume a batch that was interrupted in a previous session."""
+        if not self.job_store or self.file_queue:
+            return
+        try:
+            jobs = self.job_store.jobs(self.queue_name)
+            unfinished = [j for j in jobs if j.status != SUCCESS]
+            if not unfinished:
+                # A finished batch has nothing to resume
+                self.job_store.clear(self.queue_name)
+                return
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read the persisted batch queue: {e}")
+            return
+
+        completed = len(jobs) - len(unfinished)
+        if not messagebox.askyesno(
+            "Resume Batch",
+            f"A previous {self.queue_name} batch was interrupted with "
+            f"{len(unfinished)} unfinished file(s) ({completed} already completed).\n\n"
+            "Do you want to resume it?",
+        ):
+            self.job_store.clear(self.queue_name)
+            return
+
+        self._restore_jobs(jobs)
+        for name, view in getattr(self.app, "views", {}).items():
+            if view is self:
+                self.app.show_view(name)
+                break
+        self._start_processing()
+
+    def _restore_jobs(self, jobs: List[JobRecord]):
+        """Rebuild the file queue from persisted jobs.
+
+        Args:
+            jobs: Persisted jobs, in queue order.
+        """
+        for job in jobs:
+            if job.path in self.file_queue:
+                continue
+            if not Path(job.path).exists():
+                logger.warning(f"Skipping resumed file that no longer exists: {job.path}")
+                self.job_store.remove(job.id)  # type: ignore[union-attr]
+                continue
+
+            file_info = self._create_file_info(job.path, job.output_path)
+            file_info["store_id"] = job.id
+            file_info["status"] = job.status
+            file_info["error_log"] = job.log
+            if job.status == SUCCESS:
+                file_info["progress"] = 1.0
+                if job.elapsed is not None:
+                    file_info["elapsed"] = f"{int(job.elapsed) // 60:02d}:{int(job.elapsed) % 60:02d}"
+            self.file_queue.add(file_info)
+
+        logger.info(f"Restored {len(self.file_queue)} file(s) from the persisted {self.queue_name} queue")
+        self._refresh_file_list_display()
+
+    def _on_media_probed(self, file_path: str, media: Optional[MediaInfo]):
+        """Hand a background probe result to the UI thread.
+
+        Args:
+            file_path: Path of the probed file.
+            media: Probe result, or None if the file could not be probed.
+        """
+        if media is not None:
+            self._post(("media_info", file_path, media))
+
+    def _job_priority(self, file_info: Dict[str, Any]) -> float:
+        """Get the scheduling priority of a queued file.
+
+        The most expensive files start first, so a long video queued after
+        many short clips does not run alone at the end of the batch.
+
+        Args:
+            file_info: Dictionary containing file information.
+
+        Returns:
+            The estimated cost of the file.
+        """
+        return float(file_info["cost"])
+
     def _create_progress_parser(self) -> Any:
         """Create a progress parser instance for a file.
 
@@ -657,25 +1003,19 @@ class GenericBatchView(BaseView, ABC):
                 "Drop Error", f"Error processing dropped files: {str(e)}"
             )
 
-    def _show_file_logs(self, file_path: str):
+    def _show_file_logs(self, job_id: int):
         """Show error logs for a specific file in a separate dialog.
 
         Args:
-            file_path: Path to the file whose logs should be displayed.
+            job_id: Id of the file whose logs should be displayed.
         """
-        # Find file info
-        file_info = None
-        for f in self.file_queue:
-            if f["path"] == file_path:
-                file_info = f
-                break
-
+        file_info = self.file_queue.get(job_id)
         if not file_info or not file_info.get("error_log"):
             messagebox.showinfo("No Logs", "No error logs available for this file.")
             return
 
         # Display the error log in a separate dialog
-        filename = os.path.basename(file_path)
+        filename = os.path.basename(file_info["path"])
         log_text = f"=== Error log for {filename} ===\n\n{file_info['error_log']}\n\n"
 
         dialog = LogDialog(self.app, filename, log_text)
@@ -862,11 +1202,32 @@ class GenericBatchView(BaseView, ABC):
             state="normal"
         )
 
-        logger.info(f"Starting batch processing of {len(files_to_process)} file(s)")
-
-        # Start processing thread
-        process_thread = threading.Thread(target=self._process_queue, daemon=True)
-        process_thread.start()
+        batch_size = self.app.config.get("batch_size", 1)
+        self.frames_processed = 0
+        if is_auto_batch_size(batch_size):
+            self.concurrency_tuner = AdaptiveConcurrency()
+            concurrency = self.concurrency_tuner.concurrency
+            max_concurrency = self.concurrency_tuner.max_concurrency
+        else:
+            self.concurrency_tuner = None
+            concurrency = max_concurrency = int(batch_size)
+        logger.info(f"Starting batch processing of {len(files_to_process)} file(s) with batch size: {batch_size}")
+        self.throughput_meter.reset()
+        self.cpu_monitor = CpuMonitor()
+
+        # Each completed job dispatches the next one from its completion callback
+        self.executor = BatchExecutor(
+            self._run_job,
+            concurrency,
+            on_finished=lambda: self._post(("batch_done", None)),
+            max_concurrency=max_concurrency,
+            priority=self._job_priority,
+        )
+        self._update_concurrency_label()
+        self.executor.start(files_to_process)
+        self._update_batch_summary()
+        self._schedule_summary_update()
+        self._schedule_pump()
 
     def _stop_processing(self):
         """Stop all current processing and mark files as failed."""
@@ -875,6 +1236,8 @@ class GenericBatchView(BaseView, ABC):
 
         logger.info("Stop requested by user")
         self.stop_requested = True
+        if self.executor:
+            self.executor.stop()
 
         # Terminate all active subprocesses
         for file_path, proc in list(self.active_processes.items()):
@@ -888,76 +1251,228 @@ class GenericBatchView(BaseView, ABC):
                     proc.kill()
 
                 # Mark file as failed
-                for file_info in self.file_queue:
-                    if file_info["path"] == file_path:
-                        file_info["status"] = "failed"
-                        file_info["error_log"] = "Processing stopped by user"
-                        file_info["progress"] = 0.0
-                        self.output_queue.put(("file_update", file_path))
-                        break
+                file_info = self.file_queue.find(file_path)
+                if file_info:
+                    file_info["status"] = "failed"
+                    file_info["error_log"] = "Processing stopped by user"
+                    file_info["progress"] = 0.0
+                    self._dirty_rows.add(file_info["id"])
 
         # Update UI state
+        self._flush_row_updates()
         self.start_stop_btn.configure(state="disabled")
 
-    def _process_queue(self):
-        """Process files from the queue with concurrent batch processing."""
-        try:
-            batch_size = self.app.config.get("batch_size", 1)
-            logger.info(f"Starting batch processing with batch size: {batch_size}")
-
-            # Get list of files to process
-            files_to_process = [
-                f for f in self.file_queue if f["status"] in ("pending", "failed")
-            ]
-
-            # Track active processing threads
-            active_threads: dict[str, threading.Thread] = {}
-
-            # Process files
-            while not self.stop_requested and (files_to_process or active_threads):
-                # Start new processes up to batch_size
-                while (
-                    len(active_threads) < batch_size
-                    and files_to_process
-                    and not self.stop_requested
-                ):
-                    file_info = files_to_process.pop(0)
-                    file_path = file_info["path"]
-
-                    # Start processing thread for this file
-                    thread = threading.Thread(
-                        target=self._process_file, args=(file_info,), daemon=True
-                    )
-                    active_threads[file_path] = thread
-                    self.currently_processing.add(file_path)
-                    thread.start()
-                    logger.info(f"Started processing: {file_path}")
-
-                # Check for completed threads
-                for file_path in list(active_threads.keys()):
-                    thread = active_threads[file_path]
-                    if not thread.is_alive():
-                        # Thread finished
-                        del active_threads[file_path]
-                        if file_path in self.currently_processing:
-                            self.currently_processing.remove(file_path)
-                        logger.info(f"Finished processing: {file_path}")
-
-                # Small delay to avoid busy waiting
-                threading.Event().wait(0.1)
-
-            # Wait for remaining threads to complete
-            for thread in active_threads.values():
-                thread.join(timeout=1)
-
-            # Queue completion message
-            self.output_queue.put(("batch_done", None))
+    def _run_job(self, file_info: Dict[str, Any]):
+        """Process one file on a batch worker thread.
 
-        except Exception as e:
-            logger.error(f"Error in queue processing: {e}")
-            self.output_queue.put(("batch_error", str(e)))
+        Args:
+            file_info: Dictionary containing file information.
+        """
+        file_path = file_info["path"]
+        if self.stop_requested:
+            return
+
+        self.currently_processing.add(file_path)
+        file_info["frames_done"] = 0
+        file_info["reused"] = False
+        file_info.pop("fingerprint", None)
+        store_id = file_info.get("store_id")
+        if self.job_store and store_id is not None:
+            try:
+                self.job_store.mark_started(store_id, self._config_snapshot())
+            except sqlite3.Error as e:
+                logger.warning(f"Could not persist job start for {file_path}: {e}")
+
+        logger.info(f"Started processing: {file_path}")
+        try:
+            if not self._reuse_cached_output(file_info):
+                self._process_with_retries(file_info)
+                self._record_output(file_info)
         finally:
-            self.currently_processing.clear()
+            self.currently_processing.discard(file_path)
+            if self.job_store and store_id is not None:
+                try:
+                    self.job_store.mark_finished(store_id, file_info["status"], file_info.get("error_log", ""))
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not persist job result for {file_path}: {e}")
+            self._post(("job_done", file_info["id"]))
+            logger.info(f"Finished processing: {file_path}")
+
+    def _on_job_done(self, job_id: int):
+        """Account for a finished job on the UI thread.
+
+        Args:
+            job_id: Id of the file whose job finished.
+        """
+        file_info = self.file_queue.get(job_id)
+        # Jobs without progress output (e.g. images) count as a single frame;
+        # reused outputs were not processed and do not count
+        if (
+            file_info
+            and file_info["status"] == "success"
+            and not file_info.get("frames_done")
+            and not file_info.get("reused")
+        ):
+            file_info["frames_done"] = 1
+            self.frames_processed += 1
+
+    def _process_with_retries(self, file_info: Dict[str, Any]):
+        """Process a file, retrying failures that may be transient.
+
+        _process_file reports why a file failed in file_info["failure"] (see
+        job_watchdog.classify_failure); files that fail without a reason are
+        not retried.
+
+        Args:
+            file_info: Dictionary containing file information.
+        """
+        file_path = file_info["path"]
+        max_retries = self._max_retries()
+        earlier_logs = ""
+        attempt = 0
+        while True:
+            file_info["failure"] = None
+            self._process_file(file_info)
+            failure = file_info["failure"]
+            if (
+                file_info["status"] != "failed"
+                or not is_retryable(failure)
+                or attempt >= max_retries
+                or self.stop_requested
+            ):
+                break
+
+            attempt += 1
+            delay = retry_delay(attempt)
+            logger.warning(f"Attempt {attempt} of {file_path} failed ({failure}); retrying in {delay:.0f}s")
+            earlier_logs += (
+                f"{file_info['error_log'].strip()}\n"
+                f"Attempt {attempt} failed ({failure}); retrying in {delay:.0f}s\n\n"
+            )
+            file_info["status"] = "pending"
+            file_info["progress"] = 0.0
+            file_info["error_log"] = earlier_logs
+            self._post(("file_update", file_info["id"]))
+
+            deadline = time.monotonic() + delay
+            while not self.stop_requested and time.monotonic() < deadline:
+                time.sleep(0.2)
+            if self.stop_requested:
+                file_info["status"] = "failed"
+                file_info["error_log"] = f"{earlier_logs}Processing stopped by user"
+                self._post(("file_update", file_info["id"]))
+                return
+
+            file_info["frames_done"] = 0
+            store_id = file_info.get("store_id")
+            if self.job_store and store_id is not None:
+                try:
+                    self.job_store.mark_started(store_id, self._config_snapshot())
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not persist job start for {file_path}: {e}")
+
+        if earlier_logs:
+            file_info["error_log"] = earlier_logs + file_info["error_log"]
+            self._post(("file_update", file_info["id"]))
+
+    def _max_retries(self) -> int:
+        """Get how often a failed file is retried."""
+        try:
+            return max(0, int(self.app.config.get("max_retries", DEFAULT_MAX_RETRIES)))
+        except (TypeError, ValueError):
+            return DEFAULT_MAX_RETRIES
+
+    def _output_cache_args(self) -> Optional[List[str]]:
+        """Get the processing arguments that determine a job's output.
+
+        Files whose content was already processed with the same arguments
+        are not processed again. Subclasses opt in by overriding this.
+
+        Returns:
+            The effective arguments, or None to always process files.
+        """
+        return None
+
+    def _reuse_cached_output(self, file_info: Dict[str, Any]) -> bool:
+        """Complete a job from a previous output of the same content, if any.
+
+        Called on a batch worker thread. The input's fingerprint is stored in
+        file_info so the output can be recorded once processed.
+
+        Args:
+            file_info: Dictionary containing file information.
+
+        Returns:
+            True if the job was completed without processing.
+        """
+        args = self._output_cache_args()
+        if not self.output_cache or args is None:
+            return False
+
+        file_path = file_info["path"]
+        output_path = file_info["output_path"]
+        fingerprint = fingerprint_input(file_path)
+        if fingerprint is None:
+            return False
+        file_info["fingerprint"] = fingerprint
+        file_info["args_hash"] = hash_args(args)
+
+        try:
+            cached = self.output_cache.lookup(fingerprint, file_info["args_hash"], output_path)
+            if cached is None:
+                return False
+            if os.path.abspath(cached.output_path) == os.path.abspath(output_path):
+                note = "Skipped: already processed with the same settings"
+            else:
+                method = link_output(cached.output_path, output_path)
+                self.output_cache.record(fingerprint, file_info["args_hash"], file_path, output_path)
+                note = f"Skipped: same content as {cached.source_path}, output {method} from {cached.output_path}"
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not reuse a previous output for {file_path}: {e}")
+            return False
+
+        logger.info(f"{note} ({file_path})")
+        file_info["status"] = "success"
+        file_info["progress"] = 1.0
+        file_info["error_log"] = note
+        file_info["reused"] = True
+        self._post(("file_update", file_info["id"]))
+        return True
+
+    def _record_output(self, file_info: Dict[str, Any]):
+        """Remember a successfully processed output for later batches.
+
+        Args:
+            file_info: Dictionary containing file information.
+        """
+        fingerprint = file_info.get("fingerprint")
+        if not self.output_cache or fingerprint is None or file_info["status"] != SUCCESS:
+            return
+        try:
+            self.output_cache.record(fingerprint, file_info["args_hash"], file_info["path"], file_info["output_path"])
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not record output of {file_info['path']}: {e}")
+
+    def _tune_concurrency(self):
+        """Let the adaptive controller adjust the number of concurrent jobs."""
+        if not self.concurrency_tuner or not self.executor or self.stop_requested:
+            return
+        # Only a saturated queue tells how throughput scales with concurrency
+        if self.executor.pending == 0:
+            return
+        concurrency = self.concurrency_tuner.observe(self.frames_processed)
+        if concurrency is not None:
+            self.executor.set_concurrency(concurrency)
+            self._update_concurrency_label()
+
+    def _update_concurrency_label(self):
+        """Show the number of files processed at once."""
+        if not self.executor:
+            self.concurrency_label.configure(text="")
+        elif self.concurrency_tuner:
+            self.concurrency_label.configure(text=f"Concurrency: {self.executor.concurrency} (auto)")
+        else:
+            self.concurrency_label.configure(text=f"Concurrency: {self.executor.concurrency}")
 
     @abstractmethod
     def _process_file(self, file_info: Dict[str, Any]):
@@ -967,41 +1482,54 @@ class GenericBatchView(BaseView, ABC):
 
         Args:
             file_info: Dictionary containing file information including:
+                - id: Job id, used in output queue messages
+                  (e.g. ("file_update", id))
                 - path: Input file path
                 - output_path: Output file path
                 - status: Current status (will be "processing" when called)
                 - progress: Current progress (0.0 to 1.0)
                 - parser: Progress parser instance
                 - error_log: Error log string
+                - failure: None; set it to a job_watchdog failure kind when
+                  the file fails, to have transient failures retried
         """
         pass
 
-    def _read_stream(self, stream, stream_type: str, file_path: str):
+    def _read_stream(
+        self,
+        stream,
+        stream_type: str,
+        job_id: int,
+        on_line: Optional[Callable[[str], None]] = None,
+    ):
         """Read from a stream (stdout or stderr) and queue output.
 
         Args:
             stream: The stream to read from.
             stream_type: Type of stream ('stdout' or 'stderr').
-            file_path: Path of the file being processed.
+            job_id: Id of the file being processed.
+            on_line: Optional callback for each line, on the reading thread.
         """
         try:
             for line in iter(stream.readline, ""):
                 if line:
-                    self.output_queue.put((stream_type, line, file_path))
+                    if on_line:
+                        on_line(line)
+                    self._post((stream_type, line, job_id))
         except Exception as e:
             logger.error(f"Error reading {stream_type}: {e}")
         finally:
             stream.close()
 
-    def _handle_stream_message(self, line: str, file_path: str):
+    def _handle_stream_message(self, line: str, job_id: int):
         """Handle stdout/stderr message from subprocess.
 
         Args:
             line: Output line from subprocess.
-            file_path: Path to the file being processed.
+            job_id: Id of the file being processed.
         """
-        self._update_file_progress(line, file_path)
-        self._append_to_file_log(file_path, line)
+        self._update_file_progress(line, job_id)
+        self._append_to_file_log(job_id, line)
 
     def _handle_queue_message(self, message: Tuple):
         """Handle a single message from the output queue.
@@ -1012,11 +1540,21 @@ class GenericBatchView(BaseView, ABC):
         msg_type = message[0]
 
         if msg_type in ("stdout", "stderr"):
-            _, line, file_path = message
-            self._handle_stream_message(line, file_path)
+            _, line, job_id = message
+            self._handle_stream_message(line, job_id)
         elif msg_type == "file_update":
-            file_path = message[1]
-            self._update_file_row(file_path)
+            self._dirty_rows.add(message[1])
+        elif msg_type == "job_done":
+            self._on_job_done(message[1])
+        elif msg_type == "media_info":
+            # Probes are keyed by path (the prober is shared across re-adds)
+            _, file_path, media = message
+            file_info = self.file_queue.find(file_path)
+            if file_info:
+                file_info["media"] = media
+                file_info["cost"] = media.cost
+                self._summary_stale = True
+                self._dirty_rows.add(file_info["id"])
         elif msg_type == "batch_done":
             logger.info("Batch processing completed")
             self._finalize_batch_processing()
@@ -1025,8 +1563,59 @@ class GenericBatchView(BaseView, ABC):
             logger.error(f"Batch processing error: {error_msg}")
             self._finalize_batch_processing()
 
+    def _tcl_is_threaded(self) -> bool:
+        """Check whether worker threads may generate Tk events.
+
+        With a threaded Tcl, calls from other threads are marshalled to the
+        UI thread; otherwise the pump falls back to polling.
+        """
+        try:
+            return bool(self.tk.eval("expr {[info exists tcl_platform(threaded)] && $tcl_platform(threaded)}") == "1")
+        except tk.TclError:
+            return False
+
+    def _post(self, message: Tuple):
+        """Post a message to the UI thread, waking the message pump.
+
+        Safe to call from any thread. Only the first message after each pump
+        generates an event, the rest are picked up by the same pump.
+
+        Args:
+            message: Tuple containing (message_type, *args).
+        """
+        self.output_queue.put(message)
+        if not self._can_wake or self._wake_requested.is_set():
+            return
+        self._wake_requested.set()
+        try:
+            self.event_generate(OUTPUT_EVENT, when="tail")
+        except (RuntimeError, tk.TclError) as e:
+            # Tcl is not threaded, or the view is being destroyed. Only the UI
+            # thread may schedule the polling pump, which the summary timer
+            # does on its next tick.
+            logger.debug(f"Could not wake the message pump, polling instead: {e}")
+            self._can_wake = False
+
+    def _schedule_pump(self):
+        """Schedule the message pump, at most every UI_UPDATE_INTERVAL_MS."""
+        if self._pump_id is not None:
+            return
+        since_last = (time.monotonic() - self._last_pump) * 1000
+        delay = max(0, int(UI_UPDATE_INTERVAL_MS - since_last))
+        self._pump_id = self.after(delay, self._check_process_output)
+
     def _check_process_output(self):
-        """Periodically check for process output from queue and update UI."""
+        """Handle posted messages and redraw the rows they changed.
+
+        Updates are coalesced: however many messages arrived for a file since
+        the last pump, its row is redrawn once, and only while the view is
+        visible. The pump only reschedules itself when it cannot be woken by
+        events (polling fallback), and then only while jobs are running or
+        the view is shown.
+        """
+        self._pump_id = None
+        self._last_pump = time.monotonic()
+        self._wake_requested.clear()
         try:
             while True:
                 try:
@@ -1038,22 +1627,51 @@ class GenericBatchView(BaseView, ABC):
             logger.error(f"Error processing output queue: {e}")
             self._finalize_batch_processing()
 
-        self.after(PROGRESS_CHECK_INTERVAL_MS, self._check_process_output)
+        self._flush_row_updates()
+        if self._summary_stale and not self.is_processing:
+            self._schedule_summary_update()
+
+        if not self._can_wake and (self.is_processing or self._visible):
+            self._schedule_pump()
 
-    def _update_file_progress(self, line: str, file_path: str):
+    def _flush_row_updates(self):
+        """Redraw the rows changed since the last redraw, if visible."""
+        if not self._visible:
+            return
+        dirty, self._dirty_rows = self._dirty_rows, set()
+        for job_id in dirty:
+            self._update_file_row(job_id)
+
+    def _schedule_summary_update(self):
+        """Schedule the next batch summary update (and concurrency tuning)."""
+        if self._summary_timer_id is not None:
+            return
+        since_last = time.monotonic() - self._last_summary_update
+        delay = max(0, int((SUMMARY_UPDATE_INTERVAL - since_last) * 1000))
+        self._summary_timer_id = self.after(delay, self._on_summary_timer)
+
+    def _on_summary_timer(self):
+        """Update the batch summary, repeating while processing.
+
+        Also starts the polling fallback of the message pump if a worker
+        thread failed to wake it since it last ran.
+        """
+        self._summary_timer_id = None
+        if not self._can_wake:
+            self._schedule_pump()
+        self._tune_concurrency()
+        self._update_batch_summary()
+        if self.is_processing:
+            self._schedule_summary_update()
+
+    def _update_file_progress(self, line: str, job_id: int):
         """Update progress bar for a specific file from a line of output.
 
         Args:
             line: A line of output that may contain progress information.
-            file_path: Path to the file being processed.
+            job_id: Id of the file being processed.
         """
-        # Find the file info
-        file_info = None
-        for f in self.file_queue:
-            if f["path"] == file_path:
-                file_info = f
-                break
-
+        file_info = self.file_queue.get(job_id)
         if not file_info:
             return
 
@@ -1067,33 +1685,41 @@ class GenericBatchView(BaseView, ABC):
             progress_fraction = parser.get_progress_fraction()
             file_info["progress"] = progress_fraction
 
+            # Count newly processed frames towards the batch throughput
+            frames_done = file_info.get("frames_done", 0)
+            if parser.current > frames_done:
+                self.frames_processed += parser.current - frames_done
+                file_info["frames_done"] = parser.current
+
             # Update progress text values
             file_info["eta"] = parser.format_eta()
             file_info["elapsed"] = parser.format_elapsed()
             file_info["speed"] = parser.format_rate()
 
-            # Queue update for UI thread
-            self.output_queue.put(("file_update", file_path))
+            # Redraw the row on this pump (once, however many lines arrived)
+            self._dirty_rows.add(job_id)
 
-    def _append_to_file_log(self, file_path: str, line: str):
+    def _append_to_file_log(self, job_id: int, line: str):
         """Append a line to the error log for a file.
 
         Args:
-            file_path: Path to the file.
+            job_id: Id of the file.
             line: Line to append to the log.
         """
-        # Find the file info
-        for file_info in self.file_queue:
-            if file_info["path"] == file_path:
-                # Only append if it looks like an error or warning
-                line_lower = line.lower()
-                if any(keyword in line_lower for keyword in ERROR_KEYWORDS):
-                    file_info["error_log"] += line
-                break
+        file_info = self.file_queue.get(job_id)
+        if file_info:
+            # Only append if it looks like an error or warning
+            line_lower = line.lower()
+            if any(keyword in line_lower for keyword in ERROR_KEYWORDS):
+                file_info["error_log"] += line
 
     def _finalize_batch_processing(self):
         """Finalize batch processing and update UI state."""
         self.is_processing = False
+        self.executor = None
+        self.concurrency_tuner = None
+        self._update_concurrency_label()
+        self._update_batch_summary()
         self.stop_requested = False
         self.currently_processing.clear()
         self.active_processes.clear()
@@ -1125,11 +1751,17 @@ class GenericBatchView(BaseView, ABC):
         super().show()
         # Set up drag and drop when view becomes active
         self._setup_drag_drop()
+        # Redraw rows that changed while hidden
+        self._visible = True
+        self._flush_row_updates()
+        if not self._can_wake:
+            self._schedule_pump()
 
     def hide(self) -> None:
         """Hide this view and tear down drag and drop."""
         # Remove drag and drop handlers when view is hidden
         self._teardown_drag_drop()
+        self._visible = False
         super().hide()
 
     def cleanup(self) -> None: